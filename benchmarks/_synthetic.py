@@ -0,0 +1,93 @@
+"""Synthetic DATASUS-like DBF, CSV and JSON files for the benchmarks here."""
+
+import struct
+from pathlib import Path
+
+import numpy as np
+
+#: (name, type, length) -- a SINAN-like mix of codes, dates and free text.
+FIELDS = [
+    ("TP_NOT", "C", 1),
+    ("ID_AGRAVO", "C", 4),
+    ("DT_NOTIFIC", "D", 8),
+    ("SG_UF_NOT", "C", 2),
+    ("ID_MUNICIP", "C", 6),
+    ("DT_SIN_PRI", "D", 8),
+    ("NU_IDADE_N", "N", 4),
+    ("CS_SEXO", "C", 1),
+    ("CS_RACA", "C", 1),
+    ("ID_MN_RESI", "C", 6),
+    ("CLASSI_FIN", "C", 2),
+    ("EVOLUCAO", "C", 1),
+    ("NM_BAIRRO", "C", 60),
+]
+
+
+def write_dbf(path: Path, rows: int, seed: int = 0) -> Path:
+    """Write a dBASE III file with *rows* random records and return it."""
+    rng = np.random.default_rng(seed)
+    record_len = 1 + sum(length for _, _, length in FIELDS)
+    header_len = 32 + 32 * len(FIELDS) + 1
+
+    header = bytearray(32)
+    header[0] = 0x03
+    struct.pack_into("<I", header, 4, rows)
+    struct.pack_into("<H", header, 8, header_len)
+    struct.pack_into("<H", header, 10, record_len)
+    for name, type_, length in FIELDS:
+        desc = bytearray(32)
+        desc[0 : len(name)] = name.encode("ascii")
+        desc[11] = ord(type_)
+        desc[16] = length
+        header += desc
+    header.append(0x0D)
+
+    alphabet = np.frombuffer(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ \xc3\xc7\xd5", "u1")
+    digits = np.frombuffer(b"0123456789", "u1")
+    body = np.full((rows, record_len), ord(" "), dtype=np.uint8)
+    pos = 1
+    for name, type_, length in FIELDS:
+        pool = alphabet if name == "NM_BAIRRO" else digits
+        fill = rng.integers(1, length + 1, size=rows)
+        cells = pool[rng.integers(0, len(pool), size=(rows, length))]
+        mask = np.arange(length) < fill[:, None]
+        body[:, pos : pos + length] = np.where(mask, cells, ord(" "))
+        pos += length
+
+    with open(path, "wb") as fh:
+        fh.write(bytes(header))
+        fh.write(body.tobytes())
+        fh.write(b"\x1a")
+    return Path(path)
+
+
+def write_csv(path: Path, rows: int) -> Path:
+    """Write a latin-1 DadosGov-like CSV with a quoted text column."""
+    rng = np.random.default_rng(0)
+    with open(path, "w", encoding="latin-1") as f:
+        f.write("id;uf;municipio;valor;descricao\n")
+        for start in range(0, rows, 100_000):
+            n = min(100_000, rows - start)
+            values = rng.integers(0, 10**6, n)
+            f.writelines(
+                f'{start + i};SP;355030;{v};"descrição {v}; com separador"\n'
+                for i, v in enumerate(values)
+            )
+    return path
+
+
+def write_jsonl(path: Path, rows: int) -> Path:
+    """Write DEMAS-like JSON Lines records, as the Saude client saves them."""
+    rng = np.random.default_rng(0)
+    with open(path, "w", encoding="utf-8") as f:
+        for start in range(0, rows, 100_000):
+            n = min(100_000, rows - start)
+            values = rng.integers(0, 10**6, n)
+            dates = np.where(values % 7, "null", '"2024-01-01"')
+            f.writelines(
+                f'{{"id": {start + i}, "uf": "SP", "co_municipio": "355030", '
+                f'"qt_doses": {v}, "ds_vacina": "descrição {v}", '
+                f'"dt_aplicacao": {d}}}\n'
+                for i, (v, d) in enumerate(zip(values, dates))
+            )
+    return path
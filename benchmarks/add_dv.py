@@ -0,0 +1,49 @@
+"""Benchmark: vectorized add_dv vs the per-row Python function.
+
+Times the pandas path (``Parquet`` loads) and the DuckDB path
+(``PySUS.read_parquet``): a Python UDF against the SQL macro.
+
+Usage::
+
+    python benchmarks/add_dv.py [rows]
+"""
+
+import sys
+import time
+
+import duckdb
+import numpy as np
+import pandas as pd
+from duckdb import func
+from pysus.api.utils import add_dv, add_dv_macro, add_dv_series
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main(rows: int = 1_000_000) -> None:
+    rng = np.random.default_rng(0)
+    codes = pd.Series(rng.integers(110001, 530011, rows).astype(str))
+    print(f"{rows:,} rows")
+
+    t_apply = timed(lambda s: s.astype(str).apply(add_dv), codes)
+    t_series = timed(add_dv_series, codes)
+    print(f"pandas apply   {t_apply:7.2f}s")
+    print(f"add_dv_series  {t_series:7.2f}s  ({t_apply / t_series:.1f}x)")
+
+    con = duckdb.connect()
+    con.register("codes", pd.DataFrame({"ID_MUNICIP": codes}))
+    con.create_function("dv_udf", add_dv, null_handling=func.SPECIAL)
+    con.execute(add_dv_macro("dv_macro"))
+    query = "SELECT {}(ID_MUNICIP) FROM codes"
+    t_udf = timed(lambda: con.execute(query.format("dv_udf")).fetchall())
+    t_macro = timed(lambda: con.execute(query.format("dv_macro")).fetchall())
+    print(f"duckdb UDF     {t_udf:7.2f}s")
+    print(f"duckdb macro   {t_macro:7.2f}s  ({t_udf / t_macro:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
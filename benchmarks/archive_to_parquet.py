@@ -0,0 +1,81 @@
+"""Benchmark: zipped CSVs to Parquet, extracted first or streamed.
+
+Compares the former ``Zip.to_parquet`` (extract the archive, then convert
+the CSV on disk) with converting the members as they are decompressed,
+one member and four members converted concurrently. Each run takes a
+fresh process, so that its peak memory can be reported.
+
+Usage::
+
+    python benchmarks/archive_to_parquet.py [rows]
+"""
+
+import asyncio
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from _synthetic import write_csv
+from pysus.api.extensions import CSV, Zip
+
+CHUNK = 100_000
+
+
+async def extract_then_convert(archive: Path, out: Path) -> None:
+    zip_file = Zip(path=archive)
+    temp_dir = archive.with_suffix(".tmp_extract")
+    files = await zip_file.extract(target_dir=temp_dir)
+    try:
+        csv = next(f for f in files if isinstance(f, CSV))
+        await csv.to_parquet(out, chunk_size=CHUNK)
+    finally:
+        await zip_file._safe_cleanup(temp_dir)
+
+
+def run(name: str, tmp: Path) -> tuple[float, float]:
+    """Time one run; return its seconds and the peak RSS in MiB."""
+    runs = {
+        "extract + convert": lambda: extract_then_convert(
+            tmp / "single.zip", tmp / "extracted.parquet"
+        ),
+        "streamed": lambda: Zip(path=tmp / "single.zip").to_parquet(
+            tmp / "streamed.parquet", chunk_size=CHUNK
+        ),
+        "4 members, parallel": lambda: Zip(
+            path=tmp / "multi.zip"
+        ).members_to_parquet(tmp / "members", chunk_size=CHUNK),
+    }
+    start = time.perf_counter()
+    asyncio.run(runs[name]())
+    seconds = time.perf_counter() - start
+    return seconds, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main(rows: int = 2_000_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        csv = write_csv(tmp / "bench.csv", rows)
+        single, multi = tmp / "single.zip", tmp / "multi.zip"
+        with zipfile.ZipFile(single, "w", zipfile.ZIP_DEFLATED) as z:
+            z.write(csv, "bench.csv")
+        with zipfile.ZipFile(multi, "w", zipfile.ZIP_DEFLATED) as z:
+            for i in range(4):
+                z.write(csv, f"bench{i}.csv")
+        size = csv.stat().st_size / 2**20
+        csv.unlink()
+        print(f"{rows:,} rows, {size:.0f} MiB latin-1 per member")
+
+        context = multiprocessing.get_context("spawn")
+        for name in ("extract + convert", "streamed", "4 members, parallel"):
+            with ProcessPoolExecutor(1, mp_context=context) as pool:
+                seconds, peak = pool.submit(run, name, tmp).result()
+            print(f"{name:<20} {seconds:7.2f}s  peak RSS {peak:6.0f} MiB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
@@ -0,0 +1,48 @@
+"""Benchmark: CSV row counting, byte scan vs ``csv.reader``.
+
+Usage::
+
+    python benchmarks/csv_rows.py [rows]
+"""
+
+import csv
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from _synthetic import write_csv
+from pysus.data.csv_reader import count_csv_records
+
+
+def csv_reader_count(path: Path) -> int:
+    """The counting loop ``CSV.rows`` used before the byte scan."""
+    count = 0
+    with open(path, "rb") as f:
+        reader = csv.reader(
+            line.decode("latin-1", errors="replace") for line in f
+        )
+        for _ in reader:
+            count += 1
+    return count
+
+
+def timed(fn, *args) -> tuple[float, int]:
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main(rows: int = 5_000_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_csv(Path(tmp) / "bench.csv", rows)
+        print(f"{rows:,} rows, {path.stat().st_size / 2**20:.0f} MiB")
+        t_reader, n_reader = timed(csv_reader_count, path)
+        t_scan, n_scan = timed(count_csv_records, path)
+        assert n_reader == n_scan
+        print(f"csv.reader   {t_reader:7.2f}s")
+        print(f"byte scan    {t_scan:7.2f}s  ({t_reader / t_scan:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000)
@@ -0,0 +1,35 @@
+"""Benchmark: CSV to Parquet with the pyarrow.csv and pandas engines.
+
+Usage::
+
+    python benchmarks/csv_to_parquet.py [rows]
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from _synthetic import write_csv
+from pysus.api.extensions import CSV
+
+
+async def convert(path: Path, engine: str) -> float:
+    out = path.with_name(f"{engine}.parquet")
+    start = time.perf_counter()
+    await CSV(path=path).to_parquet(out, chunk_size=100_000, engine=engine)
+    return time.perf_counter() - start
+
+
+def main(rows: int = 5_000_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_csv(Path(tmp) / "bench.csv", rows)
+        print(f"{rows:,} rows, {path.stat().st_size / 2**20:.0f} MiB latin-1")
+        CSV(path=path).columns  # detect encoding and separator up front
+        for engine in ("pandas", "pyarrow"):
+            print(f"{engine:<8} {asyncio.run(convert(path, engine)):7.2f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000)
@@ -0,0 +1,70 @@
+"""Benchmark: scaling of DBF decoding with the number of worker threads.
+
+Usage::
+
+    python benchmarks/dbf_parallel.py [rows] [max_workers]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+from _synthetic import write_dbf
+from pysus.data.dbf_reader import (
+    iter_dbf_batches,
+    read_dbf_fast,
+    read_dbf_schema,
+)
+
+
+def timed(fn, *args, **kwargs) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def to_parquet(path: Path, out: Path, workers: int) -> None:
+    """Convert *path* to Parquet the way ``DBF.to_parquet`` does."""
+    schema = read_dbf_schema(path).arrow_schema()
+    with pq.ParquetWriter(out, schema) as writer:
+        for batch in iter_dbf_batches(path, workers=workers):
+            writer.write_batch(batch)
+
+
+def main(rows: int = 2_000_000, max_workers: int | None = None) -> None:
+    max_workers = max_workers or os.cpu_count() or 1
+    counts = sorted({1, *(2**i for i in range(1, 8)), max_workers})
+    counts = [w for w in counts if w <= max_workers]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_dbf(Path(tmp) / "bench.dbf", rows)
+        print(f"{rows:,} rows, {os.cpu_count()} CPUs")
+        print(f"{'workers':>7} {'read':>8} {'speedup':>8} {'parquet':>8}")
+
+        ref = None
+        base = None
+        for workers in counts:
+            t_read, df = timed(
+                read_dbf_fast, path, dtype_backend="pyarrow", workers=workers
+            )
+            out = Path(tmp) / "out.parquet"
+            t_pq, _ = timed(to_parquet, path, out, workers)
+            if ref is None:
+                ref, base = df, t_read
+            else:
+                pd.testing.assert_frame_equal(ref, df)
+            print(
+                f"{workers:>7} {t_read:7.2f}s {base / t_read:7.1f}x"
+                f" {t_pq:7.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else None,
+    )
@@ -0,0 +1,59 @@
+"""Benchmark: instantiating and describing a directory of cached files.
+
+Times ``ExtensionFactory.instantiate`` plus ``columns`` and ``rows`` over
+a directory of small Parquet and CSV files three times: sniffing every
+file, in a new process whose memory cache is empty (the detections and
+metadata come from the sidecars), and with the memory cache warm.
+
+Usage::
+
+    python benchmarks/detection_cache.py [files]
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import pandas as pd
+from pysus.api import sidecar
+from pysus.api.extensions import ExtensionFactory
+
+
+async def describe(paths: list[Path]) -> None:
+    for path in paths:
+        file = await ExtensionFactory.instantiate(path)
+        file.columns, file.rows
+
+
+def timed(paths: list[Path]) -> float:
+    start = time.perf_counter()
+    asyncio.run(describe(paths))
+    return time.perf_counter() - start
+
+
+def main(files: int = 10_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        sidecar.SIDECAR_DIR = tmp / "metadata"
+        df = pd.DataFrame({"UF": ["SP", "RJ"], "N": [1, 2]})
+        paths = []
+        for i in range(files):
+            path = tmp / f"{i}.parquet" if i % 2 else tmp / f"{i}.csv"
+            if path.suffix == ".csv":
+                df.to_csv(path, index=False)
+            else:
+                df.to_parquet(path)
+            paths.append(path)
+        print(f"{files:,} files")
+
+        print(f"{'sniffed':<20} {timed(paths):7.2f}s")
+        ExtensionFactory._detection_cache = OrderedDict()
+        print(f"{'from sidecars':<20} {timed(paths):7.2f}s")
+        print(f"{'memory cache warm':<20} {timed(paths):7.2f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
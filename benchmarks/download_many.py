@@ -0,0 +1,112 @@
+"""Benchmark: bulk downloads over simulated high-latency origins.
+
+Downloads a batch of files from a fake FTP origin and a fake DuckLake
+origin, whose transfers each wait a round-trip latency before writing
+their bytes, the way ``_fetch_data`` did (three files at a time) and
+with :meth:`PySUS.download_many` under the default origin limits, then
+once more with every file already downloaded.
+
+Usage::
+
+    python benchmarks/download_many.py [files] [latency_ms]
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from pysus.api.client import PySUS
+
+SIZE = 64 * 1024
+
+
+class FakeOrigin:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def download(self, file, local_path, callback=None) -> None:
+        await asyncio.sleep(self.latency)
+        Path(local_path).write_bytes(b"\0" * SIZE)
+        if callback:
+            callback(SIZE, SIZE)
+
+    async def close(self) -> None:
+        pass
+
+
+def remote_files(count: int) -> list:
+    return [
+        SimpleNamespace(
+            basename=f"F{i:04}.dbc",
+            path=f"/remote/F{i:04}.dbc",
+            size=SIZE,
+            client=SimpleNamespace(name="FTP" if i % 2 else "DuckLake"),
+            dataset=SimpleNamespace(name="BENCH"),
+            group=None,
+            year=None,
+            month=None,
+            state=None,
+        )
+        for i in range(count)
+    ]
+
+
+async def semaphore_3(pysus: PySUS, files: list) -> None:
+    sem = asyncio.Semaphore(3)
+
+    async def throttled(file):
+        async with sem:
+            return await pysus.download(file)
+
+    await asyncio.gather(*map(throttled, files))
+
+
+async def download_many(pysus: PySUS, files: list) -> None:
+    async for _ in pysus.download_many(files):
+        pass
+
+
+async def timed(tmp: Path, files: list, latency: float) -> dict[str, float]:
+    origin = FakeOrigin(latency)
+
+    async def get_client(client_name, token=None):
+        return origin
+
+    async def acquire_ftp():
+        return origin
+
+    times = {}
+    for name, run in (
+        ("semaphore_3", semaphore_3),
+        ("download_many", download_many),
+        ("download_many, cached", download_many),
+    ):
+        db = name.split(",")[0]
+        pysus = PySUS(db_path=tmp / db / "state.db")
+        pysus._get_client = get_client
+        pysus._acquire_ftp = acquire_ftp
+        start = time.perf_counter()
+        await run(pysus, files)
+        times[name] = time.perf_counter() - start
+        await pysus.__aexit__(None, None, None)
+    return times
+
+
+def main(count: int = 300, latency_ms: float = 200) -> None:
+    files = remote_files(count)
+    latency = latency_ms / 1000
+    print(f"{count} files, {latency_ms:.0f} ms per transfer")
+    with tempfile.TemporaryDirectory() as tmp:
+        times = asyncio.run(timed(Path(tmp), files, latency))
+    for name, seconds in times.items():
+        print(f"{name:<22} {seconds:7.2f}s")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 300,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    )
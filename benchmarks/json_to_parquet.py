@@ -0,0 +1,88 @@
+"""Benchmark: JSON Lines and JSON arrays to Parquet.
+
+Compares the former conversion (``json.loads`` per line, a DataFrame per
+chunk) with the ``pyarrow.json`` block reader, for a JSON Lines file and
+the same records as one JSON array, and times the row counts.
+
+Usage::
+
+    python benchmarks/json_to_parquet.py [rows]
+"""
+
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+from _synthetic import write_jsonl
+from pysus.api.extensions import JSON, JSONL
+from pysus.api.parquet import ParquetBatchWriter
+
+CHUNK = 100_000
+
+
+def convert_by_line(path: Path, out: Path) -> None:
+    writer = None
+    rows: list[dict] = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                rows.append(json.loads(line))
+            if len(rows) == CHUNK:
+                table = pa.Table.from_pandas(pd.DataFrame(rows))
+                writer = writer or ParquetBatchWriter(out, table.schema)
+                writer.write_table(table)
+                rows = []
+    if rows:
+        table = pa.Table.from_pandas(pd.DataFrame(rows))
+        writer = writer or ParquetBatchWriter(out, table.schema)
+        writer.write_table(table)
+    writer.close()
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main(rows: int = 2_000_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        jsonl = write_jsonl(Path(tmp) / "bench.jsonl", rows)
+        array = Path(tmp) / "bench.json"
+        with open(jsonl, encoding="utf-8") as src, open(array, "w") as dst:
+            dst.write("[\n" + ",\n".join(line.rstrip() for line in src) + "\n]")
+        print(f"{rows:,} rows, {jsonl.stat().st_size / 2**20:.0f} MiB JSONL")
+
+        def by_line_rows():
+            with open(jsonl, encoding="utf-8") as f:
+                return sum(1 for line in f if line.strip())
+
+        counts = {
+            "rows, by line": by_line_rows,
+            "rows, JSONL.rows": lambda: JSONL(path=jsonl).rows,
+            "rows, JSON.rows": lambda: JSON(path=array).rows,
+        }
+        for name, count in counts.items():
+            print(f"{name:<22} {timed(count):7.2f}s")
+
+        out = Path(tmp) / "out.parquet"
+        t = timed(convert_by_line, jsonl, out)
+        print(f"{'by line + pandas':<22} {t:7.2f}s")
+        for name, cls, path in (
+            ("JSONL", JSONL, jsonl),
+            ("JSON array", JSON, array),
+        ):
+            t = timed(
+                asyncio.run,
+                cls(path=path).to_parquet(out, chunk_size=CHUNK),
+            )
+            print(f"{name + '.to_parquet':<22} {t:7.2f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
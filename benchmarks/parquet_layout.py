@@ -0,0 +1,87 @@
+"""Benchmark: Parquet write profiles -- file size, layout and query latency.
+
+Converts one synthetic DBF with several :class:`ParquetWriteOptions`, and
+with the former layout (one pyarrow-default row group per decoded chunk),
+then times a selective DuckDB query on each file.
+
+Usage::
+
+    python benchmarks/parquet_layout.py [rows]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import duckdb
+import pyarrow.parquet as pq
+from _synthetic import write_dbf
+from pysus.api.parquet import ParquetBatchWriter, ParquetWriteOptions
+from pysus.data.dbf_reader import iter_dbf_batches
+
+CHUNK = 30_000  # rows per decoded batch, as in DBF.to_parquet
+
+PROFILES: dict[str, ParquetWriteOptions | None] = {
+    "per-chunk (old)": None,
+    "default": ParquetWriteOptions(),
+    "snappy": ParquetWriteOptions(compression="snappy"),
+    "zstd-9": ParquetWriteOptions(compression_level=9),
+    "1M-row groups": ParquetWriteOptions(row_group_size=1_000_000),
+    "sorted": ParquetWriteOptions(sort_by="DT_NOTIFIC"),
+}
+
+QUERY = (
+    "SELECT count(*), count(DISTINCT ID_MUNICIP) FROM read_parquet(?) "
+    "WHERE DT_NOTIFIC BETWEEN '2023' AND '2024'"
+)
+
+
+def convert(src: Path, out: Path, options: ParquetWriteOptions | None):
+    batches = iter_dbf_batches(src, batch_size=CHUNK, dictionary=True)
+    if options is None:
+        first = next(batches)
+        with pq.ParquetWriter(out, first.schema) as writer:
+            writer.write_batch(first)
+            for batch in batches:
+                writer.write_batch(batch)
+        return
+    first = next(batches)
+    with ParquetBatchWriter(out, first.schema, options) as writer:
+        writer.write_batch(first)
+        for batch in batches:
+            writer.write_batch(batch)
+
+
+def query_latency(path: Path, repeat: int = 5) -> float:
+    con = duckdb.connect()
+    con.execute(QUERY, [str(path)]).fetchall()  # warm the page cache
+    start = time.perf_counter()
+    for _ in range(repeat):
+        con.execute(QUERY, [str(path)]).fetchall()
+    con.close()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(rows: int = 2_000_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        src = write_dbf(Path(tmp) / "bench.dbf", rows)
+        print(f"{rows:,} rows, {src.stat().st_size / 2**20:.0f} MiB DBF")
+        print(
+            f"{'profile':<16} {'write':>7} {'size MiB':>9} "
+            f"{'groups':>7} {'query ms':>9}"
+        )
+        for name, options in PROFILES.items():
+            out = Path(tmp) / f"{name.replace(' ', '_')}.parquet"
+            start = time.perf_counter()
+            convert(src, out, options)
+            t_write = time.perf_counter() - start
+            groups = pq.ParquetFile(out).metadata.num_row_groups
+            print(
+                f"{name:<16} {t_write:6.2f}s {out.stat().st_size / 2**20:9.1f}"
+                f" {groups:>7} {query_latency(out) * 1000:9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
@@ -0,0 +1,82 @@
+"""Benchmark: PySUS.read_parquet over many files, then a filtered count.
+
+Compares the former implementation (a ``SELECT * ... LIMIT 0`` per file
+for the schemas, the whole result fetched before filtering in pandas)
+with the lazy relation, whose schemas come from the footers and whose
+projection and filter are pushed into the Parquet scan.
+
+Usage::
+
+    python benchmarks/read_parquet.py [files] [rows_per_file]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pandas as pd
+from pysus.api.client import PySUS
+
+
+def former(paths: list[Path]) -> int:
+    schemas = [
+        {
+            (c[0], str(c[1]))
+            for c in duckdb.execute(f"SELECT * FROM '{p}' LIMIT 0").description
+        }
+        for p in paths
+    ]
+    cols = ", ".join(f'"{c[0]}"' for c in sorted(set.intersection(*schemas)))
+    paths_str = ", ".join(f"'{p}'" for p in paths)
+    df = duckdb.execute(f"SELECT {cols} FROM read_parquet([{paths_str}])").df()
+    return int((df["SG_UF"] == "SP").sum())
+
+
+def lazy(pysus: PySUS, paths: list[Path]) -> int:
+    relation = pysus.read_parquet(paths, mode="intersection", add_dv=False)
+    return (
+        relation.filter("SG_UF = 'SP'").aggregate("count(*)").fetchall()[0][0]
+    )
+
+
+def timed(fn, *args) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main(files: int = 200, rows: int = 50_000) -> None:
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        paths = []
+        for i in range(files):
+            path = tmp / f"part{i}.parquet"
+            pd.DataFrame(
+                {
+                    "SG_UF": rng.choice(["SP", "RJ", "MG", "BA"], rows),
+                    "N": rng.integers(0, 1000, rows),
+                    **{f"C{j}": rng.random(rows) for j in range(10)},
+                }
+            ).to_parquet(path)
+            paths.append(path)
+        print(f"{files} files, {rows:,} rows each")
+
+        pysus = PySUS(db_path=tmp / "config.db")
+        t_former, n_former = timed(former, paths)
+        t_cold, n_lazy = timed(lazy, pysus, paths)
+        t_warm, _ = timed(lazy, pysus, paths)
+        assert n_former == n_lazy
+        print(f"{'former':<26} {t_former:7.2f}s")
+        print(f"{'lazy, footers read':<26} {t_cold:7.2f}s")
+        print(f"{'lazy, footers cached':<26} {t_warm:7.2f}s")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 50_000,
+    )
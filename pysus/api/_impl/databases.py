@@ -83,24 +83,19 @@ def _fetch_data(
             if not files:
                 return pd.DataFrame() if as_dataframe else cast(list[str], [])
 
-            sem = asyncio.Semaphore(3)
-
-            async def _throttled_download(f):
-                async with sem:
-                    return await pysus.download(f)
-
-            tasks = [_throttled_download(f) for f in files]
-
-            if show_progress:
-                downloaded_files = await tqdm.gather(
-                    *tasks,
-                    desc=f"Downloading {dataset}",
-                    unit="file",
-                )
-            else:
-                downloaded_files = await asyncio.gather(*tasks)
+            bar = tqdm(
+                total=len(files),
+                desc=f"Downloading {dataset}",
+                unit="file",
+                disable=not show_progress,
+            )
+            downloaded: dict[int, str] = {}
+            with bar:
+                async for remote, local in pysus.download_many(files):
+                    downloaded[id(remote)] = str(local.path)
+                    bar.update()
 
-            paths: list[str] = [str(f.path) for f in downloaded_files]
+            paths: list[str] = [downloaded[id(f)] for f in files]
 
             if as_dataframe:
                 res = pysus.read_parquet(paths, **kwargs).df()
@@ -4,103 +4,169 @@ Manages file downloads, local state tracking, catalog attachment,
 Parquet conversion, and query execution across multiple backends.
 """
 
-import enum
-from collections.abc import Callable
-from datetime import datetime, timezone
+import asyncio
+import itertools
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
 import anyio
-import duckdb
-import pandas as pd
-from duckdb import func
 from pysus import CACHEPATH
 from pysus.api.types import Origin
-from sqlalchemy import DateTime, Enum, Integer, String, create_engine
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
-from sqlalchemy.pool import NullPool
 
+from .conversion import ConversionPool
 from .dadosgov import DadosGovClient
+from .digest import record_sha256
 from .ducklake.client import DuckLake
 from .errors import ConnectionError, DownloadError, FormatError, ValidationError
 from .extensions import Parquet
 from .ftp import FTPClient
 from .models import BaseLocalFile, BaseRemoteFile
+from .parquet import ParquetWriteOptions
+from .relation import ADD_DV_MACRO, ParquetRelation, connect, read_schemas
 from .saude import SaudeClient
+from .sidecar import read_sidecar
+from .state import Base, DownloadStatus, LocalFileState, LocalStateStore  # noqa
 
 if TYPE_CHECKING:  # pragma: no cover
     from duckdb import DuckDBPyConnection
 
 
-class Base(DeclarativeBase):
-    """Base declarative class for SQLAlchemy ORM models."""
+#: Files :meth:`PySUS.download_many` downloads at a time from each origin,
+#: by lowercase client name. The DATASUS FTP server allows few sessions
+#: per address; the DuckLake bucket is served by S3.
+DOWNLOAD_LIMITS: dict[str, int] = {
+    "ftp": 6,
+    "ducklake": 32,
+    "dadosgov": 8,
+}
 
 
-class DownloadStatus(enum.Enum):
-    """Download status values tracked for each local file."""
+#: Partition keys of the ``"hive"`` layout, below ``dataset=<name>``.
+PARTITION_KEYS = ("group", "year", "state", "month")
 
-    PENDING = "pending"
-    DOWNLOADING = "downloading"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    MISSING = "missing"
 
+def _partition_path(
+    root: Path,
+    dataset: str,
+    group: str | None,
+    year: int | None,
+    state: str | None,
+    month: int | None,
+) -> Path:
+    """Return the directory of a partition of the ``"hive"`` layout.
 
-class LocalFileState(Base):
-    """ORM model tracking the state of a downloaded local file."""
+    Missing values are written as ``NULL``, which DuckDB reads back as
+    null, so that every file of a dataset has the same partition keys.
+    """
+    parts = [f"dataset={dataset.upper()}"]
+    for key, value in zip(PARTITION_KEYS, (group, year, state, month)):
+        value = "NULL" if value in (None, "") else str(value)
+        parts.append(f"{key}={value.replace('/', '_')}")
+    return root.joinpath(*parts)
 
-    __tablename__ = "local_file_state"
-    path: Mapped[str] = mapped_column(String, primary_key=True)
-    remote_path: Mapped[str] = mapped_column(String, nullable=False)
-    client_name: Mapped[str] = mapped_column(String, nullable=False)
 
-    year: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    month: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    state: Mapped[str | None] = mapped_column(String, nullable=True)
-    group: Mapped[str | None] = mapped_column(String, nullable=True)
+def _sql_literal(value: object) -> str:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    return "'" + str(value).replace("'", "''") + "'"
 
-    status: Mapped[DownloadStatus] = mapped_column(
-        Enum(DownloadStatus),
-        default=DownloadStatus.PENDING,
-    )
-    sha256: Mapped[str | None] = mapped_column(String, nullable=True)
-    last_synced: Mapped[datetime] = mapped_column(
-        DateTime,
-        default=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
-    )
+
+@dataclass
+class DownloadProgress:
+    """Progress of a :meth:`PySUS.download_many` batch.
+
+    Byte totals start from the sizes of the remote files, and are
+    corrected by the sizes servers report once downloads start.
+    """
+
+    files_done: int = 0
+    files_total: int = 0
+    failed: int = 0
+    bytes_done: int = 0
+    bytes_total: int = 0
+
+
+def _origin(file: BaseRemoteFile) -> str:
+    return file.client.name.lower()
+
+
+def _expected_size(file: BaseRemoteFile) -> int:
+    try:
+        return int(file.size or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _interleave_origins(
+    files: Iterable[BaseRemoteFile],
+) -> list[BaseRemoteFile]:
+    """Return *files* taking one of each origin in turn."""
+    by_origin: dict[str, list[BaseRemoteFile]] = {}
+    for file in files:
+        by_origin.setdefault(_origin(file), []).append(file)
+    rounds = itertools.zip_longest(*by_origin.values())
+    return [file for files in rounds for file in files if file is not None]
 
 
 class PySUS:
     """Central orchestrator for downloading and querying PySUS datasets."""
 
-    def __init__(self, db_path: Path = CACHEPATH / "config.db"):
+    def __init__(
+        self,
+        db_path: Path = CACHEPATH / "config.db",
+        conversion_pool: ConversionPool | None = None,
+        threads: int | None = None,
+        memory_limit: str | None = None,
+        layout: Literal["flat", "hive"] = "flat",
+    ):
         """Initialize the PySUS orchestrator.
 
-        Creates a SQLAlchemy engine backed by DuckDB, initializes the
-        schema, and sets up the session factory.
+        Opens the DuckDB database tracking the downloaded files, which
+        stays open until the instance is exited.
 
         Parameters
         ----------
         db_path : Path, optional
             Path to the DuckDB database file. Defaults to
             ``CACHEPATH / "config.db"``.
+        conversion_pool : ConversionPool, optional
+            Pool of worker processes converting downloads to Parquet,
+            which may be shared with a ``SyncEngine``. By default files
+            are converted in this process.
+        threads : int, optional
+            Threads DuckDB runs :meth:`read_parquet` queries with; all
+            cores by default.
+        memory_limit : str, optional
+            Memory DuckDB may use for :meth:`read_parquet` queries, such
+            as ``"4GB"``; 80% of the RAM by default.
+        layout : {"flat", "hive"}, optional
+            Where :meth:`download_to_parquet` writes Parquet files: next
+            to the download (``"flat"``, the default), or partitioned
+            under :attr:`partition_root` (``"hive"``), where :meth:`scan`
+            reads them.
         """
 
         db_path = Path(db_path)
         db_path.parent.mkdir(parents=True, exist_ok=True)
 
         self.cachepath = db_path.parent
-        self.engine = create_engine(
-            f"duckdb:///{db_path.resolve().as_posix()}",
-            poolclass=NullPool,
-        )
-        Base.metadata.create_all(self.engine)
-        self.Session = sessionmaker(bind=self.engine)
+        self.partition_root = self.cachepath / "parquet"
+        self.layout = layout
+        self._state = LocalStateStore(db_path)
+        self.engine = self._state.engine
+        self.Session = self._state.Session
+        self.conversion_pool = conversion_pool
+        self.threads = threads
+        self.memory_limit = memory_limit
+        self._duckdb: DuckDBPyConnection | None = None
 
         self._ducklake: DuckLake | None = None
         self._ftp: FTPClient | None = None
         self._dadosgov: DadosGovClient | None = None
         self._saude: SaudeClient | None = None
+        self._ftp_idle: list[FTPClient] = []
 
     async def __aenter__(self):
         self._ducklake = DuckLake()
@@ -108,17 +174,19 @@ class PySUS:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Clean up all client connections and dispose of the engine."""
+        """Clean up all client connections and close the state database."""
 
         if self._ducklake:
             await self._ducklake.close()
         if self._ftp:
             await self._ftp.close()
+        while self._ftp_idle:
+            await self._ftp_idle.pop().close()
         if self._dadosgov:
             await self._dadosgov.close()
         if self._saude:
             await self._saude.close()
-        self.engine.dispose()
+        self._state.close()
 
     async def get_ducklake(
         self,
@@ -164,29 +232,12 @@ class PySUS:
 
         from pysus.api.extensions import ExtensionFactory
 
-        client_name = file.client.name.lower()
-        remote_path = file.path
-
-        with self.Session() as session:
-            records = (
-                session.query(LocalFileState)
-                .filter_by(
-                    remote_path=str(remote_path),
-                    client_name=str(client_name),
-                    status=DownloadStatus.COMPLETED,
-                )
-                .all()
-            )
-
-            if not records:
-                return None
-
-            parquet_version = next(
-                (r for r in records if str(r.path).endswith(".parquet")), None
-            )
-            record = parquet_version or records[0]
-
-            return await ExtensionFactory.instantiate(str(record.path))
+        paths = self._state.completed_paths(
+            file.client.name.lower(), str(file.path)
+        )
+        if not paths:
+            return None
+        return await ExtensionFactory.instantiate(paths[0])
 
     def _get_dest_path(self, file: BaseRemoteFile) -> Path:
         """Build the local filesystem path for a given remote file."""
@@ -205,6 +256,18 @@ class PySUS:
 
         return base_dir / file.basename
 
+    def _get_partition_path(self, file: BaseRemoteFile) -> Path:
+        """Build the partitioned Parquet path for a given remote file."""
+
+        return _partition_path(
+            self.partition_root,
+            file.dataset.name,
+            getattr(file.group, "name", None),
+            file.year,
+            file.state,
+            file.month,
+        ) / Path(file.basename).with_suffix(".parquet")
+
     async def _update_state(
         self,
         local_path: Path,
@@ -215,32 +278,21 @@ class PySUS:
         month: int | None = None,
         state: str | None = None,
         group: str | None = None,
+        sha256: str | None = None,
     ):
         """Create or update the LocalFileState record for a file."""
 
-        with self.Session() as session:
-            record = (
-                session.query(LocalFileState)
-                .filter_by(
-                    path=str(local_path),
-                )
-                .first()
-            )
-            if not record:
-                record = LocalFileState(
-                    path=str(local_path),
-                    remote_path=str(remote_path),
-                    client_name=client_name,
-                    year=year,
-                    month=month,
-                    state=state,
-                    group=group,
-                )
-                session.add(record)
-
-            record.status = status
-            record.last_synced = datetime.now(timezone.utc).replace(tzinfo=None)
-            session.commit()
+        self._state.write(
+            local_path,
+            remote_path,
+            client_name,
+            status,
+            year=year,
+            month=month,
+            state=state,
+            group=group,
+            sha256=sha256,
+        )
 
     async def download(
         self,
@@ -278,14 +330,22 @@ class PySUS:
             If the download fails for any reason.
         """
 
+        return await self._download(file, token, callback, timeout)
+
+    async def _download(
+        self,
+        file: BaseRemoteFile,
+        token: str | None = None,
+        callback: Callable | None = None,
+        timeout: float | None = None,
+        client: FTPClient | None = None,
+    ) -> BaseLocalFile:
+        """Download *file*, through *client* instead of the shared one."""
         from pysus.api.extensions import ExtensionFactory
 
-        existing_local = await self.get_local_file(file)
-        if existing_local and existing_local.path.exists():
-            if existing_local.size == file.size:
-                return existing_local
-            await self._delete_record(str(existing_local.path))
-            existing_local.path.unlink(missing_ok=True)
+        existing_local = await self._get_cached(file)
+        if existing_local is not None:
+            return existing_local
 
         client_name = file.client.name.lower()
         remote_path = file.path
@@ -293,69 +353,228 @@ class PySUS:
 
         local_path.parent.mkdir(parents=True, exist_ok=True)
 
-        await self._update_state(
-            local_path,
-            str(remote_path),
-            client_name,
-            DownloadStatus.DOWNLOADING,
-        )
+        # the statuses are committed together, once the transfer is over
+        with self._state.batch():
+            await self._update_state(
+                local_path,
+                str(remote_path),
+                client_name,
+                DownloadStatus.DOWNLOADING,
+            )
 
-        client: DuckLake | FTPClient | DadosGovClient
+            try:
+                if client is None:
+                    client = await self._get_client(client_name, token)
 
-        try:
-            if client_name == "ducklake":
-                client = await self.get_ducklake()
-            elif client_name == "ftp":
-                client = await self.get_ftp()
-            elif client_name == "dadosgov":
-                client = await self.get_dadosgov(token)
-            else:
-                raise ValidationError(
-                    f"No download logic for client: {client_name}",
+                if timeout is not None:
+                    with anyio.fail_after(timeout):
+                        await client.download(file, local_path, callback)
+                else:
+                    await client.download(file, local_path, callback)
+
+                await self._update_state(
+                    local_path=local_path,
+                    remote_path=str(remote_path),
+                    client_name=client_name,
+                    status=DownloadStatus.COMPLETED,
+                    year=file.year,
+                    month=file.month,
+                    state=file.state,
+                    group=getattr(file.group, "name", None),
+                    sha256=read_sidecar(local_path).get("sha256"),
                 )
+                return await ExtensionFactory.instantiate(local_path)
 
-            if timeout is not None:
-                with anyio.fail_after(timeout):
-                    await client.download(file, local_path, callback)
-            else:
-                await client.download(file, local_path, callback)
+            except Exception as e:  # noqa
+                import traceback
 
-            await self._update_state(
-                local_path=local_path,
-                remote_path=str(remote_path),
-                client_name=client_name,
-                status=DownloadStatus.COMPLETED,
-                year=file.year,
-                month=file.month,
-                state=file.state,
-                group=getattr(file.group, "name", None),
-            )
-            return await ExtensionFactory.instantiate(local_path)
+                traceback.print_exc()
 
-        except Exception as e:  # noqa
-            import traceback
+                await self._update_state(
+                    local_path,
+                    str(remote_path),
+                    client_name,
+                    DownloadStatus.FAILED,
+                )
+                local_path.unlink(missing_ok=True)
+                raise DownloadError(
+                    f"Unexpected error downloading {file.basename}: {e}",
+                ) from e
 
-            traceback.print_exc()
+    async def _get_cached(self, file: BaseRemoteFile) -> BaseLocalFile | None:
+        """Return the complete local copy of *file*, dropping a stale one."""
+        existing_local = await self.get_local_file(file)
+        if existing_local and existing_local.path.exists():
+            if existing_local.size == file.size:
+                return existing_local
+            await self._delete_record(str(existing_local.path))
+            existing_local.path.unlink(missing_ok=True)
+        return None
+
+    async def _get_client(
+        self, client_name: str, token: str | None = None
+    ) -> DuckLake | FTPClient | DadosGovClient:
+        """Return the shared client downloading files of *client_name*."""
+        if client_name == "ducklake":
+            return await self.get_ducklake()
+        if client_name == "ftp":
+            return await self.get_ftp()
+        if client_name == "dadosgov":
+            return await self.get_dadosgov(token)
+        raise ValidationError(
+            f"No download logic for client: {client_name}",
+        )
 
-            await self._update_state(
-                local_path,
-                str(remote_path),
-                client_name,
-                DownloadStatus.FAILED,
-            )
-            local_path.unlink(missing_ok=True)
-            raise DownloadError(
-                f"Unexpected error downloading {file.basename}: {e}",
-            ) from e
+    async def download_many(
+        self,
+        files: Iterable[BaseRemoteFile],
+        concurrency: int = 16,
+        per_origin_limits: Mapping[str, int] | None = None,
+        token: str | None = None,
+        callback: Callable[[DownloadProgress], None] | None = None,
+        timeout: float | None = None,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[tuple[BaseRemoteFile, BaseLocalFile | BaseException]]:
+        """Download *files* concurrently, yielding them as they finish.
+
+        At most *concurrency* files are downloaded at a time, and at most
+        the limit of their origin (see :data:`DOWNLOAD_LIMITS`) from each
+        origin. Files are scheduled alternating between origins, so a
+        slow origin doesn't hold back the others. FTP downloads each take
+        a connection of a pool kept open between downloads, and HTTP
+        origins reuse the connections of their client. The state of the
+        downloaded files is committed in batches.
+
+        Parameters
+        ----------
+        files : iterable of BaseRemoteFile
+        concurrency : int
+            Files downloaded at a time, over every origin.
+        per_origin_limits : Mapping[str, int], optional
+            Files downloaded at a time from an origin, by lowercase client
+            name (``"ftp"``, ``"ducklake"``, ``"dadosgov"``); overrides
+            :data:`DOWNLOAD_LIMITS`.
+        token : str, optional
+            Access token for authenticated clients (e.g. DadosGov).
+        callback : callable, optional
+            Called with the :class:`DownloadProgress` of the whole batch
+            as bytes arrive and as each file finishes.
+        timeout : float, optional
+            Maximum seconds for each download.
+        return_exceptions : bool
+            If ``True`` a failed download yields its exception and the
+            others go on; by default the first failure is raised and the
+            pending downloads are cancelled.
+
+        Yields
+        ------
+        tuple[BaseRemoteFile, BaseLocalFile | BaseException]
+            Each remote file and its local file, in completion order.
+        """
+        files = _interleave_origins(files)
+        limits = {**DOWNLOAD_LIMITS, **(per_origin_limits or {})}
+        slots = asyncio.Semaphore(concurrency)
+        origin_slots = {
+            origin: asyncio.Semaphore(limits.get(origin, concurrency))
+            for origin in {_origin(file) for file in files}
+        }
+        progress = DownloadProgress(
+            files_total=len(files),
+            bytes_total=sum(_expected_size(file) for file in files),
+        )
+
+        def notify() -> None:
+            if callback:
+                callback(progress)
+
+        async def fetch(file: BaseRemoteFile) -> BaseLocalFile:
+            origin = _origin(file)
+            expected = _expected_size(file)
+            received = 0
+
+            def report(current: int, total: int) -> None:
+                nonlocal expected, received
+                if total and total != expected:
+                    progress.bytes_total += total - expected
+                    expected = total
+                progress.bytes_done += current - received
+                received = current
+                notify()
+
+            try:
+                async with origin_slots[origin], slots:
+                    # cached files take no connection
+                    local = await self._get_cached(file)
+                    if local is None:
+                        local = await self._fetch_remote(
+                            file, origin, token, report, timeout
+                        )
+            except Exception:
+                progress.bytes_done -= received
+                progress.bytes_total -= expected
+                progress.failed += 1
+                raise
+            else:
+                # a file already cached reports no bytes
+                progress.bytes_done += max(expected - received, 0)
+            finally:
+                progress.files_done += 1
+                notify()
+            return local
+
+        async def run(file: BaseRemoteFile):
+            try:
+                return file, await fetch(file)
+            except Exception as exc:  # noqa: B902
+                return file, exc
+
+        with self._state.batch():
+            tasks = [asyncio.ensure_future(run(file)) for file in files]
+            try:
+                for next_result in asyncio.as_completed(tasks):
+                    file, result = await next_result
+                    if isinstance(result, Exception) and not return_exceptions:
+                        raise result
+                    yield file, result
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch_remote(
+        self,
+        file: BaseRemoteFile,
+        origin: str,
+        token: str | None,
+        callback: Callable,
+        timeout: float | None,
+    ) -> BaseLocalFile:
+        """Download *file*, through a pooled connection for FTP files."""
+        client = None
+        if origin == "ftp":
+            client = await self._acquire_ftp()
+        try:
+            local = await self._download(file, token, callback, timeout, client)
+        except BaseException:
+            if client is not None:
+                await client.close()  # may be broken
+            raise
+        if client is not None:
+            self._ftp_idle.append(client)
+        return local
+
+    async def _acquire_ftp(self) -> FTPClient:
+        """Return an idle pooled FTP connection, or open a new one."""
+        if self._ftp_idle:
+            return self._ftp_idle.pop()
+        client = FTPClient()
+        await client.connect()
+        return client
 
     async def _delete_record(self, path: str):
         """Delete a LocalFileState record from the database."""
 
-        with self.Session() as session:
-            record = session.query(LocalFileState).filter_by(path=path).first()
-            if record:
-                session.delete(record)
-                session.commit()
+        self._state.delete(path)
 
     async def download_to_parquet(
         self,
@@ -364,6 +583,7 @@ class PySUS:
         callback: Callable[[int, int], None] | None = None,
         timeout: float | None = None,
         add_dv: bool = True,
+        write_options: ParquetWriteOptions | None = None,
     ) -> Parquet:
         """Download a file and convert it to Parquet format.
 
@@ -380,6 +600,12 @@ class PySUS:
         add_dv : bool, optional
             Whether to apply the IBGE verification digit on load
             (default True).
+        write_options : ParquetWriteOptions, optional
+            Row groups, compression, statistics and sorting of the
+            Parquet file.
+
+        With a ``conversion_pool`` the conversion runs in one of its
+        worker processes, and *callback* only reports the download.
 
         Returns
         -------
@@ -401,25 +627,43 @@ class PySUS:
 
         if hasattr(local_file, "to_parquet"):
             original_path = local_file.path
-            parquet_file = await local_file.to_parquet(
-                callback=callback,
-            )
+            output_path = None
+            if self.layout == "hive":
+                output_path = self._get_partition_path(file)
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+            if self.conversion_pool is not None:
+                parquet_file = await self.conversion_pool.convert(
+                    original_path,
+                    output_path=output_path,
+                    write_options=write_options,
+                )
+            else:
+                parquet_file = await local_file.to_parquet(
+                    output_path=output_path,
+                    callback=callback,
+                    write_options=write_options,
+                )
             parquet_file.add_dv = add_dv
 
-            await self._update_state(
-                local_path=parquet_file.path,
-                remote_path=str(file.path),
-                client_name=file.client.name.lower(),
-                status=DownloadStatus.COMPLETED,
-                year=file.year,
-                month=file.month,
-                state=file.state,
-                group=getattr(file.group, "name", None),
-            )
+            with self._state.batch():
+                await self._update_state(
+                    local_path=parquet_file.path,
+                    remote_path=str(file.path),
+                    client_name=file.client.name.lower(),
+                    status=DownloadStatus.COMPLETED,
+                    year=file.year,
+                    month=file.month,
+                    state=file.state,
+                    group=getattr(file.group, "name", None),
+                    sha256=read_sidecar(parquet_file.path).get("sha256"),
+                )
 
-            if original_path.exists() and original_path != parquet_file.path:
-                original_path.unlink()
-                await self._delete_record(str(original_path))
+                if (
+                    original_path.exists()
+                    and original_path != parquet_file.path
+                ):
+                    original_path.unlink()
+                    await self._delete_record(str(original_path))
 
             return parquet_file
 
@@ -427,6 +671,73 @@ class PySUS:
             f"{local_file} can't be converted to Parquet",
         )
 
+    def relayout(self, dry_run: bool = False) -> list[tuple[Path, Path]]:
+        """Move the cached Parquet files to the ``"hive"`` layout.
+
+        Parquet files converted with the ``"flat"`` layout, under
+        ``downloads/<client>/<dataset>/``, are moved to their partition
+        under :attr:`partition_root` and their records updated, so that
+        :meth:`scan` reads them. Files missing from the disk are skipped.
+
+        Parameters
+        ----------
+        dry_run : bool, optional
+            Only return the moves, without making them.
+
+        Returns
+        -------
+        list[tuple[Path, Path]]
+            The old and new path of each file moved.
+        """
+
+        downloads = self.cachepath / "downloads"
+        moves = []
+        with self._state.batch():
+            for record in self._state.records():
+                path = Path(record.path)
+                if (
+                    record.status is not DownloadStatus.COMPLETED
+                    or path.suffix != ".parquet"
+                    or not path.is_relative_to(downloads)
+                    or not path.exists()
+                ):
+                    continue
+                parts = path.relative_to(downloads).parts
+                if len(parts) < 3:
+                    continue
+                target = (
+                    _partition_path(
+                        self.partition_root,
+                        parts[1],
+                        record.group,
+                        record.year,
+                        record.state,
+                        record.month,
+                    )
+                    / path.name
+                )
+                moves.append((path, target))
+                if dry_run:
+                    continue
+
+                target.parent.mkdir(parents=True, exist_ok=True)
+                path.replace(target)
+                if record.sha256:
+                    record_sha256(target, record.sha256)
+                self._state.delete(path)
+                self._state.write(
+                    target,
+                    record.remote_path,
+                    record.client_name,
+                    DownloadStatus.COMPLETED,
+                    year=record.year,
+                    month=record.month,
+                    state=record.state,
+                    group=record.group,
+                    sha256=record.sha256,
+                )
+        return moves
+
     def get_local_hierarchy(self):
         """Build a nested dict of cached files grouped by client and dataset.
 
@@ -437,8 +748,7 @@ class PySUS:
             ``{client: {dataset: {group: [files]}}}``.
         """
 
-        with self.Session() as session:
-            records = session.query(LocalFileState).all()
+        records = self._state.records()
 
         hierarchy = {}
         for r in records:
@@ -469,13 +779,7 @@ class PySUS:
     def get_completed_remote_paths(self) -> set[str]:
         """Return remote paths for all successfully downloaded files."""
 
-        with self.Session() as session:
-            records = (
-                session.query(LocalFileState.remote_path)
-                .filter(LocalFileState.status == DownloadStatus.COMPLETED)
-                .all()
-            )
-            return {str(r.remote_path) for r in records}
+        return self._state.completed_remote_paths()
 
     async def query(
         self,
@@ -550,55 +854,59 @@ class PySUS:
         sql: str | None = None,
         mode: Literal["union", "intersection", "strict"] = "union",
         add_dv: bool = True,
-    ) -> "DuckDBPyConnection | pd.DataFrame":
+    ) -> ParquetRelation:
         """Read Parquet files with optional schema handling and SQL filter.
 
+        The result is lazy: columns selected and rows filtered on it are
+        pushed into the Parquet scan, and the files are only read when
+        the result is fetched (e.g. with ``.to_df()``).
+
         Parameters
         ----------
         paths : list of Path
             One or more Parquet file paths to read.
         sql : str, optional
-            Optional SQL filter expression applied to the result.
+            A query reading the files as table ``t``
+            (``"SELECT a FROM t WHERE a > 1"``), or the expressions to
+            select from them (``"a + b AS c"``).
         mode : {"union", "intersection", "strict"}, optional
             Schema resolution mode (default ``"union"``).
         add_dv : bool, optional
             When True, automatically applies the IBGE verification digit to
-            municipality code columns. If matching columns are found, a
-            DataFrame is returned instead of a ``DuckDBPyConnection``.
+            municipality code columns, with a SQL macro that runs inside
+            DuckDB (see :func:`pysus.api.utils.add_dv_macro`).
 
         Returns
         -------
-        DuckDBPyConnection or pd.DataFrame
-            The query result.
+        ParquetRelation
+            The query, run on the connection of this instance (see
+            ``threads`` and ``memory_limit``). Earlier versions returned
+            a ``duckdb.DuckDBPyConnection`` holding the executed query;
+            its ``df()``, ``fetchall()``, ``fetchone()`` and other result
+            methods work the same on the relation, but the files are
+            only read when one of them is called.
 
         Raises
         ------
-        ValueError
-            If no paths are provided, or if the schema mode is ``"strict"``
-            and the files have differing schemas.
+        ValidationError
+            If no paths are provided, if the schema mode is ``"strict"``
+            and the files have differing schemas, or if it is
+            ``"intersection"`` and they have no column in common. Earlier
+            versions returned an empty result for the latter; DuckDB
+            can't represent a result without columns.
         """
 
-        from pysus.api.utils import add_dv as _add_dv_fn
-        from pysus.api.utils import is_geocode_column
-
         if not paths:
             raise ValidationError("No paths provided")
 
-        def get_columns(path: Path) -> set[tuple[str, str]]:
-            """Return the schema of a Parquet file as (name, type) pairs."""
-            result = duckdb.execute(f"SELECT * FROM '{path}' LIMIT 0")
-            return {(col[0], str(col[1])) for col in result.description}
-
-        if len(paths) == 1:
-            query = f"SELECT * FROM '{paths[0]}'"
-        else:
-            paths_str = ", ".join(f"'{p}'" for p in paths)
-            query = f"SELECT * FROM read_parquet([{paths_str}])"
-
-        schemas = [get_columns(p) for p in paths]
-        common_columns = set.intersection(*schemas) if schemas else set()
+        con = self.duckdb_connection
+        files = [str(p) for p in paths]
 
         if mode == "strict":
+            schemas = [
+                {(f.name, str(f.type)) for f in schema}
+                for schema in read_schemas(files)
+            ]
             for i, schema in enumerate(schemas):
                 if schema != schemas[0]:
                     raise ValidationError(
@@ -606,52 +914,135 @@ class PySUS:
                         f"{[c[0] for c in schema]}, "
                         f"expected {[c[0] for c in schemas[0]]}"
                     )
+            relation = con.read_parquet(files)
 
         elif mode == "intersection":
+            common_columns = set.intersection(
+                *(
+                    {(f.name, str(f.type)) for f in schema}
+                    for schema in read_schemas(files)
+                )
+            )
             if not common_columns:
-                return duckdb.execute("SELECT * WHERE 1=0")
+                raise ValidationError("The files have no column in common")
             cols = ", ".join(f'"{c[0]}"' for c in sorted(common_columns))
-            paths_str = ", ".join(f"'{p}'" for p in paths)
-            query = f"SELECT {cols} FROM read_parquet([{paths_str}])"
+            relation = con.read_parquet(files, union_by_name=True).project(cols)
 
         else:
-            paths_str = ", ".join(f"'{p}'" for p in paths)
-            query = (
-                f"SELECT * FROM read_parquet([{paths_str}], union_by_name=True)"
-            )
+            relation = con.read_parquet(files, union_by_name=True)
 
+        result = ParquetRelation(relation)
         if sql:
             if sql.upper().startswith("SELECT"):
-                query = sql.replace("FROM t", f"FROM ({query}) AS t")
+                result = result.sql(sql, alias="t")
             else:
-                query = f"SELECT {sql} FROM ({query}) AS t"
+                result = result.select(sql)
 
-        base = duckdb.execute(query)
+        return self._with_dv(result) if add_dv else result
 
-        if not add_dv:
-            return base
+    def scan(
+        self,
+        dataset: str,
+        add_dv: bool = True,
+        **filters: object,
+    ) -> ParquetRelation:
+        """Query the partitioned Parquet files of a dataset.
+
+        Reads the files :meth:`download_to_parquet` wrote with the
+        ``"hive"`` layout. Filters on the partition keys
+        (:data:`PARTITION_KEYS`) compare the directory values as text,
+        regardless of case, so that DuckDB only scans the matching
+        files; filters on other columns are pushed into the scan of
+        those. The footers of every file of *dataset* are read to unite
+        their schemas.
+
+        Parameters
+        ----------
+        dataset : str
+            Dataset name, such as ``"SINAN"``.
+        add_dv : bool, optional
+            Whether to apply the IBGE verification digit to municipality
+            code columns (default True).
+        **filters
+            Values to keep by column, a value or an iterable of values,
+            such as ``group="DENG", year=range(2015, 2024),
+            state=["RJ", "SP"]``. ``None`` keeps every value.
 
-        geocode_cols = [
-            col[0] for col in base.description if is_geocode_column(col[0])
-        ]
+        Returns
+        -------
+        ParquetRelation
+            The lazy query, with the partition keys as columns. It has
+            no rows if no partition matches the filters.
+
+        Raises
+        ------
+        ValidationError
+            If *dataset* has no partitioned file.
+        """
+
+        root = self.partition_root / f"dataset={dataset.upper()}"
+        if not any(root.glob("**/*.parquet")):
+            raise ValidationError(f"No partitioned files for {dataset}")
+
+        result = ParquetRelation(
+            self.duckdb_connection.read_parquet(
+                str(root / "**" / "*.parquet"),
+                hive_partitioning=True,
+                union_by_name=True,
+            )
+        )
+        for column, value in filters.items():
+            if value is None:
+                continue
+            values = [value] if isinstance(value, (str, int)) else list(value)
+            if not values:
+                result = result.filter("false")
+                continue
+            if column in PARTITION_KEYS:
+                literals = ", ".join(
+                    _sql_literal(str(v).upper()) for v in values
+                )
+                # as text, since a key that is always NULL is read as one
+                condition = (
+                    f'upper(CAST("{column}" AS VARCHAR)) IN ({literals})'
+                )
+            else:
+                literals = ", ".join(_sql_literal(v) for v in values)
+                condition = f'"{column}" IN ({literals})'
+            result = result.filter(condition)
+
+        return self._with_dv(result) if add_dv else result
+
+    @staticmethod
+    def _with_dv(result: ParquetRelation) -> ParquetRelation:
+        """Apply the IBGE verification digit to the geocode columns."""
+
+        from pysus.api.utils import is_geocode_column
+
+        geocode_cols = [c for c in result.columns if is_geocode_column(c)]
         if not geocode_cols:
-            return base
+            return result
+
+        return result.select(
+            *(
+                (
+                    f'{ADD_DV_MACRO}("{c}") AS "{c}"'
+                    if c in geocode_cols
+                    else f'"{c}"'
+                )
+                for c in result.columns
+            )
+        )
 
-        try:
-            duckdb.create_function(
-                "__pysus_add_dv",
-                _add_dv_fn,
-                null_handling=func.SPECIAL,
-            )  # type: ignore
-        except duckdb.NotImplementedException:
-            pass
-        selects = [
-            (
-                f'__pysus_add_dv("{c[0]}") AS "{c[0]}"'
-                if c[0] in geocode_cols
-                else f'"{c[0]}"'
+    @property
+    def duckdb_connection(self) -> "DuckDBPyConnection":
+        """Return the DuckDB connection :meth:`read_parquet` queries with.
+
+        Opened on first use with the ``threads`` and ``memory_limit`` of
+        this instance, and kept for its lifetime.
+        """
+        if self._duckdb is None:
+            self._duckdb = connect(
+                threads=self.threads, memory_limit=self.memory_limit
             )
-            for c in base.description
-        ]
-        query = f"SELECT {', '.join(selects)} FROM ({query}) AS _t"
-        return duckdb.execute(query)
+        return self._duckdb
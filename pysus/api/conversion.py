@@ -0,0 +1,264 @@
+"""Convert many local files to Parquet in a pool of worker processes.
+
+``to_parquet`` keeps one conversion off the event loop, but decoding holds
+the GIL for much of its work, so converting a batch of files (27 states x
+12 months of SIH, say) from one process is bound to a single core. A
+:class:`ConversionPool` runs each conversion in its own process and hands
+back :class:`~pysus.api.extensions.Parquet` handles as they finish.
+"""
+
+import asyncio
+import multiprocessing
+import os
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Literal
+
+from .errors import FormatError
+from .extensions import ExtensionFactory, Parquet
+
+#: Rough peak memory of a conversion per byte of input, by suffix.
+#: Compressed DBC expands several times; CSV and JSON are parsed by Arrow,
+#: which holds a block of raw text next to its parsed columns.
+_MEMORY_PER_BYTE: dict[str, float] = {
+    ".dbc": 4.0,
+    ".dbf": 1.0,
+    ".csv": 2.0,
+    ".json": 4.0,
+    ".jsonl": 3.0,
+}
+
+#: Lower bound of a conversion's memory estimate (buffers, interpreter).
+_MIN_JOB_MEMORY = 64 * 1024**2
+
+
+def _available_memory() -> int | None:
+    """Return the physical memory currently available, if known."""
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _convert_in_process(
+    path: str, output_path: str | None, options: dict[str, Any]
+) -> str:
+    """Worker entry point: convert *path* and return the Parquet path."""
+    return asyncio.run(_convert(Path(path), output_path, options))
+
+
+async def _convert(
+    path: Path, output_path: str | None, options: dict[str, Any]
+) -> str:
+    file = await ExtensionFactory.instantiate(path)
+    if isinstance(file, Parquet):
+        return str(file.path)
+    if not hasattr(file, "to_parquet"):
+        raise FormatError(f"{file} can't be converted to Parquet")
+    parquet = await file.to_parquet(output_path=output_path, **options)
+    return str(parquet.path)
+
+
+class ConversionPool:
+    """Convert local DBC/DBF/CSV/JSON(L) files to Parquet in parallel.
+
+    Each file is converted by its file class's ``to_parquet`` in a worker
+    process, so conversions use every core. Admission is memory-aware:
+    a conversion starts only once a worker is free and its estimated
+    memory (see :meth:`estimate_memory`) fits in *memory_limit* next to
+    the running ones; a file estimated above the limit runs alone.
+
+    A pool can be shared by any number of coroutines, e.g. by a
+    :class:`~pysus.api.client.PySUS` client and the
+    :class:`~pysus.management.sync.SyncEngine` using it. Worker processes
+    start on first use and stop on :meth:`close` or on leaving an
+    ``async with`` block.
+
+    Parameters
+    ----------
+    workers : int, optional
+        Number of worker processes (default: every CPU).
+    memory_limit : int, "auto" or None, optional
+        Bytes the running conversions may use together. ``"auto"`` (the
+        default) is half of the memory available when the pool is
+        created, or no limit when that is unknown; ``None`` disables the
+        check, so that only *workers* limits the conversions.
+    mp_context : str
+        Multiprocessing start method of the workers. ``"spawn"`` (the
+        default) is safe in processes running threads, as the event loop's
+        worker threads are.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        memory_limit: int | Literal["auto"] | None = "auto",
+        mp_context: str = "spawn",
+    ):
+        if workers is not None and workers < 1:
+            raise ValueError(
+                f"workers must be a positive integer, not {workers}"
+            )
+        self.workers = workers or os.cpu_count() or 1
+        if memory_limit == "auto":
+            available = _available_memory()
+            memory_limit = available // 2 if available else None
+        self.memory_limit = memory_limit
+        self.mp_context = mp_context
+        self._executor: ProcessPoolExecutor | None = None
+        self._admission = asyncio.Condition()
+        self._running = 0
+        self._reserved = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"ConversionPool(workers={self.workers}, "
+            f"memory_limit={self.memory_limit})"
+        )
+
+    async def __aenter__(self) -> "ConversionPool":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the worker processes once running conversions finish."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def estimate_memory(self, path: Path) -> int:
+        """Return the estimated peak memory of converting *path*, in bytes.
+
+        Based on the file size and :data:`_MEMORY_PER_BYTE`; override to
+        plug in a better model.
+        """
+        factor = _MEMORY_PER_BYTE.get(path.suffix.lower(), 2.0)
+        return max(_MIN_JOB_MEMORY, int(path.stat().st_size * factor))
+
+    async def convert(
+        self,
+        path: str | Path,
+        output_path: str | Path | None = None,
+        **options: Any,
+    ) -> Parquet:
+        """Convert *path* to Parquet in a worker process.
+
+        Parameters
+        ----------
+        path : str or Path
+            The local file to convert.
+        output_path : str or Path, optional
+            Where to write the Parquet file; defaults to the file class's
+            choice, next to *path*.
+        **options
+            Passed to the file class's ``to_parquet`` (``chunk_size``,
+            ``typed``, ``dictionary``...). Progress callbacks are not
+            supported across processes.
+
+        Returns
+        -------
+        Parquet
+        """
+        if "callback" in options:
+            raise ValueError("Progress callbacks cannot cross processes")
+        path = Path(path).expanduser().resolve()
+        cost = self.estimate_memory(path)
+        if self.memory_limit is not None:
+            cost = min(cost, self.memory_limit)
+
+        await self._admit(cost)
+        try:
+            future = self._get_executor().submit(
+                _convert_in_process,
+                str(path),
+                None if output_path is None else str(output_path),
+                options,
+            )
+            out = await asyncio.wrap_future(future)
+        finally:
+            await self._release(cost)
+
+        file = await ExtensionFactory.instantiate(out)
+        if not isinstance(file, Parquet):
+            raise FormatError(f"{out} is not a Parquet file")
+        return file
+
+    async def convert_many(
+        self,
+        paths: Iterable[str | Path],
+        return_exceptions: bool = False,
+        callback: Callable[[int, int], None] | None = None,
+        **options: Any,
+    ) -> AsyncIterator[Parquet | BaseException]:
+        """Convert *paths* concurrently, yielding results as they finish.
+
+        Parameters
+        ----------
+        paths : iterable of str or Path
+        return_exceptions : bool
+            If ``True`` a failed conversion yields its exception and the
+            others go on; by default the first failure is raised and the
+            pending conversions are cancelled.
+        callback : callable, optional
+            Called as ``callback(done, total)`` after each file.
+        **options
+            See :meth:`convert`.
+
+        Yields
+        ------
+        Parquet or BaseException
+            In completion order, not in the order of *paths*.
+        """
+        tasks = [
+            asyncio.ensure_future(self.convert(path, **options))
+            for path in paths
+        ]
+        try:
+            for done, next_result in enumerate(
+                asyncio.as_completed(tasks), start=1
+            ):
+                try:
+                    result = await next_result
+                except Exception as exc:  # noqa: B902
+                    if not return_exceptions:
+                        raise
+                    result = exc
+                if callback:
+                    callback(done, len(tasks))
+                yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                self.workers,
+                mp_context=multiprocessing.get_context(self.mp_context),
+            )
+        return self._executor
+
+    async def _admit(self, cost: int) -> None:
+        """Wait for a free worker and room for *cost* bytes, reserve them."""
+
+        def fits() -> bool:
+            if self._running >= self.workers:
+                return False
+            if self.memory_limit is None or not self._running:
+                return True
+            return self._reserved + cost <= self.memory_limit
+
+        async with self._admission:
+            await self._admission.wait_for(fits)
+            self._running += 1
+            self._reserved += cost
+
+    async def _release(self, cost: int) -> None:
+        async with self._admission:
+            self._running -= 1
+            self._reserved -= cost
+            self._admission.notify_all()
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Annotated, Any, Optional
 import httpx
 from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, PrivateAttr
 from pysus import __version__
+from pysus.api.digest import HashingWriter, record_sha256
 from pysus.api.errors import AuthenticationError, ConnectionError
 from pysus.api.models import BaseRemoteClient, BaseRemoteFile
 from pysus.api.types import DADOSGOV
@@ -288,12 +289,13 @@ class DadosGov(BaseRemoteClient):
             response.raise_for_status()
             total = int(response.headers.get("Content-Length", 0))
             downloaded = 0
-            with open(output, "wb") as f:
+            with HashingWriter(open(output, "wb")) as f:
                 async for chunk in response.aiter_bytes():
                     f.write(chunk)
                     downloaded += len(chunk)
                     if callback:
                         callback(downloaded, total)
+        record_sha256(output, f.hexdigest())
         return output
 
 
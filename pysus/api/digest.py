@@ -0,0 +1,69 @@
+"""SHA-256 digests of local files, computed as their bytes are written.
+
+Downloads and Parquet conversions write through a :class:`HashingWriter`
+and keep the digest in the file's sidecar metadata (see
+:mod:`pysus.api.sidecar`), so that verifying, cataloging or uploading the
+file doesn't read it again. The digest is dropped with the rest of the
+sidecar when the file changes.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from .sidecar import read_sidecar, update_sidecar
+
+#: Bytes read at a time when a file has to be hashed from the disk.
+CHUNK_SIZE = 1024 * 1024
+
+
+class HashingWriter:
+    """Wrap a binary file, hashing the bytes written to it.
+
+    Other attributes are those of the wrapped file.
+
+    Parameters
+    ----------
+    file : BinaryIO
+        A file open for writing, from its start.
+    """
+
+    def __init__(self, file: BinaryIO):
+        self.file = file
+        self._hash = hashlib.sha256()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.file, name)
+
+    def __enter__(self) -> "HashingWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.file.close()
+
+    def write(self, data: bytes) -> int:
+        self._hash.update(data)
+        return self.file.write(data)
+
+    def hexdigest(self) -> str:
+        """Return the digest of the bytes written so far."""
+        return self._hash.hexdigest()
+
+
+def record_sha256(path: str | Path, digest: str) -> None:
+    """Store the *digest* of *path*, once the file is complete."""
+    update_sidecar(path, sha256=digest)
+
+
+def sha256_of(path: str | Path) -> str:
+    """Return the SHA-256 of *path*, reading the file only if unrecorded."""
+    cached = read_sidecar(path).get("sha256")
+    if cached:
+        return cached
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    result = digest.hexdigest()
+    record_sha256(path, result)
+    return result
@@ -8,6 +8,7 @@ import asyncio
 from collections.abc import Callable
 from pathlib import Path
 
+import httpx
 from anyio import to_thread
 from pydantic import Field, PrivateAttr, SecretStr
 from pysus.api.errors import AuthenticationError, ValidationError
@@ -21,7 +22,7 @@ from .catalog.adapters import (
     DuckLakeCredentials,
 )
 from .catalog.orm.default import Dataset
-from .functional import download_http
+from .functional import download_http, http_client
 from .models import DuckDataset, File
 
 
@@ -31,6 +32,7 @@ class DuckLake(BaseRemoteClient):
     _datasets: list[DuckDataset] = PrivateAttr(default_factory=list)
     _catalog_adap: CatalogAdapter = PrivateAttr()
     _columns_adap: ColumnsAdapter = PrivateAttr()
+    _http: httpx.AsyncClient | None = PrivateAttr(default=None)
 
     def __init__(
         self,
@@ -181,6 +183,10 @@ class DuckLake(BaseRemoteClient):
         await self._catalog_adap.close(update=should_update)
         await self._columns_adap.close(update=should_update)
 
+        http, self._http = self._http, None
+        if http is not None:
+            await http.aclose()
+
     async def flush_catalogs(self, update: bool = True) -> None:
         """Upload dirty catalogs (if *update*) and reopen the adapters.
 
@@ -203,10 +209,14 @@ class DuckLake(BaseRemoteClient):
         if not isinstance(file, File):
             raise ValidationError("DuckLake File was not properly instantiated")
 
+        if self._http is None:
+            # shared by every download, so that they reuse connections
+            self._http = http_client()
         await download_http(
             remote_path=file.record.path,
             local_path=output,
             callback=callback,
+            client=self._http,
         )
         return output
 
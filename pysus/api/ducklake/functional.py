@@ -7,6 +7,7 @@ from anyio import sleep, to_thread
 from botocore import UNSIGNED
 from botocore.config import Config
 from pysus.api import types
+from pysus.api.digest import HashingWriter, record_sha256
 
 ALIAS_META_HEADER = "x-amz-meta-pysus-alias"
 MAX_ALIAS_HOPS = 5
@@ -38,47 +39,76 @@ async def _resolve_alias(url: str, client: httpx.AsyncClient) -> str:
     raise RuntimeError(f"Too many alias hops resolving {url}")
 
 
+#: Connections an HTTP client of :func:`http_client` keeps open for reuse.
+HTTP_KEEPALIVE = 32
+
+
+def http_client(
+    max_connections: int | None = 100,
+    max_keepalive: int = HTTP_KEEPALIVE,
+) -> httpx.AsyncClient:
+    """Return an HTTP client for the bucket, to share between downloads.
+
+    Connections are kept alive between requests, so downloading many
+    files through one client saves a TCP and TLS handshake per file.
+    """
+    return httpx.AsyncClient(
+        headers={
+            "User-Agent": (
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/120.0.0.0 Safari/537.36"
+            ),
+            "Referer": "https://github.com/AlertaDengue/PySUS",
+        },
+        follow_redirects=True,
+        verify=False,
+        limits=httpx.Limits(
+            max_keepalive_connections=max_keepalive,
+            max_connections=max_connections,
+        ),
+        timeout=httpx.Timeout(15.0, read=60.0, write=20.0, connect=15.0),
+    )
+
+
 async def download_http(
     remote_path: str,
     local_path: Path,
     callback: Callable[[int, int], None] | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> None:
+    """Download *remote_path* from the bucket to *local_path* over HTTPS.
+
+    Retries on connection and HTTP errors. Pass a *client* (see
+    :func:`http_client`) to reuse its connections; by default a client
+    is opened for the download.
+    """
     remote_path = str(remote_path).replace("\\", "/")
     url = f"https://{types.S3_ENDPOINT}/{types.S3_BUCKET}/{remote_path}"
     max_retries = 5
 
-    timeout = httpx.Timeout(15.0, read=60.0, write=20.0, connect=15.0)
-    limits = httpx.Limits(max_keepalive_connections=5, max_connections=10)
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Referer": "https://github.com/AlertaDengue/PySUS",
-    }
+    async def _fetch(client: httpx.AsyncClient) -> None:
+        target = await _resolve_alias(url, client)
+        async with client.stream("GET", target) as r:
+            r.raise_for_status()
+            total = int(r.headers.get("Content-Length", 0))
+            downloaded = 0
+
+            with HashingWriter(open(local_path, "wb")) as f:
+                async for chunk in r.aiter_bytes(chunk_size=64 * 1024):
+                    await to_thread.run_sync(f.write, chunk)
+                    downloaded += len(chunk)
+                    if callback:
+                        callback(downloaded, total)
+            record_sha256(local_path, f.hexdigest())
 
     for attempt in range(max_retries):
         try:
-            async with httpx.AsyncClient(
-                headers=headers,
-                follow_redirects=True,
-                verify=False,
-                limits=limits,
-                timeout=timeout,
-            ) as client:
-                url = await _resolve_alias(url, client)
-                async with client.stream("GET", url) as r:
-                    r.raise_for_status()
-                    total = int(r.headers.get("Content-Length", 0))
-                    downloaded = 0
-
-                    with open(local_path, "wb") as f:
-                        async for chunk in r.aiter_bytes(chunk_size=64 * 1024):
-                            await to_thread.run_sync(f.write, chunk)
-                            downloaded += len(chunk)
-                            if callback:
-                                callback(downloaded, total)
+            if client is not None:
+                await _fetch(client)
+            else:
+                async with http_client(max_connections=10) as own:
+                    await _fetch(own)
             return
         except (
             OSError,
@@ -4,7 +4,6 @@ Wraps catalog ORM records into BaseRemoteFile, BaseRemoteDataset,
 and BaseRemoteGroup interfaces used by the rest of PySUS.
 """
 
-import hashlib
 from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
@@ -13,6 +12,7 @@ from typing import TYPE_CHECKING, Any, ClassVar, Optional, Union
 from anyio import to_thread
 from pydantic import Field, PrivateAttr
 from pysus import CACHEPATH
+from pysus.api.digest import sha256_of
 from pysus.api.models import BaseRemoteDataset, BaseRemoteFile, BaseRemoteGroup
 from sqlalchemy import or_, orm, select
 
@@ -89,14 +89,7 @@ class File(BaseRemoteFile):
         if not self.sha256:
             return True
 
-        def _calculate():
-            sha256_hash = hashlib.sha256()
-            with open(path, "rb") as f:
-                for byte_block in iter(lambda: f.read(8192), b""):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
-
-        actual_hash = await to_thread.run_sync(_calculate)
+        actual_hash = await to_thread.run_sync(sha256_of, path)
         return actual_hash == self.sha256
 
 
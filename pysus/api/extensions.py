@@ -1,21 +1,37 @@
 """Map file extensions and MIME types to their handler classes."""
 
 import asyncio
-import csv
+import base64
+import codecs
 import gzip
+import io
 import json
+import os
 import shutil
 import tarfile
+import tempfile
 import zipfile
-from collections.abc import AsyncGenerator, Callable, Iterator
-from datetime import datetime
-from pathlib import Path
+from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import (
+    AsyncGenerator,
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+)
+from functools import partial
+from pathlib import Path, PurePosixPath
+from typing import Any, BinaryIO, ClassVar, Literal
 
-import chardet
+import anyio
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
-from anyio import to_thread
+from anyio import from_thread, to_thread
 from dbfread import DBF as DBFReader
 from pydantic import Field, PrivateAttr
 from pyreaddbc import dbc2dbf
@@ -23,11 +39,39 @@ from pysus import CACHEPATH
 from pysus.api.errors import ConversionError, FormatError
 from pysus.api.metadata.models import Column
 from pysus.api.models import BaseCompressedFile, BaseLocalFile, BaseTabularFile
+from pysus.api.parquet import ParquetBatchWriter, ParquetWriteOptions
+from pysus.api.sidecar import read_sidecar, update_sidecar
+from pysus.data.csv_reader import (
+    SAMPLE_SIZE,
+    count_csv_records,
+    csv_arrow_options,
+    detect_delimiter,
+    detect_encoding,
+    iter_csv_batches,
+    open_csv_source,
+    read_csv_header,
+    sniff_csv,
+)
+from pysus.data.dbc_reader import STREAMING_SUPPORTED as DBC_STREAMING_SUPPORTED
+from pysus.data.dbc_reader import iter_dbc_batches, read_dbc_schema
 from pysus.data.dbf_reader import (
+    DBFStreamReader,
+    iter_dbf_batches,
     read_dbf_fast,
     read_dbf_schema,
     stream_dbf_fast,
 )
+from pysus.data.json_reader import (
+    count_json_records,
+    count_jsonl_records,
+    iter_json_array_blocks,
+    iter_json_batches,
+    iter_json_records,
+    iter_json_text_batches,
+    iter_jsonl_batches,
+    iter_jsonl_records,
+)
+from pysus.data.sources import peekable, read_sample
 
 from .types import FileType
 
@@ -66,6 +110,119 @@ def _map_dtype(raw: str) -> str:
     return "VARCHAR"
 
 
+#: Progress reports a conversion thread may queue before it waits for the
+#: event loop to catch up with its callback.
+_PROGRESS_QUEUE_SIZE = 16
+
+
+#: Row filter: a ``pyarrow.compute`` expression or DNF tuples, as accepted
+#: by ``pyarrow.parquet.read_table``.
+Filters = pc.Expression | list[tuple] | list[list[tuple]]
+
+
+def _filter_expression(filters: Filters | None) -> pc.Expression | None:
+    """Return *filters* as a ``pyarrow.compute`` expression."""
+    if filters is None or isinstance(filters, pc.Expression):
+        return filters
+    return pq.filters_to_expression(filters)
+
+
+async def _run_conversion(
+    convert: Callable[[Callable[[int], None] | None], None],
+    total_rows: int,
+    callback: Callable[[int, int], None] | None = None,
+) -> None:
+    """Run the blocking *convert* in a worker thread.
+
+    The whole pipeline (reading, decoding, Arrow conversion and Parquet
+    writing) runs off the event loop. *convert* is given a
+    ``report(processed)`` function, or ``None`` without *callback*, to call
+    from the thread. Reports travel through a bounded queue and
+    *callback* runs on the event loop, so it needs no locking; a thread
+    more than :data:`_PROGRESS_QUEUE_SIZE` reports ahead waits for it.
+    If *callback* raises, the conversion stops at its next report.
+    """
+    if callback is None:
+        await to_thread.run_sync(convert, None)
+        return
+
+    send, receive = anyio.create_memory_object_stream(_PROGRESS_QUEUE_SIZE)
+
+    def report(processed: int) -> None:
+        from_thread.run(send.send, processed)
+
+    def run() -> None:
+        try:
+            convert(report)
+        finally:
+            from_thread.run_sync(send.close)
+
+    worker = asyncio.ensure_future(to_thread.run_sync(run))
+    try:
+        with receive:
+            async for processed in receive:
+                callback(processed, total_rows)
+    except BaseException:
+        # The receiving end is closed, so the thread stops at its next
+        # report; wait for it so no conversion outlives the call.
+        await asyncio.wait([worker])
+        if not worker.cancelled():
+            worker.exception()  # the error above supersedes it
+        raise
+    await worker
+
+
+def _write_parquet(
+    out: Path,
+    schema: pa.Schema,
+    batches: Iterable[pa.RecordBatch],
+    options: ParquetWriteOptions | None = None,
+    report: Callable[[int], None] | None = None,
+) -> None:
+    """Write Arrow *batches* to a Parquet file at *out*, blocking.
+
+    The file is only created once the first batch is ready, with that
+    batch's schema (which may dictionary-encode columns *schema* leaves
+    plain), or with *schema* alone when there are no batches, and laid
+    out following *options*. *report* gets the running row count after
+    each batch.
+    """
+    processed = 0
+    writer = None
+    try:
+        for batch in batches:
+            if writer is None:
+                writer = ParquetBatchWriter(out, batch.schema, options)
+            writer.write_batch(batch)
+            processed += batch.num_rows
+
+            if report:
+                report(processed)
+
+        if writer is None:
+            writer = ParquetBatchWriter(out, schema, options)
+    finally:
+        close = getattr(batches, "close", None)
+        if close is not None:
+            close()
+        if writer:
+            writer.close()
+
+
+async def _iterate_in_thread(items: Iterator) -> AsyncGenerator:
+    """Yield from a blocking iterator, producing each item in a thread."""
+    try:
+        while True:
+            item = await to_thread.run_sync(next, items, None)
+            if item is None:
+                break
+            yield item
+    finally:
+        close = getattr(items, "close", None)
+        if close is not None:
+            await to_thread.run_sync(close)
+
+
 class File(BaseLocalFile):
     """Represents a generic local file with no special handling."""
 
@@ -138,93 +295,98 @@ class CSV(BaseTabularFile):
 
         if self._columns_cache is not None:
             return self._columns_cache
-        if self._encoding is not None:
-            enc = self._encoding
-        else:
-            with open(self.path, "rb") as f:
-                raw = f.read(1024 * 300)
-            raw_enc = chardet.detect(raw)["encoding"]
-            enc = (
-                "iso-8859-1"
-                if raw_enc is None or raw_enc.lower() == "ascii"
-                else raw_enc
-            )
-            self._encoding = enc
-        if self._sep is not None:
-            sep = self._sep
-        else:
-            try:
-                with open(self.path, encoding=enc) as f:
-                    sample = f.read(1024 * 10)
-                    dialect = csv.Sniffer().sniff(sample)
-                    sep = dialect.delimiter
-            except ValueError:
-                sep = ","
-            self._sep = sep
+        cached = self._cached("columns")
+        if cached is not None:
+            self._columns_cache = [Column.from_dict(c) for c in cached]
+            return self._columns_cache
+        enc = self._detect_encoding()
+        sep = self._detect_sep()
         df = pd.read_csv(self.path, sep=sep, nrows=0, encoding=enc)
         result = [
             Column.from_schema(name=col, dtype=_map_dtype(str(dt)))
             for col, dt in zip(df.columns, df.dtypes)
         ]
         self._columns_cache = result
+        self._cache(columns=[c.to_dict() for c in result])
         return result
 
     @property
     def rows(self) -> int:
-        """Return the number of data rows in the file."""
+        """Return the number of data rows in the file.
+
+        Counted by scanning the raw bytes for line feeds outside quoted
+        fields, and cached in the file's sidecar metadata.
+        """
         if self._rows_cache is not None:
             return self._rows_cache
-        count = 0
-        with open(self.path, "rb") as f:
-            reader = csv.reader(
-                line.decode("latin-1", errors="replace") for line in f
-            )
-            for _ in reader:
-                count += 1
-        self._rows_cache = max(0, count - 1)
+        rows = self._cached("rows")
+        if rows is None:
+            rows = max(0, count_csv_records(self.path) - 1)
+            self._cache(rows=rows)
+        self._rows_cache = rows
         return self._rows_cache
 
-    async def _get_encoding(self) -> str:
+    def _detect_encoding(self) -> str:
         """Detect and cache the file's character encoding."""
         if self._encoding is None:
-
-            def detect():
-                """Detect encoding from file bytes synchronously."""
+            enc = self._cached("encoding")
+            if enc is None:
                 with open(self.path, "rb") as f:
-                    return chardet.detect(f.read(1024 * 300))
-
-            result = await to_thread.run_sync(detect)
-            enc = result["encoding"]
-            if enc is None or enc.lower() == "ascii":
-                enc = "iso-8859-1"
+                    enc = detect_encoding(f.read(SAMPLE_SIZE))
+                self._cache(encoding=enc)
             self._encoding = enc
         return self._encoding
 
-    async def _get_sep(self) -> str:
+    def _detect_sep(self) -> str:
         """Sniff and cache the CSV delimiter."""
         if self._sep is None:
-            encoding = await self._get_encoding()
-
-            def sniff():
-                """Sniff the CSV delimiter synchronously."""
+            sep = self._cached("sep")
+            if sep is None:
                 try:
-                    with open(self.path, encoding=encoding) as f:
-                        sample = f.read(1024 * 10)
-                        dialect = csv.Sniffer().sniff(sample)
-                        return dialect.delimiter
+                    with open(self.path, encoding=self._detect_encoding()) as f:
+                        sep = detect_delimiter(f.read(1024 * 10))
                 except ValueError:
-                    return ","
+                    sep = ","
+                self._cache(sep=sep)
+            self._sep = sep
+        return self._sep
+
+    async def _get_encoding(self) -> str:
+        """Detect and cache the file's character encoding in a thread."""
+        if self._encoding is None:
+            await to_thread.run_sync(self._detect_encoding)
+        return self._encoding
 
-            self._sep = await to_thread.run_sync(sniff)
+    async def _get_sep(self) -> str:
+        """Sniff and cache the CSV delimiter in a thread."""
+        if self._sep is None:
+            await self._get_encoding()
+            await to_thread.run_sync(self._detect_sep)
         return self._sep
 
-    async def load(self) -> pd.DataFrame:
-        """Read the entire CSV into a DataFrame."""
+    async def load(
+        self, engine: Literal["pandas", "pyarrow"] = "pandas"
+    ) -> pd.DataFrame:
+        """Read the entire CSV into a DataFrame.
+
+        Parameters
+        ----------
+        engine : {"pandas", "pyarrow"}
+            ``"pandas"`` uses :func:`pandas.read_csv`. ``"pyarrow"`` parses
+            with the multithreaded ``pyarrow.csv`` reader, which infers
+            column types from the first block of the file.
+        """
         encoding = await self._get_encoding()
         separator = await self._get_sep()
 
         def _read_sync():
             """Read the CSV synchronously in a thread."""
+            if engine == "pyarrow":
+                options = csv_arrow_options(
+                    self.path, encoding, separator, typed=True
+                )
+                source = open_csv_source(self.path, encoding)
+                return pacsv.read_csv(source, *options).to_pandas()
             return pd.read_csv(
                 self.path, sep=separator, encoding=encoding, low_memory=False
             )
@@ -234,8 +396,18 @@ class CSV(BaseTabularFile):
     async def stream(
         self,
         chunk_size: int = 10000,
+        engine: Literal["pandas", "pyarrow"] = "pandas",
     ) -> AsyncGenerator[pd.DataFrame, None]:
-        """Yield the CSV in chunks of the given number of rows."""
+        """Yield the CSV in chunks of the given number of rows.
+
+        Every column is read as text. With ``engine="pyarrow"`` the chunks
+        are parsed by :meth:`stream_batches`; see :meth:`load`.
+        """
+        if engine == "pyarrow":
+            async for batch in self.stream_batches(chunk_size):
+                yield await to_thread.run_sync(batch.to_pandas)
+            return
+
         encoding = await self._get_encoding()
         separator = await self._get_sep()
 
@@ -255,12 +427,263 @@ class CSV(BaseTabularFile):
             yield chunk
             await asyncio.sleep(0)
 
+    async def stream_batches(
+        self,
+        chunk_size: int = 10000,
+        engine: Literal["pandas", "pyarrow"] = "pyarrow",
+        typed: bool = False,
+        column_types: dict[str, pa.DataType] | None = None,
+    ) -> AsyncGenerator[pa.RecordBatch, None]:
+        """Yield the CSV records as Arrow record batches.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Maximum number of rows per batch.
+        engine : {"pyarrow", "pandas"}
+            ``"pyarrow"`` (default) parses with ``pyarrow.csv``, transcoding
+            non-UTF-8 input, without going through pandas. ``"pandas"``
+            converts the chunks of :meth:`stream`.
+        typed : bool
+            Infer column types instead of reading every column as text
+            (``"pyarrow"`` only).
+        column_types : dict[str, pa.DataType], optional
+            Explicit types of the columns named (``"pyarrow"`` only).
+        """
+        encoding = await self._get_encoding()
+        separator = await self._get_sep()
+        batches = self._iter_batches(
+            encoding, separator, chunk_size, engine, typed, column_types
+        )
+        async for batch in _iterate_in_thread(batches):
+            yield batch
+
+    async def to_parquet(
+        self,
+        output_path: str | Path | None = None,
+        chunk_size: int = 10000,
+        callback: Callable[[int, int], None] | None = None,
+        write_options: ParquetWriteOptions | None = None,
+        engine: Literal["pandas", "pyarrow"] = "pyarrow",
+        typed: bool = False,
+        column_types: dict[str, pa.DataType] | None = None,
+    ) -> "Parquet":
+        """Convert the CSV file to Parquet format.
+
+        The conversion runs in a worker thread, writing the batches of
+        :meth:`stream_batches` as they are parsed.
+
+        Parameters
+        ----------
+        output_path : str or Path, optional
+            Defaults to the source path with a ``.parquet`` extension.
+        chunk_size : int
+            Maximum rows per batch.
+        callback : callable, optional
+            Called with ``(current_rows, total_rows)``; the total takes a
+            scan of the file (see :attr:`rows`).
+        write_options : ParquetWriteOptions, optional
+            Row groups, compression, statistics and sorting of the output.
+        engine : {"pyarrow", "pandas"}
+            See :meth:`stream_batches`. If ``pyarrow`` can't parse the
+            file, it is converted again with ``"pandas"``.
+        typed, column_types
+            See :meth:`stream_batches`.
+        """
+        out = (
+            Path(output_path or self.path.with_suffix(".parquet"))
+            .expanduser()
+            .resolve()
+        )
+        encoding = await self._get_encoding()
+        separator = await self._get_sep()
+        total_rows = 0
+        if callback is not None:
+            total_rows = await to_thread.run_sync(lambda: self.rows)
+
+        def convert(engine, report=None):
+            names = read_csv_header(self.path, encoding, separator)
+            batches = self._iter_batches(
+                encoding, separator, chunk_size, engine, typed, column_types
+            )
+            schema = pa.schema([(name, pa.string()) for name in names])
+            _write_parquet(out, schema, batches, write_options, report)
+
+        if engine == "pyarrow":
+            try:
+                await _run_conversion(
+                    partial(convert, "pyarrow"), total_rows, callback
+                )
+            except (pa.ArrowInvalid, UnicodeDecodeError):
+                engine = "pandas"  # e.g. ragged rows or a mixed encoding
+        if engine == "pandas":
+            await _run_conversion(
+                partial(convert, "pandas"), total_rows, callback
+            )
+
+        file = await ExtensionFactory.instantiate(out)
+        if not isinstance(file, Parquet):
+            raise ConversionError(f"Could not parse {out} to Parquet")
+        return file
+
+    def _iter_batches(
+        self,
+        encoding: str,
+        separator: str,
+        chunk_size: int,
+        engine: Literal["pandas", "pyarrow"] = "pyarrow",
+        typed: bool = False,
+        column_types: dict[str, pa.DataType] | None = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """Return a blocking iterator over the CSV record batches."""
+        if engine == "pyarrow":
+            return iter_csv_batches(
+                self.path,
+                encoding,
+                separator,
+                batch_size=chunk_size,
+                typed=typed,
+                column_types=column_types,
+            )
+        return self._iter_pandas_batches(encoding, separator, chunk_size)
+
+    def _iter_pandas_batches(
+        self, encoding: str, separator: str, chunk_size: int
+    ) -> Iterator[pa.RecordBatch]:
+        """Yield the chunks of :func:`pandas.read_csv` as text batches."""
+        reader = pd.read_csv(
+            self.path,
+            sep=separator,
+            encoding=encoding,
+            chunksize=chunk_size,
+            dtype=str,
+            low_memory=False,
+        )
+        with reader:
+            for chunk in reader:
+                if chunk.empty:
+                    continue
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                # all-null chunks come out as the null type
+                table = table.cast(
+                    pa.schema(
+                        [(name, pa.string()) for name in table.schema.names]
+                    )
+                )
+                yield from table.to_batches()
+
+
+#: Columns :meth:`Parquet.parse_dftypes` reads as ``YYYYMMDD`` dates.
+DATE_COLUMNS: tuple[str, ...] = (
+    "DT_NOTIFIC",
+    "DT_SIN_PRI",
+    "DT_NASC",
+    "DT_INTER",
+)
+
+#: Columns :meth:`Parquet.parse_dftypes` reads as integers.
+INT_COLUMNS: tuple[str, ...] = ("CODMUNRES", "IDADE")
+
+
+def _as_text(column: pd.Series) -> pa.Array:
+    """Return *column* as whitespace-trimmed Arrow strings, blanks null."""
+    if pd.api.types.infer_dtype(column, skipna=True) in ("string", "empty"):
+        values = pa.array(column, type=pa.string(), from_pandas=True)
+    else:  # categories, numbers or mixed objects
+        values = pa.array(column.astype("string[pyarrow]"))
+    text = pc.utf8_trim_whitespace(values)
+    return pc.if_else(pc.equal(text, ""), pa.scalar(None, pa.string()), text)
+
+
+def _keep_unparsed(
+    converted: pa.Array, text: pa.Array, column: pd.Series
+) -> pd.Series:
+    """Return *converted* as a Series, with the unconverted values kept.
+
+    Values that are set in *text* but null in *converted* failed to parse;
+    if there are any, the Series is ``object`` and holds the original
+    values of *column* in their place.
+    """
+    result = pd.Series(pd.arrays.ArrowExtensionArray(converted))
+    result.index = column.index
+    failed = pc.and_(pc.is_null(converted), pc.is_valid(text))
+    if not pc.any(failed).as_py():
+        return result
+    failed = failed.to_numpy(zero_copy_only=False)
+    result = result.astype(object)
+    result[failed] = column[failed].astype(object)
+    return result
+
+
+def _parse_dates(column: pd.Series) -> pd.Series:
+    """Parse ``YYYYMMDD`` values into a ``date32[pyarrow]`` column."""
+    text = _as_text(column)
+    dates = pc.strptime(text, format="%Y%m%d", unit="s", error_is_null=True)
+    return _keep_unparsed(dates.cast(pa.date32()), text, column)
+
+
+def _parse_ints(column: pd.Series) -> pd.Series:
+    """Parse digit strings, ignoring spaces, into an ``Int64`` column."""
+    text = pc.replace_substring(_as_text(column), " ", "")
+    digits = pc.match_substring_regex(text, r"^\d{1,18}$")
+    ints = pc.if_else(digits, text, pa.scalar(None, pa.string()))
+    result = _keep_unparsed(ints.cast(pa.int64()), text, column)
+    if isinstance(result.dtype, pd.ArrowDtype):
+        result = result.astype("Int64")
+    return result
+
+
+def _blank_whitespace(column: pd.Series) -> pd.Series:
+    """Replace whitespace-only strings in *column* with ``""``.
+
+    Text columns are checked with Arrow's whitespace trim. Categorical
+    columns (from dictionary-encoded Parquet) are fixed through their
+    categories, which are few, and only rebuilt when one of them is
+    blank. Other columns are returned as they are.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        categories = column.cat.categories
+        if categories.inferred_type != "string":
+            return column
+        if not categories.str.fullmatch(r"\s+").any():
+            return column
+        return (
+            column.astype(object)
+            .replace(r"^\s+$", "", regex=True)
+            .astype("category")
+        )
+
+    inferred = pd.api.types.infer_dtype(column, skipna=True)
+    if inferred == "string":
+        values = pa.array(column, type=pa.string(), from_pandas=True)
+        blank = pc.fill_null(
+            pc.equal(pc.utf8_trim_whitespace(values), ""), False
+        )
+        if not pc.any(blank).as_py():
+            return column
+        return column.mask(blank.to_numpy(zero_copy_only=False), "")
+    if inferred in ("mixed", "mixed-integer"):
+        return column.replace(r"^\s+$", "", regex=True)
+    return column
+
+
+def _encode_schema(schema: pa.Schema) -> str:
+    """Serialize *schema* as text for the sidecar metadata."""
+    return base64.b64encode(schema.serialize().to_pybytes()).decode("ascii")
+
+
+def _decode_schema(data: str) -> pa.Schema:
+    """Return the schema serialized by :func:`_encode_schema`."""
+    return pa.ipc.read_schema(pa.py_buffer(base64.b64decode(data)))
+
 
 class Parquet(BaseTabularFile):
     """Represents a Parquet file with optional date and integer type parsing."""
 
     type: FileType = Field("PARQUET")
     add_dv: bool = True
+    date_columns: tuple[str, ...] = DATE_COLUMNS
+    int_columns: tuple[str, ...] = INT_COLUMNS
     _schema_cache: pa.Schema | None = PrivateAttr(default=None)
     _metadata_cache: object | None = PrivateAttr(default=None)
     _columns_cache: list["Column"] | None = PrivateAttr(default=None)
@@ -268,9 +691,20 @@ class Parquet(BaseTabularFile):
 
     @property
     def schema(self) -> pa.Schema:
-        """Return the Parquet schema as a PyArrow Schema object."""
+        """Return the Parquet schema as a PyArrow Schema object.
+
+        Read from the file footer, and cached in the file's sidecar
+        metadata along with the row count.
+        """
         if self._schema_cache is None:
-            self._schema_cache = pq.read_schema(self.path)
+            cached = self._cached("schema")
+            if cached is not None:
+                try:
+                    self._schema_cache = _decode_schema(cached)
+                except (ValueError, TypeError):
+                    cached = None
+            if cached is None:
+                self._read_footer()
         return self._schema_cache
 
     @property
@@ -291,85 +725,160 @@ class Parquet(BaseTabularFile):
     @property
     def rows(self) -> int:
         """Return the number of rows from the Parquet metadata."""
-        if self._rows_cache is not None:
-            return self._rows_cache
-        self._rows_cache = pq.read_metadata(self.path).num_rows
+        if self._rows_cache is None:
+            self._rows_cache = self._cached("rows")
+        if self._rows_cache is None:
+            self._read_footer()
         return self._rows_cache
 
+    def _read_footer(self) -> None:
+        """Read the schema and the row count, and cache them."""
+        metadata = pq.read_metadata(self.path)
+        self._schema_cache = metadata.schema.to_arrow_schema()
+        self._rows_cache = metadata.num_rows
+        self._cache(
+            schema=_encode_schema(self._schema_cache),
+            rows=self._rows_cache,
+        )
+
     @staticmethod
     def _apply_add_dv(df: pd.DataFrame) -> pd.DataFrame:
         """Apply the IBGE verification digit to geocode columns in-place."""
-        from pysus.api.utils import add_dv, is_geocode_column
+        from pysus.api.utils import add_dv_series, is_geocode_column
 
         geocode_cols = [c for c in df.columns if is_geocode_column(c)]
         for col in geocode_cols:
-            df[col] = df[col].astype(str).apply(add_dv)
+            df[col] = add_dv_series(df[col])
         return df
 
-    async def load(self, parse: bool = True) -> pd.DataFrame:
-        """Read the entire Parquet file into a DataFrame."""
+    async def load(
+        self,
+        parse: bool = True,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
+    ) -> pd.DataFrame:
+        """Read the Parquet file into a DataFrame.
+
+        Parameters
+        ----------
+        parse : bool
+            Apply :meth:`parse_dftypes` and, if :attr:`add_dv` is set, the
+            geocode verification digit to the columns read.
+        columns : list[str], optional
+            Read only these columns; all of them by default.
+        filters : pyarrow.compute.Expression or list of tuples, optional
+            Keep only the matching rows, as a ``pyarrow.compute``
+            expression or in the DNF form of ``pyarrow.parquet``
+            (``[("UF", "==", "SP")]``). Row groups whose statistics rule
+            out a match are skipped without being decoded. Filters see the
+            stored values, before parsing.
+        """
 
         def _load():
             """Read the Parquet file synchronously in a thread."""
-            df = pd.read_parquet(self.path, engine="pyarrow")
+            df = pd.read_parquet(
+                self.path,
+                engine="pyarrow",
+                columns=columns,
+                filters=_filter_expression(filters),
+            )
             if parse:
-                df = self.parse_dftypes(df)
-                if self.add_dv:
-                    df = self._apply_add_dv(df)
+                df = self._parse(df)
             return df
 
         return await to_thread.run_sync(_load)
 
     async def stream(
-        self, chunk_size: int = 10000, parse: bool = False
+        self,
+        chunk_size: int = 10000,
+        parse: bool = False,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
     ) -> AsyncGenerator[pd.DataFrame, None]:
-        """Yield the Parquet file in batches of the given size."""
-        parquet_file = await to_thread.run_sync(pq.ParquetFile, self.path)
+        """Yield the Parquet file in batches of at most *chunk_size* rows.
 
-        if parquet_file.metadata.num_row_groups == 0:
-            return
+        Parameters
+        ----------
+        chunk_size : int
+            Maximum number of rows per chunk.
+        parse : bool
+            See :meth:`load`; off by default.
+        columns, filters
+            See :meth:`load`. Rows that don't match are dropped from each
+            chunk, which may leave chunks smaller than *chunk_size*.
+        """
+        batches = await to_thread.run_sync(
+            partial(
+                self._scan,
+                chunk_size,
+                columns=columns,
+                filters=_filter_expression(filters),
+            )
+        )
 
-        for batch in parquet_file.iter_batches(batch_size=chunk_size):
-            df = batch.to_pandas()
-            if parse:
-                df = self.parse_dftypes(df)
-                if self.add_dv:
-                    df = self._apply_add_dv(df)
+        def _chunks():
+            for batch in batches:
+                if not batch.num_rows:
+                    continue
+                df = batch.to_pandas()
+                yield self._parse(df) if parse else df
+
+        async for df in _iterate_in_thread(_chunks()):
             yield df
-            await asyncio.sleep(0)
 
-    @staticmethod
-    def parse_dftypes(df: pd.DataFrame) -> pd.DataFrame:
-        """Convert known date and integer columns to their proper types."""
-
-        def str_to_int(string):
-            """Convert a string to int, return original if not possible."""
-            if pd.isna(string):
-                return string
-            clean = str(string).replace(" ", "")
-            return int(clean) if clean.isnumeric() else string
-
-        def str_to_date(string):
-            """Convert a date string to date or return original on failure."""
-            if isinstance(string, str):
-                try:
-                    return datetime.strptime(string, "%Y%m%d").date()
-                except ValueError:
-                    return string
-            return string
+    def _scan(
+        self,
+        batch_size: int,
+        columns: list[str] | None = None,
+        filters: pc.Expression | None = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """Return the record batches of the projected, filtered rows."""
+        dataset = ds.dataset(self.path, format="parquet")
+        return dataset.to_batches(
+            columns=columns,
+            filter=filters,
+            batch_size=batch_size,
+            use_threads=False,
+        )
 
-        cols_to_date = ["DT_NOTIFIC", "DT_SIN_PRI", "DT_NASC", "DT_INTER"]
-        cols_to_int = ["CODMUNRES", "IDADE"]
+    def _parse(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = self.parse_dftypes(df, self.date_columns, self.int_columns)
+        if self.add_dv:
+            df = self._apply_add_dv(df)
+        return df
 
+    @staticmethod
+    def parse_dftypes(
+        df: pd.DataFrame,
+        date_columns: Collection[str] = DATE_COLUMNS,
+        int_columns: Collection[str] = INT_COLUMNS,
+    ) -> pd.DataFrame:
+        """Convert known date and integer columns to their proper types.
+
+        Works column by column: ``YYYYMMDD`` text in *date_columns*
+        becomes ``date32[pyarrow]`` (``datetime.date`` values), digits in
+        *int_columns* (inner spaces ignored) become ``Int64`` and blank
+        values in either become missing. A column with values that don't
+        parse keeps them as they are, in an ``object`` column. Elsewhere,
+        whitespace-only text becomes ``""`` and the dtypes are converted
+        with ``convert_dtypes``.
+        """
+        parsed = []
         for col in df.columns:
-            if col in cols_to_date:
-                df[col] = df[col].map(str_to_date)
-            elif col in cols_to_int:
-                df[col] = df[col].map(str_to_int)
-
-        df = df.replace(r"^\s+$", "", regex=True)
-
-        return df.convert_dtypes()
+            if col in date_columns:
+                df[col] = _parse_dates(df[col])
+            elif col in int_columns:
+                df[col] = _parse_ints(df[col])
+            else:
+                df[col] = _blank_whitespace(df[col])
+                continue
+            parsed.append(col)
+
+        # convert_dtypes can't infer from Arrow date columns
+        others = df.columns.difference(parsed, sort=False)
+        if len(others):
+            df[others] = df[others].convert_dtypes()
+        return df
 
 
 class DBF(BaseTabularFile):
@@ -447,7 +956,13 @@ class DBF(BaseTabularFile):
         df = pd.DataFrame(iter(dbf))
         return df.map(self.decode_column)
 
-    async def load(self, fast: bool = True) -> pd.DataFrame:
+    async def load(
+        self,
+        fast: bool = True,
+        typed: bool = False,
+        workers: int | None = 1,
+        dictionary: bool | list[str] = False,
+    ) -> pd.DataFrame:
         """Read the entire DBF file into a DataFrame.
 
         Parameters
@@ -456,11 +971,29 @@ class DBF(BaseTabularFile):
             If ``True`` use the byte-level reader (default), falling back
             to dbfread on failure.
             If ``False`` use dbfread.
+        typed : bool
+            If ``True`` decode numeric, date and logical fields into their
+            native types (fast reader only). Defaults to text.
+        workers : int, optional
+            Threads decoding record ranges in parallel (fast reader only,
+            ``None`` uses every CPU).
+        dictionary : bool or list[str]
+            Text columns to return as ``category`` (fast reader only): a
+            list of names, or ``True`` to detect the low-cardinality ones
+            from a sample of the records.
         """
 
         if fast:
             try:
-                return await to_thread.run_sync(read_dbf_fast, self.path)
+                return await to_thread.run_sync(
+                    partial(
+                        read_dbf_fast,
+                        self.path,
+                        typed=typed,
+                        workers=workers,
+                        dictionary=dictionary,
+                    )
+                )
             except Exception:  # noqa: B902 — fallback to dbfread
                 pass
 
@@ -470,6 +1003,8 @@ class DBF(BaseTabularFile):
         self,
         chunk_size: int = 30000,
         fast: bool = True,
+        typed: bool = False,
+        dictionary: bool | list[str] = False,
     ) -> AsyncGenerator[pd.DataFrame, None]:
         """Yield the DBF records in chunks of the given size.
 
@@ -481,13 +1016,17 @@ class DBF(BaseTabularFile):
             If ``True`` use the byte-level reader (default), falling back
             to dbfread on failure.
             If ``False`` use dbfread.
+        typed, dictionary
+            See :meth:`load`.
         """
 
         if fast:
             try:
-                for chunk in stream_dbf_fast(self.path, chunk_size):
+                chunks = stream_dbf_fast(
+                    self.path, chunk_size, typed=typed, dictionary=dictionary
+                )
+                async for chunk in _iterate_in_thread(chunks):
                     yield chunk
-                    await asyncio.sleep(0)
                 return
             except Exception:  # noqa: B902 — fallback to dbfread
                 pass
@@ -508,12 +1047,42 @@ class DBF(BaseTabularFile):
         if records:
             yield pd.DataFrame(records).map(self.decode_column)
 
+    async def stream_batches(
+        self,
+        chunk_size: int = 30000,
+        typed: bool = False,
+        dictionary: bool | list[str] = False,
+    ) -> AsyncGenerator[pa.RecordBatch, None]:
+        """Yield the DBF records as Arrow record batches, without pandas.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Maximum number of rows per batch.
+        typed : bool
+            See :meth:`load`.
+        dictionary : bool or list[str]
+            Text columns to dictionary-encode; see :meth:`load`.
+        """
+        batches = iter_dbf_batches(
+            self.path,
+            batch_size=chunk_size,
+            typed=typed,
+            dictionary=dictionary,
+        )
+        async for batch in _iterate_in_thread(batches):
+            yield batch
+
     async def to_parquet(
         self,
         output_path: str | Path | None = None,
         chunk_size: int = 30000,
         callback: Callable[[int, int], None] | None = None,
         fast: bool = True,
+        typed: bool = False,
+        workers: int | None = 1,
+        dictionary: bool | list[str] = False,
+        write_options: ParquetWriteOptions | None = None,
     ) -> "Parquet":
         """Convert the DBF file to Parquet format.
 
@@ -526,6 +1095,20 @@ class DBF(BaseTabularFile):
         fast : bool
             If ``True`` use the byte-level reader (default).
             If ``False`` use dbfread.
+        typed : bool
+            If ``True`` write numeric, date and logical fields with their
+            native Parquet types instead of strings (fast reader only).
+        workers : int, optional
+            Threads decoding consecutive chunks in parallel while the
+            previous ones are written (fast reader only, ``None`` uses
+            every CPU).
+        dictionary : bool or list[str]
+            Text columns to dictionary-encode (fast reader only). ``True``
+            detects the low-cardinality ones from a sample of the records.
+            Parquet keeps the encoding and :meth:`Parquet.load` returns
+            them as ``category``. By default plain strings are written.
+        write_options : ParquetWriteOptions, optional
+            Row groups, compression, statistics and sorting of the output.
         """
         from pysus.api.extensions import ExtensionFactory
 
@@ -543,11 +1126,23 @@ class DBF(BaseTabularFile):
 
         if fast:
             try:
-                await self._to_parquet_fast(out, chunk_size, callback)
+                await self._to_parquet_fast(
+                    out,
+                    chunk_size,
+                    callback,
+                    typed,
+                    workers,
+                    dictionary,
+                    write_options,
+                )
             except Exception:  # noqa: B902 — fallback to dbfread
-                await self._to_parquet_dbfread(out, chunk_size, callback)
+                await self._to_parquet_dbfread(
+                    out, chunk_size, callback, write_options
+                )
         else:
-            await self._to_parquet_dbfread(out, chunk_size, callback)
+            await self._to_parquet_dbfread(
+                out, chunk_size, callback, write_options
+            )
 
         file = await ExtensionFactory.instantiate(out)
         if not isinstance(file, Parquet):
@@ -559,42 +1154,52 @@ class DBF(BaseTabularFile):
         out: Path,
         chunk_size: int,
         callback: Callable[[int, int], None] | None,
+        typed: bool = False,
+        workers: int | None = 1,
+        dictionary: bool | list[str] = False,
+        write_options: ParquetWriteOptions | None = None,
     ):
         schema = read_dbf_schema(self.path)
-        total_rows = schema.num_records
-        writer = None
-        processed = 0
-
-        try:
-            for chunk in stream_dbf_fast(self.path, chunk_size):
-                table = pa.Table.from_pandas(chunk)
-                if writer is None:
-                    writer = pq.ParquetWriter(str(out), table.schema)
-                writer.write_table(table)
-                processed += len(chunk)
-
-                if callback:
-                    callback(processed, total_rows)
-                await asyncio.sleep(0)
-
-            if writer is None:
-                df_empty = pd.DataFrame(
-                    columns=pd.Index([f.name for f in schema.fields])
-                )
-                table_empty = pa.Table.from_pandas(df_empty)
-                writer = pq.ParquetWriter(str(out), table_empty.schema)
-        finally:
-            if writer:
-                writer.close()
+        batches = iter_dbf_batches(
+            self.path,
+            batch_size=chunk_size,
+            typed=typed,
+            workers=workers,
+            dictionary=dictionary,
+        )
+        convert = partial(
+            _write_parquet,
+            out,
+            schema.arrow_schema(typed=typed),
+            batches,
+            write_options,
+        )
+        await _run_conversion(convert, schema.num_records, callback)
 
     async def _to_parquet_dbfread(
         self,
         out: Path,
         chunk_size: int,
         callback: Callable[[int, int], None] | None,
+        write_options: ParquetWriteOptions | None = None,
     ):
         dbf_reader = DBFReader(self.path, encoding="cp1252", raw=True)
         total_rows = len(dbf_reader)
+        convert = partial(
+            self._write_dbfread, dbf_reader, out, chunk_size, write_options
+        )
+        await _run_conversion(convert, total_rows, callback)
+
+    def _write_dbfread(
+        self,
+        dbf_reader: DBFReader,
+        out: Path,
+        chunk_size: int,
+        write_options: ParquetWriteOptions | None = None,
+        report: Callable[[int], None] | None = None,
+    ):
+        """Convert the records of *dbf_reader* to Parquet, blocking."""
+        total_rows = len(dbf_reader)
         writer = None
         records = []
 
@@ -607,30 +1212,35 @@ class DBF(BaseTabularFile):
                     df = pd.DataFrame(records).map(self.decode_column)
                     table = pa.Table.from_pandas(df)
                     if writer is None:
-                        writer = pq.ParquetWriter(str(out), table.schema)
+                        writer = ParquetBatchWriter(
+                            out, table.schema, write_options
+                        )
                     writer.write_table(table)
                     records = []
 
-                    if callback:
-                        callback(current_count, total_rows)
-                    await asyncio.sleep(0)
+                    if report:
+                        report(current_count)
 
             if records:
                 df = pd.DataFrame(records).map(self.decode_column)
                 table = pa.Table.from_pandas(df)
                 if writer is None:
-                    writer = pq.ParquetWriter(str(out), table.schema)
+                    writer = ParquetBatchWriter(
+                        out, table.schema, write_options
+                    )
                 writer.write_table(table)
 
-                if callback:
-                    callback(total_rows, total_rows)
+                if report:
+                    report(total_rows)
 
             if writer is None:
                 df_empty = pd.DataFrame(
                     columns=pd.Index([c.name for c in self.columns])
                 )
                 table_empty = pa.Table.from_pandas(df_empty)
-                writer = pq.ParquetWriter(str(out), table_empty.schema)
+                writer = ParquetBatchWriter(
+                    out, table_empty.schema, write_options
+                )
 
         finally:
             if writer:
@@ -656,18 +1266,33 @@ class DBC(BaseTabularFile):
             "DBC metadata cannot be read directly. Convert to Parquet first."
         )
 
-    async def load(self) -> pd.DataFrame:
-        """Convert to Parquet and load the result as a DataFrame."""
+    async def load(
+        self,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
+    ) -> pd.DataFrame:
+        """Convert to Parquet and load the result as a DataFrame.
+
+        *columns* and *filters* are applied when reading the Parquet file;
+        see :meth:`Parquet.load`.
+        """
         parquet = await self.to_parquet()
-        return await parquet.load()
+        return await parquet.load(columns=columns, filters=filters)
 
     async def stream(
         self,
         chunk_size: int = 10000,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
     ) -> AsyncGenerator[pd.DataFrame, None]:
-        """Convert to Parquet and stream its chunks."""
+        """Convert to Parquet and stream its chunks.
+
+        See :meth:`Parquet.stream` for *columns* and *filters*.
+        """
         parquet = await self.to_parquet()
-        async for chunk in parquet.stream(chunk_size=chunk_size):
+        async for chunk in parquet.stream(
+            chunk_size=chunk_size, columns=columns, filters=filters
+        ):
             yield chunk
 
     async def to_parquet(
@@ -675,7 +1300,33 @@ class DBC(BaseTabularFile):
         output_path: str | Path | None = None,
         chunk_size: int = 30000,
         callback: Callable[[int, int], None] | None = None,
+        typed: bool = False,
+        streaming: bool = True,
+        dictionary: bool | list[str] = False,
+        write_options: ParquetWriteOptions | None = None,
     ) -> "Parquet":
+        """Convert the DBC file to Parquet format.
+
+        Parameters
+        ----------
+        output_path : str or Path, optional
+        chunk_size : int
+            Rows per chunk when building Parquet.
+        callback : callable, optional
+        typed : bool
+            See :meth:`DBF.to_parquet`.
+        streaming : bool
+            If ``True`` (default, POSIX only) decompress through a pipe and
+            write the records in a single pass, without a temporary DBF on
+            disk, falling back to the temporary DBF on failure.
+            If ``False`` decompress to a temporary DBF next to the source
+            and convert it with :meth:`DBF.to_parquet`.
+        dictionary : bool or list[str]
+            See :meth:`DBF.to_parquet`. When streaming, detection samples
+            the first chunk.
+        write_options : ParquetWriteOptions, optional
+            See :meth:`DBF.to_parquet`.
+        """
         import gc
 
         from pysus.api.extensions import ExtensionFactory
@@ -692,6 +1343,27 @@ class DBC(BaseTabularFile):
                 )
             return file
 
+        if streaming and DBC_STREAMING_SUPPORTED:
+            try:
+                await self._to_parquet_streaming(
+                    output_path,
+                    chunk_size,
+                    callback,
+                    typed,
+                    dictionary,
+                    write_options,
+                )
+            except Exception:  # noqa: B902 — fallback to a temporary DBF
+                if output_path.exists():
+                    output_path.unlink()  # drop the partial output
+            else:
+                file = await ExtensionFactory.instantiate(output_path)
+                if not isinstance(file, Parquet):
+                    raise ConversionError(
+                        f"Could not parse {output_path} to parquet"
+                    )
+                return file
+
         tmp_dbf_path = self.path.with_suffix(".dbf")
         try:
             await to_thread.run_sync(
@@ -700,12 +1372,15 @@ class DBC(BaseTabularFile):
                 str(tmp_dbf_path),
             )
             dbf_ext = await ExtensionFactory.instantiate(tmp_dbf_path)
-            if not isinstance(dbf_ext, BaseTabularFile):
+            if not isinstance(dbf_ext, DBF):
                 raise ConversionError(f"Not a DBF: {dbf_ext}")
             return await dbf_ext.to_parquet(
                 output_path=output_path,
                 chunk_size=chunk_size,
                 callback=callback,
+                typed=typed,
+                dictionary=dictionary,
+                write_options=write_options,
             )
         except Exception as err:  # noqa
             if "dbf_ext" in locals():
@@ -723,92 +1398,66 @@ class DBC(BaseTabularFile):
                     except PermissionError:
                         pass
 
-
-class JSON(BaseTabularFile):
-    """Represents a JSON file with tabular data."""
-
-    type: FileType = Field("JSON")
-
-    @property
-    def columns(self) -> list["Column"]:
-        """Return the column metadata from the JSON file."""
-
-        if self.path.stat().st_size == 0:
-            return []
-        with open(self.path, encoding="utf-8") as f:
-            data = json.load(f)
-        if (
-            isinstance(data, list)
-            and len(data) > 0
-            and isinstance(data[0], dict)
-        ):
-            sample = data[0]
-        elif isinstance(data, dict):
-            sample = data
-        else:
-            return []
-        df = pd.DataFrame([sample])
-        return [
-            Column.from_schema(name=col, dtype=_map_dtype(str(dt)))
-            for col, dt in zip(df.columns, df.dtypes)
-        ]
-
-    @property
-    def rows(self) -> int:
-        """Return the number of rows in the JSON file."""
-        return len(pd.read_json(self.path))
-
-    async def load(self) -> pd.DataFrame:
-        """Read the entire JSON file into a DataFrame."""
-        return await to_thread.run_sync(pd.read_json, self.path)
-
-    async def stream(
+    async def _to_parquet_streaming(
         self,
-        chunk_size: int = 10000,
-    ) -> AsyncGenerator[pd.DataFrame, None]:
-        """Yield the entire JSON file as a single DataFrame."""
-        yield await self.load()
+        out: Path,
+        chunk_size: int,
+        callback: Callable[[int, int], None] | None,
+        typed: bool = False,
+        dictionary: bool | list[str] = False,
+        write_options: ParquetWriteOptions | None = None,
+    ):
+        schema = read_dbc_schema(self.path)
+        batches = iter_dbc_batches(
+            self.path,
+            batch_size=chunk_size,
+            typed=typed,
+            dictionary=dictionary,
+        )
+        convert = partial(
+            _write_parquet,
+            out,
+            schema.arrow_schema(typed=typed),
+            batches,
+            write_options,
+        )
+        await _run_conversion(convert, schema.num_records, callback)
 
 
-class JSONL(BaseTabularFile):
-    """Represents a JSON Lines file — one JSON object per line.
+class _JSONRecords(BaseTabularFile):
+    """Common reading of JSON and JSON Lines files of records.
 
-    Used by the Saude client to persist paginated DEMAS REST rows.
+    Records are parsed into Arrow record batches of one schema, inferred
+    from the first block of the file, without holding the whole document
+    (see :mod:`pysus.data.json_reader`). Subclasses provide the records
+    and their batches.
     """
 
-    type: FileType = Field("JSONL")
+    _lines: ClassVar[bool] = False
     _columns_cache: list["Column"] | None = PrivateAttr(default=None)
     _rows_cache: int | None = PrivateAttr(default=None)
 
-    def _read_lines(self) -> Iterator[dict]:
-        """Yield decoded JSON objects from the file, line by line."""
+    @abstractmethod
+    def _records(self) -> Iterator:
+        """Return a blocking iterator over the decoded records."""
 
-        def _gen():
-            with open(self.path, encoding="utf-8") as fh:
-                for line in fh:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    yield json.loads(line)
+    @abstractmethod
+    def _arrow_batches(self, chunk_size: int) -> Iterator[pa.RecordBatch]:
+        """Return a blocking iterator over the typed record batches."""
 
-        return _gen()
+    def _count_records(self) -> int:
+        """Count the records, blocking."""
+        return sum(1 for _ in self._records())
 
     @property
     def columns(self) -> list["Column"]:
         """Return the column metadata from the first record."""
         if self._columns_cache is not None:
             return self._columns_cache
-        if self.path.stat().st_size == 0:
-            self._columns_cache = []
-            return self._columns_cache
-        sample: dict = {}
-        with open(self.path, encoding="utf-8") as fh:
-            for line in fh:
-                line = line.strip()
-                if line:
-                    sample = json.loads(line)
-                    break
-        if not sample:
+        sample = None
+        if self.path.stat().st_size:
+            sample = next(self._records(), None)
+        if not isinstance(sample, dict) or not sample:
             self._columns_cache = []
             return self._columns_cache
         df = pd.DataFrame([sample])
@@ -820,22 +1469,31 @@ class JSONL(BaseTabularFile):
 
     @property
     def rows(self) -> int:
-        """Return the number of JSON records in the file."""
+        """Return the number of records, cached in the sidecar metadata."""
         if self._rows_cache is not None:
             return self._rows_cache
-        count = 0
-        with open(self.path, encoding="utf-8") as fh:
-            for line in fh:
-                if line.strip():
-                    count += 1
-        self._rows_cache = count
+        rows = self._cached("rows")
+        if rows is None:
+            rows = self._count_records()
+            self._cache(rows=rows)
+        self._rows_cache = rows
         return self._rows_cache
 
     async def load(self) -> pd.DataFrame:
-        """Read the entire JSONL file into a DataFrame."""
+        """Read every record into a DataFrame.
 
-        def _load():
-            return pd.read_json(self.path, lines=True)
+        Parsed through Arrow; records that don't fit one schema are read
+        by :func:`pandas.read_json` instead.
+        """
+
+        def _load() -> pd.DataFrame:
+            try:
+                batches = list(self._arrow_batches(chunk_size=None))
+            except pa.ArrowInvalid:
+                return pd.read_json(self.path, lines=self._lines)
+            if not batches:
+                return pd.DataFrame()
+            return pa.Table.from_batches(batches).to_pandas()
 
         return await to_thread.run_sync(_load)
 
@@ -843,25 +1501,147 @@ class JSONL(BaseTabularFile):
         self,
         chunk_size: int = 10000,
     ) -> AsyncGenerator[pd.DataFrame, None]:
-        """Yield the JSONL records in batches of the given size."""
+        """Yield the records in DataFrames of at most *chunk_size* rows."""
+        async for batch in self.stream_batches(chunk_size):
+            yield await to_thread.run_sync(batch.to_pandas)
 
-        def _chunks():
-            batch: list[dict] = []
-            with open(self.path, encoding="utf-8") as fh:
-                for line in fh:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    batch.append(json.loads(line))
-                    if len(batch) >= chunk_size:
-                        yield pd.DataFrame(batch)
-                        batch = []
-            if batch:
-                yield pd.DataFrame(batch)
-
-        for chunk in _chunks():
-            yield chunk
-            await asyncio.sleep(0)
+    async def stream_batches(
+        self,
+        chunk_size: int = 10000,
+        typed: bool = True,
+    ) -> AsyncGenerator[pa.RecordBatch, None]:
+        """Yield the records as Arrow record batches.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Maximum number of rows per batch.
+        typed : bool
+            Parse with ``pyarrow.json``, typing the columns from the first
+            block; a later record that doesn't fit raises
+            ``pyarrow.ArrowInvalid``. Otherwise every value is read as
+            its JSON text, which takes two passes over the file.
+        """
+        async for batch in _iterate_in_thread(
+            self._iter_batches(chunk_size, typed)
+        ):
+            yield batch
+
+    async def to_parquet(
+        self,
+        output_path: str | Path | None = None,
+        chunk_size: int = 10000,
+        callback: Callable[[int, int], None] | None = None,
+        write_options: ParquetWriteOptions | None = None,
+        typed: bool = True,
+    ) -> "Parquet":
+        """Convert the file to Parquet format.
+
+        The conversion runs in a worker thread, writing the batches of
+        :meth:`stream_batches` as they are parsed.
+
+        Parameters
+        ----------
+        output_path : str or Path, optional
+            Defaults to the source path with a ``.parquet`` extension.
+        chunk_size : int
+            Maximum rows per batch.
+        callback : callable, optional
+            Called with ``(current_rows, total_rows)``; the total takes a
+            scan of the file (see :attr:`rows`).
+        write_options : ParquetWriteOptions, optional
+            Row groups, compression, statistics and sorting of the output.
+        typed : bool
+            See :meth:`stream_batches`. If the records don't fit one
+            schema, the file is converted again with every column as text.
+
+        Raises
+        ------
+        ConversionError
+            If the records are not JSON objects.
+        """
+        out = (
+            Path(output_path or self.path.with_suffix(".parquet"))
+            .expanduser()
+            .resolve()
+        )
+        total_rows = 0
+        if callback is not None:
+            total_rows = await to_thread.run_sync(lambda: self.rows)
+
+        def convert(typed, report=None):
+            batches = self._iter_batches(chunk_size, typed)
+            _write_parquet(out, pa.schema([]), batches, write_options, report)
+
+        try:
+            if typed:
+                try:
+                    await _run_conversion(
+                        partial(convert, True), total_rows, callback
+                    )
+                except pa.ArrowInvalid:
+                    typed = False  # e.g. a column changing type
+            if not typed:
+                await _run_conversion(
+                    partial(convert, False), total_rows, callback
+                )
+        except ValueError as exc:
+            raise ConversionError(
+                f"Could not convert {self.path} to Parquet: {exc}"
+            ) from exc
+
+        file = await ExtensionFactory.instantiate(out)
+        if not isinstance(file, Parquet):
+            raise ConversionError(f"Could not parse {out} to Parquet")
+        return file
+
+    def _iter_batches(
+        self, chunk_size: int, typed: bool = True
+    ) -> Iterator[pa.RecordBatch]:
+        """Return a blocking iterator over the record batches."""
+        if typed:
+            return self._arrow_batches(chunk_size)
+        return iter_json_text_batches(self._records, chunk_size)
+
+
+class JSON(_JSONRecords):
+    """Represents a JSON file with tabular data.
+
+    A top-level array holds one record per element and is read
+    incrementally; any other document is a single record.
+    """
+
+    type: FileType = Field("JSON")
+
+    def _records(self) -> Iterator:
+        return iter_json_records(self.path)
+
+    def _arrow_batches(self, chunk_size: int) -> Iterator[pa.RecordBatch]:
+        return iter_json_batches(
+            iter_json_array_blocks(self.path), batch_size=chunk_size
+        )
+
+    def _count_records(self) -> int:
+        return count_json_records(self.path)
+
+
+class JSONL(_JSONRecords):
+    """Represents a JSON Lines file — one JSON object per line.
+
+    Used by the Saude client to persist paginated DEMAS REST rows.
+    """
+
+    type: FileType = Field("JSONL")
+    _lines: ClassVar[bool] = True
+
+    def _records(self) -> Iterator:
+        return iter_jsonl_records(self.path)
+
+    def _arrow_batches(self, chunk_size: int) -> Iterator[pa.RecordBatch]:
+        return iter_jsonl_batches(self.path, batch_size=chunk_size)
+
+    def _count_records(self) -> int:
+        return count_jsonl_records(self.path)
 
 
 class PDF(BaseLocalFile):
@@ -892,7 +1672,322 @@ class PDF(BaseLocalFile):
             await asyncio.sleep(0)
 
 
-class Zip(BaseCompressedFile):
+class _MemberReader(io.RawIOBase):
+    """Raw reader of an archive member that closes the archive with it."""
+
+    def __init__(self, member: BinaryIO, *owners: Any):
+        super().__init__()
+        self._member = member
+        self._owners = owners
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        return self._member.readinto(buffer)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._member.close()
+            for owner in self._owners:
+                owner.close()
+        super().close()
+
+
+#: Member classes converted by reading the member as a stream; members of
+#: the others are copied to a temporary file first.
+_STREAMED_MEMBERS = (CSV, DBF, JSON, JSONL)
+
+
+def _member_json_class(sample: bytes) -> type[JSON] | type[JSONL]:
+    """Tell a JSON Lines member from a JSON document by its first lines."""
+    lines = [line for line in sample.split(b"\n") if line.strip()][:2]
+    if len(lines) == 2 and all(line.lstrip()[:1] == b"{" for line in lines):
+        return JSONL
+    return JSON
+
+
+def _member_batches(
+    cls: type[BaseTabularFile], stream: BinaryIO, chunk_size: int
+) -> tuple[pa.Schema, Iterator[pa.RecordBatch]]:
+    """Return the schema and the batches of a member read from *stream*.
+
+    The readers and options are those of the class's ``to_parquet``.
+    """
+    if cls is CSV:
+        encoding, separator = sniff_csv(read_sample(stream, SAMPLE_SIZE))
+        names = read_csv_header(stream, encoding, separator)
+        schema = pa.schema([(name, pa.string()) for name in names])
+        batches = iter_csv_batches(
+            stream, encoding, separator, batch_size=chunk_size
+        )
+        return schema, batches
+    if cls is DBF:
+        reader = DBFStreamReader(stream)
+        batches = reader.iter_batches(batch_size=chunk_size)
+        return reader.schema.arrow_schema(), batches
+    if cls is JSONL:
+        return pa.schema([]), iter_jsonl_batches(stream, batch_size=chunk_size)
+    blocks = iter_json_array_blocks(stream)
+    return pa.schema([]), iter_json_batches(blocks, batch_size=chunk_size)
+
+
+class _Archive(BaseCompressedFile):
+    """Conversion of the tabular members of an archive to Parquet.
+
+    CSV, DBF and JSON(L) members are read through :meth:`open_stream` and
+    written to Parquet as they are decompressed, in one pass, without
+    extracting them; memory is bounded by a few parsing blocks whatever
+    their size. DBC and Parquet members, which can only be read from a
+    file, and members the streaming readers can't parse are copied to a
+    temporary file first, one at a time.
+    """
+
+    def _member_class(self, member_name: str) -> type[BaseTabularFile] | None:
+        """Return the file class of a member from its name, blocking.
+
+        JSON members are told from JSON Lines ones by their first lines.
+        """
+        if member_name.endswith("/"):
+            return None
+        name = PurePosixPath(member_name)
+        extensions = ExtensionFactory._extensions
+        cls = extensions.get("".join(name.suffixes).lower())
+        if cls is None:
+            cls = extensions.get(name.suffix.lower())
+        if cls is None or not issubclass(cls, BaseTabularFile):
+            return None
+        if cls in (JSON, JSONL):
+            with self.open_stream(member_name) as stream:
+                sample = read_sample(stream, 64 * 1024)
+            cls = _member_json_class(sample.removeprefix(codecs.BOM_UTF8))
+        return cls
+
+    async def tabular_members(self) -> dict[str, type[BaseTabularFile]]:
+        """Return the tabular members of the archive and their classes."""
+        members = await self.list_members()
+
+        def _classify():
+            """Classify the members synchronously in a thread."""
+            classes = {name: self._member_class(name) for name in members}
+            return {name: cls for name, cls in classes.items() if cls}
+
+        return await to_thread.run_sync(_classify)
+
+    async def to_parquet(
+        self,
+        output_path: str | Path | None = None,
+        chunk_size: int = 30000,
+        callback: Callable[[int, int], None] | None = None,
+        write_options: ParquetWriteOptions | None = None,
+        member: str | None = None,
+    ) -> "Parquet":
+        """Convert a tabular member of the archive to Parquet.
+
+        Parameters
+        ----------
+        output_path : str or Path, optional
+            Defaults to the archive path with a ``.parquet`` extension.
+        chunk_size : int
+            Maximum rows per batch.
+        callback : callable, optional
+            Called with ``(current_rows, total_rows)``. The total of a
+            streamed member is unknown until it is read, and given as 0.
+        write_options : ParquetWriteOptions, optional
+            Row groups, compression, statistics and sorting of the output.
+        member : str, optional
+            Name of the member; the first tabular one by default.
+
+        Raises
+        ------
+        ConversionError
+            If the archive has no tabular member, or *member* isn't one.
+        """
+        out = (
+            Path(output_path or self.path.with_suffix(".parquet"))
+            .expanduser()
+            .resolve()
+        )
+        members = await self.tabular_members()
+        if member is None:
+            member = next(iter(members), None)
+        if member not in members:
+            raise ConversionError(
+                f"No tabular file found inside {self.path.name}",
+            )
+        return await self._member_to_parquet(
+            member, members[member], out, chunk_size, callback, write_options
+        )
+
+    async def members_to_parquet(
+        self,
+        output_dir: str | Path | None = None,
+        chunk_size: int = 30000,
+        callback: Callable[[int, int], None] | None = None,
+        write_options: ParquetWriteOptions | None = None,
+        workers: int | None = None,
+    ) -> list["Parquet"]:
+        """Convert every tabular member of the archive to Parquet.
+
+        Members are converted concurrently, each in its own thread reading
+        its own handle on the archive.
+
+        Parameters
+        ----------
+        output_dir : str or Path, optional
+            Directory of the Parquet files, laid out as the members are in
+            the archive; defaults to the archive's directory.
+        chunk_size : int
+            Maximum rows per batch.
+        callback : callable, optional
+            Called as ``callback(done, total)`` after each member.
+        write_options : ParquetWriteOptions, optional
+            Row groups, compression, statistics and sorting of the outputs.
+        workers : int, optional
+            Members converted at a time (default: every CPU).
+
+        Returns
+        -------
+        list[Parquet]
+            In the order of the members in the archive.
+        """
+        root = Path(output_dir or self.path.parent).expanduser().resolve()
+        members = await self.tabular_members()
+        limit = asyncio.Semaphore(workers or os.cpu_count() or 1)
+        done = 0
+
+        async def convert(name: str, cls: type[BaseTabularFile]):
+            nonlocal done
+            out = (root / name).with_suffix(".parquet").resolve()
+            try:
+                out.relative_to(root)
+            except ValueError:
+                raise ValueError(f"Path traversal blocked: {name}")
+            async with limit:
+                await to_thread.run_sync(
+                    partial(out.parent.mkdir, parents=True, exist_ok=True)
+                )
+                file = await self._member_to_parquet(
+                    name, cls, out, chunk_size, None, write_options
+                )
+            done += 1
+            if callback:
+                callback(done, len(members))
+            return file
+
+        tasks = [convert(name, cls) for name, cls in members.items()]
+        return list(await asyncio.gather(*tasks))
+
+    async def _member_to_parquet(
+        self,
+        member_name: str,
+        cls: type[BaseTabularFile],
+        out: Path,
+        chunk_size: int,
+        callback: Callable[[int, int], None] | None,
+        write_options: ParquetWriteOptions | None,
+    ) -> "Parquet":
+        if cls in _STREAMED_MEMBERS:
+            try:
+                await _run_conversion(
+                    partial(
+                        self._stream_member,
+                        member_name,
+                        cls,
+                        out,
+                        chunk_size,
+                        write_options,
+                    ),
+                    0,
+                    callback,
+                )
+            except ValueError:
+                # e.g. ragged CSV rows, JSON records changing type: the
+                # file classes fall back to slower readers
+                await to_thread.run_sync(partial(out.unlink, missing_ok=True))
+            else:
+                file = await ExtensionFactory.instantiate(out)
+                if not isinstance(file, Parquet):
+                    raise ConversionError(f"Could not parse {out} to Parquet")
+                return file
+        return await self._spool_member(
+            member_name, cls, out, chunk_size, callback, write_options
+        )
+
+    def _stream_member(
+        self,
+        member_name: str,
+        cls: type[BaseTabularFile],
+        out: Path,
+        chunk_size: int,
+        write_options: ParquetWriteOptions | None = None,
+        report: Callable[[int], None] | None = None,
+    ) -> None:
+        """Convert a member read as a stream to Parquet, blocking."""
+        with self.open_stream(member_name) as stream:
+            schema, batches = _member_batches(cls, stream, chunk_size)
+            _write_parquet(out, schema, batches, write_options, report)
+
+    async def _spool_member(
+        self,
+        member_name: str,
+        cls: type[BaseTabularFile],
+        out: Path,
+        chunk_size: int,
+        callback: Callable[[int, int], None] | None,
+        write_options: ParquetWriteOptions | None,
+    ) -> "Parquet":
+        """Copy a member to a temporary file next to *out*, and convert it."""
+        directory = Path(
+            await to_thread.run_sync(
+                partial(tempfile.mkdtemp, prefix=".spool-", dir=out.parent)
+            )
+        )
+        path = directory / PurePosixPath(member_name).name
+
+        def _copy():
+            """Copy the member synchronously in a thread."""
+            with self.open_stream(member_name) as src, open(path, "wb") as dst:
+                shutil.copyfileobj(src, dst, 1024**2)
+
+        try:
+            await to_thread.run_sync(_copy)
+            if cls is Parquet:
+                await to_thread.run_sync(shutil.move, path, out)
+                file = await ExtensionFactory.instantiate(out)
+                if not isinstance(file, Parquet):
+                    raise ConversionError(f"Could not parse {out} to Parquet")
+                return file
+            return await cls(path=path).to_parquet(
+                output_path=out,
+                chunk_size=chunk_size,
+                callback=callback,
+                write_options=write_options,
+            )
+        finally:
+            await self._safe_cleanup(directory)
+
+    async def _safe_cleanup(self, directory: Path):
+        """Remove a temporary directory and its contents."""
+
+        def _rmdir_recursive(d: Path):
+            """Recursively remove a directory tree."""
+            for item in d.iterdir():
+                if item.is_dir():
+                    _rmdir_recursive(item)
+                else:
+                    item.unlink(missing_ok=True)
+            d.rmdir()
+
+        def _cleanup():
+            """Remove directory synchronously in a thread."""
+            if directory.exists():
+                _rmdir_recursive(directory)
+
+        await to_thread.run_sync(_cleanup)
+
+
+class Zip(_Archive):
     """Represents a ZIP archive file."""
 
     type: FileType = Field("ZIP")
@@ -954,62 +2049,18 @@ class Zip(BaseCompressedFile):
         tasks = [ExtensionFactory.instantiate(target_dir / m) for m in members]
         return list(await asyncio.gather(*tasks))
 
-    async def to_parquet(
-        self,
-        output_path: str | Path | None = None,
-        chunk_size: int = 30000,
-        callback: Callable[[int, int], None] | None = None,
-    ) -> "Parquet":
-        """Extract the archive and convert the first tabular file to Parquet."""
-        final_output = (
-            Path(output_path or self.path.with_suffix(".parquet"))
-            .expanduser()
-            .resolve()
-        )
-        temp_dir = self.path.with_suffix(".tmp_extract")
-
+    def open_stream(self, member_name: str) -> BinaryIO:
+        """Open a member for reading, decompressed as it is read."""
+        archive = zipfile.ZipFile(self.path)
         try:
-            extracted_files = await self.extract(target_dir=temp_dir)
-
-            tabular_file = next(
-                (f for f in extracted_files if isinstance(f, BaseTabularFile)),
-                None,
-            )
-
-            if not tabular_file:
-                raise ConversionError(
-                    f"No tabular file found inside {self.path.name}",
-                )
-
-            return await tabular_file.to_parquet(
-                output_path=final_output,
-                chunk_size=chunk_size,
-                callback=callback,
-            )
-        finally:
-            await self._safe_cleanup(temp_dir)
+            member = archive.open(member_name)
+        except BaseException:
+            archive.close()
+            raise
+        return peekable(_MemberReader(member, archive))
 
-    async def _safe_cleanup(self, directory: Path):
-        """Remove a temporary directory and its contents."""
 
-        def _rmdir_recursive(d: Path):
-            """Recursively remove a directory tree."""
-            for item in d.iterdir():
-                if item.is_dir():
-                    _rmdir_recursive(item)
-                else:
-                    item.unlink(missing_ok=True)
-            d.rmdir()
-
-        def _cleanup():
-            """Remove directory synchronously in a thread."""
-            if directory.exists():
-                _rmdir_recursive(directory)
-
-        await to_thread.run_sync(_cleanup)
-
-
-class GZip(BaseCompressedFile):
+class GZip(_Archive):
     """Represents a GZip-compressed file."""
 
     type: FileType = Field("GZIP")
@@ -1032,6 +2083,12 @@ class GZip(BaseCompressedFile):
         """Read and return the decompressed file contents."""
         return await self.load()
 
+    def open_stream(self, member_name: str) -> BinaryIO:
+        """Open the decompressed file for reading as it is decompressed."""
+        if member_name != self.path.stem:
+            raise KeyError(f"There is no item named {member_name!r}")
+        return peekable(_MemberReader(gzip.open(self.path, "rb")))
+
     async def extract(
         self,
         target_dir: Path = CACHEPATH,
@@ -1058,7 +2115,7 @@ class GZip(BaseCompressedFile):
         return [await ExtensionFactory.instantiate(out_file)]
 
 
-class Tar(BaseCompressedFile):
+class Tar(_Archive):
     """Represents a Tar archive file."""
 
     type: FileType = Field("TAR")
@@ -1088,6 +2145,18 @@ class Tar(BaseCompressedFile):
 
         return await to_thread.run_sync(_read)
 
+    def open_stream(self, member_name: str) -> BinaryIO:
+        """Open a regular file member for reading as it is extracted."""
+        archive = tarfile.open(self.path)
+        try:
+            member = archive.extractfile(member_name)
+            if member is None:
+                raise KeyError(f"{member_name!r} is not a regular file")
+        except BaseException:
+            archive.close()
+            raise
+        return peekable(_MemberReader(member, archive))
+
     async def extract(
         self,
         target_dir: Path = CACHEPATH,
@@ -1256,6 +2325,30 @@ def _detect_type(path: Path) -> type[BaseLocalFile] | None:
     return None
 
 
+#: Classes :func:`_detect_type` returns, by the name kept in sidecars.
+_DETECTED_CLASSES: dict[str, type[BaseLocalFile]] = {
+    cls.__name__: cls
+    for cls in (Parquet, PDF, Zip, GZip, Tar, DBF, JSONL, JSON)
+}
+
+
+def _detect_type_cached(path: Path) -> type[BaseLocalFile] | None:
+    """Return the detected class of *path*, kept in its sidecar metadata.
+
+    A file whose content matches no detector is recorded as such, so it
+    isn't sniffed again until it changes.
+    """
+    values = read_sidecar(path)
+    name = values.get("file_class", "")
+    if name is None:
+        return None
+    if name in _DETECTED_CLASSES:
+        return _DETECTED_CLASSES[name]
+    result = _detect_type(path)
+    update_sidecar(path, file_class=result and result.__name__)
+    return result
+
+
 class ExtensionFactory:
     """Factory that maps file content and extensions to handler classes."""
 
@@ -1274,7 +2367,14 @@ class ExtensionFactory:
         ".jsonl": JSONL,
     }
 
-    _detection_cache: dict[str, type[BaseLocalFile] | None] = {}
+    #: Detected classes by :meth:`_cache_key`, least recently used first.
+    _detection_cache: OrderedDict[
+        str, type[BaseLocalFile] | None
+    ] = OrderedDict()
+
+    #: Entries kept in :attr:`_detection_cache`; the detections of other
+    #: files are read back from their sidecar metadata.
+    detection_cache_size: ClassVar[int] = 4096
 
     @classmethod
     def _cache_key(cls, path: Path) -> str:
@@ -1283,18 +2383,28 @@ class ExtensionFactory:
 
     @classmethod
     async def _identify(cls, path: Path) -> type[BaseLocalFile] | None:
-        """Identify the file type by attempting to parse it."""
+        """Identify the file type by attempting to parse it.
+
+        Detections are cached in memory for the most recently used files,
+        and in the sidecar metadata of every file (see
+        :mod:`pysus.api.sidecar`), so a file is only sniffed again once it
+        changes, even in a new process.
+        """
         try:
             key = cls._cache_key(path)
         except OSError:
             return None
-        if key in cls._detection_cache:
-            return cls._detection_cache[key]
+        cache = cls._detection_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
         try:
-            result = await to_thread.run_sync(_detect_type, path)
+            result = await to_thread.run_sync(_detect_type_cached, path)
         except OSError:
             result = None
-        cls._detection_cache[key] = result
+        cache[key] = result
+        while len(cache) > cls.detection_cache_size:
+            cache.popitem(last=False)
         return result
 
     @classmethod
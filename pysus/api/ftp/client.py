@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import pathlib
+import time
 from collections.abc import Callable
 from datetime import datetime
 from ftplib import FTP as FTPLib
 from typing import TYPE_CHECKING, Any, TypedDict
 
-from anyio import to_thread
+from anyio import from_thread, to_thread
 from pydantic import PrivateAttr
+from pysus.api.digest import HashingWriter, record_sha256
 from pysus.api.errors import ConnectionError, ParseError
 from pysus.api.models import BaseRemoteClient, BaseRemoteFile
 from pysus.api.types import FTP as FTP_STR
@@ -18,6 +20,12 @@ if TYPE_CHECKING:  # pragma: no cover
     from pysus.api.ftp.models import Dataset
     from pysus.api.types import State
 
+#: Bytes received between two progress callbacks at most.
+PROGRESS_BYTES = 1024 * 1024
+
+#: Seconds between two progress callbacks at most.
+PROGRESS_INTERVAL = 0.1
+
 
 class FTPGroupInfo(TypedDict):
     """Metadata describing a file group within a dataset."""
@@ -178,30 +186,49 @@ class FTP(BaseRemoteClient):
         output: pathlib.Path,
         callback: Callable[..., None] | None = None,
     ) -> pathlib.Path:
-        """Download a remote file locally, optionally reporting progress."""
+        """Download a remote file locally, optionally reporting progress.
+
+        The transfer runs in a worker thread, so downloads on separate
+        connections proceed in parallel; *callback* is called on the event
+        loop, every :data:`PROGRESS_BYTES` or :data:`PROGRESS_INTERVAL`
+        seconds, and once the file is complete.
+        """
+        try:
+            self.ftp.voidcmd("NOOP")
+        except BrokenPipeError:
+            await self.connect()
+        ftp = self.ftp
 
-        async def _fetch():
-            try:
-                self.ftp.voidcmd("NOOP")
-            except BrokenPipeError:
-                await self.connect()
+        def _fetch():
+            total_size = ftp.size(str(file.path)) or 0
+            current_size = reported_size = 0
+            reported_at = time.monotonic()
 
-            total_size = self.ftp.size(str(file.path)) or 0
-            current_size = 0
+            def _report():
+                nonlocal reported_size, reported_at
+                from_thread.run_sync(callback, current_size, total_size)
+                reported_size = current_size
+                reported_at = time.monotonic()
 
-            with open(output, "wb") as f:
+            with HashingWriter(open(output, "wb")) as f:
 
                 def _write_and_callback(chunk):
                     nonlocal current_size
                     f.write(chunk)
                     current_size += len(chunk)
-                    if callback:
-                        callback(current_size, total_size)
-
-                self.ftp.retrbinary(f"RETR {file.path}", _write_and_callback)
+                    if callback and (
+                        current_size - reported_size >= PROGRESS_BYTES
+                        or time.monotonic() - reported_at >= PROGRESS_INTERVAL
+                    ):
+                        _report()
+
+                ftp.retrbinary(f"RETR {file.path}", _write_and_callback)
+            record_sha256(output, f.hexdigest())
+            if callback and current_size != reported_size:
+                _report()
             return output
 
-        return await _fetch()
+        return await to_thread.run_sync(_fetch)
 
     @staticmethod
     def _line_parser(
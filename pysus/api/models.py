@@ -15,11 +15,10 @@ from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator, Callable, Sequence
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any, BinaryIO, ClassVar
 
 import pandas as pd
 import pyarrow as pa
-import pyarrow.parquet as pq
 from anyio import to_thread
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from pysus import CACHEPATH
@@ -32,7 +31,10 @@ from pysus.api.metadata.models import (
 )
 from tqdm.asyncio import tqdm
 
+from .digest import sha256_of
 from .errors import ConversionError
+from .parquet import ParquetBatchWriter, ParquetWriteOptions
+from .sidecar import read_sidecar, update_sidecar
 from .types import FileType, State
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -111,6 +113,9 @@ class BaseLocalFile(BaseFile, ABC):
     ) -> str:
         """Compute the file's hash digest.
 
+        A SHA-256 digest recorded when the file was downloaded or written
+        is returned without reading the file (see :mod:`pysus.api.digest`).
+
         Parameters
         ----------
         algorithm : str, optional
@@ -123,6 +128,8 @@ class BaseLocalFile(BaseFile, ABC):
         str
             The hex digest string.
         """
+        if algorithm == "sha256":
+            return await to_thread.run_sync(sha256_of, self.path)
 
         def _compute_hash():
             """Compute the hash digest in a thread-safe manner."""
@@ -167,6 +174,18 @@ class BaseTabularFile(BaseLocalFile, ABC):
     Subclasses must implement *columns*, *rows*, *load*, and *stream*.
     """
 
+    _sidecar: dict | None = PrivateAttr(default=None)
+
+    def _cached(self, key: str):
+        """Return a value from the file's sidecar metadata, if current."""
+        if self._sidecar is None:
+            self._sidecar = read_sidecar(self.path)
+        return self._sidecar.get(key)
+
+    def _cache(self, **values) -> None:
+        """Store values in the file's sidecar metadata."""
+        self._sidecar = update_sidecar(self.path, **values)
+
     @property
     def metadata(self) -> MetadataBag:
         """Return structure/access metadata computed from the file.
@@ -208,11 +227,43 @@ class BaseTabularFile(BaseLocalFile, ABC):
     ) -> AsyncGenerator[pd.DataFrame, None]:
         """Yield pandas DataFrames in chunks as an async generator."""
 
+    async def stream_batches(
+        self,
+        chunk_size: int = 10000,
+    ) -> AsyncGenerator[pa.RecordBatch, None]:
+        """Yield the file content as Arrow record batches.
+
+        The default converts each chunk from :meth:`stream`; formats with a
+        native Arrow reader override it to skip pandas entirely. Empty
+        chunks are skipped and all-null columns are typed as strings.
+        """
+        async for chunk in self.stream(chunk_size=chunk_size):
+            if chunk.empty:
+                continue
+
+            table = await to_thread.run_sync(pa.Table.from_pandas, chunk)
+
+            schema = table.schema
+            if any(pa.types.is_null(f.type) for f in schema):
+                new_fields = [
+                    (
+                        pa.field(f.name, pa.string(), nullable=True)
+                        if pa.types.is_null(f.type)
+                        else f
+                    )
+                    for f in schema
+                ]
+                table = table.cast(pa.schema(new_fields))
+
+            for batch in table.to_batches():
+                yield batch
+
     async def to_parquet(
         self,
         output_path: str | Path | None = None,
         chunk_size: int = 10000,
         callback: Callable[[int, int], None] | None = None,
+        write_options: ParquetWriteOptions | None = None,
     ) -> Parquet:
         """Convert the file to Parquet format.
 
@@ -226,6 +277,9 @@ class BaseTabularFile(BaseLocalFile, ABC):
         callback : Callable[[int, int], None], optional
             Function called after each chunk with
             ``(current_rows, total_rows)``.
+        write_options : ParquetWriteOptions, optional
+            Row groups, compression, statistics and sorting of the output;
+            chunks are buffered into full row groups.
 
         Returns
         -------
@@ -251,38 +305,21 @@ class BaseTabularFile(BaseLocalFile, ABC):
 
         try:
             try:
-                async for chunk in self.stream(
+                async for batch in self.stream_batches(
                     chunk_size=chunk_size,
                 ):
-                    if chunk.empty:
-                        continue
-
-                    rows_in_chunk = len(chunk)
+                    rows_in_chunk = batch.num_rows
                     current_rows += rows_in_chunk
 
-                    table = await to_thread.run_sync(
-                        pa.Table.from_pandas,
-                        chunk,
-                    )
-
-                    schema = table.schema
-                    if any(pa.types.is_null(f.type) for f in schema):
-                        new_fields = [
-                            (
-                                pa.field(f.name, pa.string(), nullable=True)
-                                if pa.types.is_null(f.type)
-                                else f
-                            )
-                            for f in schema
-                        ]
-                        table = table.cast(pa.schema(new_fields))
-
                     if writer is None:
                         writer = await to_thread.run_sync(
-                            pq.ParquetWriter, output_path, table.schema
+                            ParquetBatchWriter,
+                            output_path,
+                            batch.schema,
+                            write_options,
                         )
 
-                    await to_thread.run_sync(writer.write_table, table)
+                    await to_thread.run_sync(writer.write_batch, batch)
 
                     pbar.update(rows_in_chunk)
 
@@ -306,7 +343,8 @@ class BaseTabularFile(BaseLocalFile, ABC):
 class BaseCompressedFile(BaseLocalFile, ABC):
     """Abstract base for a compressed archive file (e.g. .zip, .gz).
 
-    Subclasses must implement *list_members*, *open_member*, and *extract*.
+    Subclasses must implement *list_members*, *open_member*, *extract* and
+    *open_stream*.
     """
 
     @abstractmethod
@@ -324,6 +362,21 @@ class BaseCompressedFile(BaseLocalFile, ABC):
     ) -> list[BaseLocalFile]:
         """Extract all members into *target_dir* and return the file objects."""
 
+    @abstractmethod
+    def open_stream(self, member_name: str) -> BinaryIO:
+        """Open a member for reading as a binary stream, blocking.
+
+        The member is decompressed as it is read, so memory doesn't grow
+        with its size. The stream is peekable (see
+        :func:`~pysus.data.sources.peekable`) and closing it releases the
+        archive.
+
+        Raises
+        ------
+        KeyError
+            If the archive has no such member.
+        """
+
     async def stream(
         self,
         chunk_size: int | None = None,
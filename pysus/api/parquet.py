@@ -0,0 +1,206 @@
+"""Parquet write profile shared by every ``to_parquet`` conversion.
+
+Conversions produce record batches of whatever size the reader decodes
+(a few tens of thousands of rows). Written as they come, each batch would
+become a row group of its own; :class:`ParquetBatchWriter` buffers them
+into row groups of :attr:`ParquetWriteOptions.row_group_size` rows, which
+keeps the footer small and lets DuckDB and remote range readers skip
+whole groups by their statistics.
+"""
+
+import inspect
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from pydantic import BaseModel, ConfigDict, Field
+
+from .digest import HashingWriter, record_sha256
+
+# Writer options some supported pyarrow versions lack are left out.
+_WRITER_PARAMS = frozenset(
+    inspect.signature(pq.ParquetWriter.__init__).parameters
+)
+
+
+class ParquetWriteOptions(BaseModel):
+    """How converted files are laid out and encoded in Parquet.
+
+    Attributes
+    ----------
+    row_group_size : int
+        Rows per row group. Batches are buffered until a group is full;
+        the default matches DuckDB's own row groups.
+    compression : str
+        Codec (``"zstd"``, ``"snappy"``, ``"gzip"``, ``"brotli"``,
+        ``"lz4"`` or ``"none"``).
+    compression_level : int, optional
+        Codec level; the codec's default when omitted.
+    use_dictionary : bool or list[str]
+        Parquet dictionary encoding for all columns or the listed ones.
+        Arrow dictionary columns are always stored dictionary-encoded.
+    write_statistics : bool or list[str]
+        Min/max/null-count statistics for all columns or the listed ones.
+    write_page_index : bool
+        Write the column and offset indexes that let readers skip pages
+        inside a row group (pyarrow >= 13).
+    sort_by : str or list[str], optional
+        Columns each row group is sorted by, ascending, such as
+        ``DT_NOTIFIC``. Sorting is per row group, so memory stays bounded
+        by :attr:`row_group_size`; it tightens the page statistics and is
+        recorded as the row groups' sorting columns.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    row_group_size: int = Field(122_880, gt=0)
+    compression: str = "zstd"
+    compression_level: int | None = None
+    use_dictionary: bool | list[str] = True
+    write_statistics: bool | list[str] = True
+    write_page_index: bool = True
+    sort_by: str | list[str] | None = None
+
+    @property
+    def sort_keys(self) -> list[str]:
+        """The :attr:`sort_by` columns as a list."""
+        if self.sort_by is None:
+            return []
+        if isinstance(self.sort_by, str):
+            return [self.sort_by]
+        return list(self.sort_by)
+
+    def writer_kwargs(self, schema: pa.Schema) -> dict:
+        """Return the ``pq.ParquetWriter`` arguments for *schema*."""
+        kwargs = {
+            "compression": self.compression,
+            "compression_level": self.compression_level,
+            "use_dictionary": self.use_dictionary,
+            "write_statistics": self.write_statistics,
+            "write_page_index": self.write_page_index,
+        }
+        if self.sort_keys and hasattr(pq, "SortingColumn"):
+            kwargs["sorting_columns"] = list(
+                pq.SortingColumn.from_ordering(
+                    schema, [(name, "ascending") for name in self.sort_keys]
+                )
+            )
+        return {k: v for k, v in kwargs.items() if k in _WRITER_PARAMS}
+
+
+class ParquetBatchWriter:
+    """Write record batches to a Parquet file in full row groups.
+
+    Blocking, like ``pq.ParquetWriter``; the conversions call it from a
+    worker thread. Batches are buffered until they fill a row group, so
+    at most one row group of rows is held in memory. Use as a context
+    manager, or call :meth:`close` to write the last, partial group.
+    The file is hashed as it is written, and its digest recorded on close
+    (see :mod:`pysus.api.digest`).
+
+    Parameters
+    ----------
+    where : str or Path
+        The output file.
+    schema : pa.Schema
+        Schema of every batch written.
+    options : ParquetWriteOptions, optional
+        Defaults to ``ParquetWriteOptions()``.
+    """
+
+    def __init__(
+        self,
+        where: str | Path,
+        schema: pa.Schema,
+        options: ParquetWriteOptions | None = None,
+    ):
+        self.options = options or ParquetWriteOptions()
+        missing = [k for k in self.options.sort_keys if k not in schema.names]
+        if missing:
+            raise ValueError(f"Sort columns not in the schema: {missing}")
+        self.schema = schema
+        self.path = Path(where)
+        self._sink = HashingWriter(open(self.path, "wb"))
+        try:
+            self._writer = pq.ParquetWriter(
+                self._sink, schema, **self.options.writer_kwargs(schema)
+            )
+        except BaseException:
+            self._sink.close()
+            raise
+        self._buffer: list[pa.RecordBatch] = []
+        self._buffered = 0
+
+    def __enter__(self) -> "ParquetBatchWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def write_batch(self, batch: pa.RecordBatch) -> None:
+        """Buffer *batch*, writing the row groups it completes."""
+        if not batch.num_rows:
+            return
+        if batch.schema.metadata != self.schema.metadata:
+            # e.g. the pandas index range of each converted chunk
+            batch = batch.replace_schema_metadata(self.schema.metadata)
+        self._buffer.append(batch)
+        self._buffered += batch.num_rows
+        if self._buffered >= self.options.row_group_size:
+            self._flush(final=False)
+
+    def write_table(self, table: pa.Table) -> None:
+        """Buffer the batches of *table*."""
+        for batch in table.to_batches():
+            self.write_batch(batch)
+
+    def close(self) -> None:
+        """Write the buffered rows and close the file."""
+        if self._writer is None:
+            return
+        try:
+            self._flush(final=True)
+        finally:
+            try:
+                self._writer.close()
+            finally:
+                self._writer = None
+                self._sink.close()
+        record_sha256(self.path, self._sink.hexdigest())
+
+    def _flush(self, final: bool) -> None:
+        if not self._buffered:
+            return
+        size = self.options.row_group_size
+        table = pa.Table.from_batches(self._buffer, schema=self.schema)
+        start = 0
+        while table.num_rows - start >= size or (
+            final and start < table.num_rows
+        ):
+            group = table.slice(start, size)
+            if self.options.sort_keys:
+                group = _sorted(group, self.options.sort_keys)
+            self._writer.write_table(group, row_group_size=size)
+            start += group.num_rows
+        rest = table.slice(start)
+        self._buffer = rest.to_batches()
+        self._buffered = rest.num_rows
+
+
+def _sorted(table: pa.Table, keys: list[str]) -> pa.Table:
+    """Return *table* sorted ascending by the *keys* columns.
+
+    Dictionary columns are compared by their values, which Arrow's sort
+    kernels do not do on chunked dictionary arrays.
+    """
+    columns = {}
+    for name in keys:
+        column = table[name]
+        if pa.types.is_dictionary(column.type):
+            column = column.cast(column.type.value_type)
+        columns[name] = column
+    indices = pc.sort_indices(
+        pa.table(columns), sort_keys=[(name, "ascending") for name in keys]
+    )
+    return table.take(indices)
@@ -0,0 +1,155 @@
+"""Lazy queries over Parquet files, run by DuckDB.
+
+:meth:`PySUS.read_parquet <pysus.api.client.PySUS.read_parquet>` returns
+a :class:`ParquetRelation`. Nothing is read until a result is asked for,
+and the columns it selects and the conditions it filters on are pushed
+into the Parquet scan: DuckDB reads only those columns, and skips the row
+groups whose statistics rule the conditions out.
+"""
+
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import duckdb
+import pandas as pd
+import pyarrow as pa
+
+from .utils import add_dv_macro
+
+#: Name of the verification digit macro of :func:`connect` connections.
+ADD_DV_MACRO = "__pysus_add_dv"
+
+#: Threads reading Parquet footers at a time.
+FOOTER_WORKERS = 8
+
+
+def connect(
+    threads: int | None = None,
+    memory_limit: str | None = None,
+) -> duckdb.DuckDBPyConnection:
+    """Open an in-memory DuckDB connection for querying Parquet files.
+
+    Parameters
+    ----------
+    threads : int, optional
+        Threads DuckDB runs queries with; all cores by default.
+    memory_limit : str, optional
+        Memory DuckDB may use before spilling to disk, such as
+        ``"4GB"``; 80% of the RAM by default.
+
+    Returns
+    -------
+    duckdb.DuckDBPyConnection
+        The connection, with the :data:`ADD_DV_MACRO` macro defined.
+    """
+    config: dict[str, Any] = {}
+    if threads is not None:
+        config["threads"] = threads
+    if memory_limit is not None:
+        config["memory_limit"] = memory_limit
+    con = duckdb.connect(":memory:", config=config)
+    con.execute(add_dv_macro(ADD_DV_MACRO))
+    return con
+
+
+def read_schemas(paths: Sequence[str | Path]) -> list[pa.Schema]:
+    """Return the schemas of Parquet files, in the order of *paths*.
+
+    Schemas are read from the footers, several files at a time, or from
+    the files' sidecar metadata when cached (see
+    :attr:`pysus.api.extensions.Parquet.schema`).
+    """
+    from pysus.api.extensions import Parquet
+
+    def schema(path: str | Path) -> pa.Schema:
+        return Parquet(path=Path(path)).schema
+
+    if len(paths) == 1:
+        return [schema(paths[0])]
+    with ThreadPoolExecutor(min(len(paths), FOOTER_WORKERS)) as pool:
+        return list(pool.map(schema, paths))
+
+
+class ParquetRelation:
+    """A lazy query over Parquet files.
+
+    Methods building a query return a new relation; the files are only
+    read by :meth:`to_arrow`, :meth:`to_df`, :meth:`iter_batches` and
+    :meth:`fetchall`. Other attributes are those of the underlying
+    :class:`duckdb.DuckDBPyRelation`. Like its connection, a relation must
+    not be used from several threads at a time.
+
+    Parameters
+    ----------
+    relation : duckdb.DuckDBPyRelation
+        The query.
+    """
+
+    def __init__(self, relation: duckdb.DuckDBPyRelation):
+        self.relation = relation
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.relation, name)
+
+    def __repr__(self) -> str:
+        return f"ParquetRelation(columns={self.columns!r})"
+
+    @property
+    def columns(self) -> list[str]:
+        """Return the names of the result columns."""
+        return list(self.relation.columns)
+
+    def select(self, *columns: str) -> "ParquetRelation":
+        """Keep the given columns or SQL expressions (``"A + B AS C"``)."""
+        return ParquetRelation(self.relation.project(", ".join(columns)))
+
+    def filter(self, condition: str) -> "ParquetRelation":
+        """Keep the rows matching the SQL *condition*."""
+        return ParquetRelation(self.relation.filter(condition))
+
+    def aggregate(
+        self, expressions: str, group_by: str = ""
+    ) -> "ParquetRelation":
+        """Aggregate rows, such as ``aggregate("count(*)", "SG_UF")``."""
+        return ParquetRelation(self.relation.aggregate(expressions, group_by))
+
+    def order(self, expressions: str) -> "ParquetRelation":
+        """Sort by the SQL *expressions*."""
+        return ParquetRelation(self.relation.order(expressions))
+
+    def limit(self, n: int, offset: int = 0) -> "ParquetRelation":
+        """Keep *n* rows, after skipping *offset* rows."""
+        return ParquetRelation(self.relation.limit(n, offset))
+
+    def sql(self, query: str, alias: str = "t") -> "ParquetRelation":
+        """Run a SQL *query* reading this relation as table *alias*."""
+        return ParquetRelation(self.relation.query(alias, query))
+
+    def to_arrow(self) -> pa.Table:
+        """Run the query and return the result as a PyArrow Table."""
+        return self.relation.to_arrow_table()
+
+    def to_df(self) -> pd.DataFrame:
+        """Run the query and return the result as a DataFrame."""
+        return self.relation.df()
+
+    df = to_df
+
+    def fetchall(self) -> list[tuple]:
+        """Run the query and return the result as tuples."""
+        return self.relation.fetchall()
+
+    def iter_batches(
+        self, batch_size: int = 1_000_000
+    ) -> Iterator[pa.RecordBatch]:
+        """Run the query, yielding record batches of *batch_size* rows.
+
+        Only a batch at a time is held in memory.
+        """
+        # to_arrow_reader replaced fetch_arrow_reader in DuckDB 1.5
+        reader = getattr(self.relation, "to_arrow_reader", None)
+        if reader is None:
+            reader = self.relation.fetch_arrow_reader
+        yield from reader(batch_size)
@@ -0,0 +1,167 @@
+"""Cached metadata of local files, kept under ``CACHEPATH``.
+
+Detecting the encoding, separator, columns or row count of a large file
+can take a full read of it. The results are kept in a small JSON file per
+source file under :data:`SIDECAR_DIR`, tagged with the file's path, size
+and modification time, so later instances of the same file get them
+without reading it; a file that changed gets none.
+
+Metadata files whose source file was deleted or changed are removed by
+:func:`prune_sidecars`, which also keeps at most :data:`MAX_SIDECARS` of
+them; it runs every :data:`PRUNE_EVERY` metadata files created.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from pysus import CACHEPATH
+
+#: Where the metadata files are written.
+SIDECAR_DIR: Path = Path(CACHEPATH) / "metadata"
+
+#: Metadata files kept by :func:`prune_sidecars`, the most recent ones.
+MAX_SIDECARS = 10_000
+
+#: Metadata files created by this process between two automatic prunes.
+PRUNE_EVERY = 1_000
+
+_created = 0
+
+
+def _sidecar_path(path: Path) -> Path:
+    digest = hashlib.sha1(str(path).encode()).hexdigest()
+    return SIDECAR_DIR / f"{digest}.json"
+
+
+def _stamp(path: Path) -> dict[str, Any]:
+    stat = path.stat()
+    return {
+        "path": str(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def read_sidecar(path: str | Path) -> dict[str, Any]:
+    """Return the cached metadata of *path*, empty if none is current.
+
+    Parameters
+    ----------
+    path : str or Path
+        The source file.
+
+    Returns
+    -------
+    dict
+        The values stored by :func:`update_sidecar`.
+    """
+    path = Path(path).expanduser().resolve()
+    try:
+        stamp = _stamp(path)
+        data = json.loads(_sidecar_path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    if any(data.get(key) != value for key, value in stamp.items()):
+        return {}
+    return data.get("values", {})
+
+
+def update_sidecar(path: str | Path, **values: Any) -> dict[str, Any]:
+    """Store *values* in the cached metadata of *path*.
+
+    Values are merged into the current ones. The cache is best effort: a
+    sidecar that can't be written is skipped.
+
+    Parameters
+    ----------
+    path : str or Path
+        The source file.
+    **values
+        JSON-serializable metadata, such as ``encoding="latin-1"``.
+
+    Returns
+    -------
+    dict
+        All the cached values of *path*.
+    """
+    global _created
+
+    path = Path(path).expanduser().resolve()
+    merged = {**read_sidecar(path), **values}
+    target = _sidecar_path(path)
+    tmp = None
+    try:
+        data = {**_stamp(path), "values": merged}
+        SIDECAR_DIR.mkdir(parents=True, exist_ok=True)
+        created = not target.exists()
+        with tempfile.NamedTemporaryFile(
+            "w", dir=SIDECAR_DIR, suffix=".tmp", delete=False
+        ) as f:
+            tmp = Path(f.name)
+            json.dump(data, f)
+        os.replace(tmp, target)
+    except OSError:
+        if tmp is not None:
+            tmp.unlink(missing_ok=True)
+        return merged
+    if created:
+        _created += 1
+        if _created >= PRUNE_EVERY:
+            _created = 0
+            prune_sidecars(MAX_SIDECARS)
+    return merged
+
+
+def prune_sidecars(max_count: int | None = MAX_SIDECARS) -> int:
+    """Delete the metadata of missing or changed files, and the oldest.
+
+    Parameters
+    ----------
+    max_count : int, optional
+        Metadata files kept at most, the most recently written ones;
+        ``None`` keeps the metadata of every current file.
+
+    Returns
+    -------
+    int
+        The number of metadata files deleted.
+    """
+    kept = []
+    deleted = 0
+    for sidecar in SIDECAR_DIR.glob("*.json"):
+        try:
+            data = json.loads(sidecar.read_text())
+            mtime = sidecar.stat().st_mtime_ns
+        except (OSError, ValueError):
+            data, mtime = None, 0
+        try:
+            current = (
+                isinstance(data, dict)
+                and _stamp(Path(data["path"])).items() <= data.items()
+            )
+        except (OSError, KeyError, TypeError):
+            current = False
+        if current:
+            kept.append((mtime, sidecar))
+        else:
+            deleted += _remove(sidecar)
+
+    if max_count is not None and len(kept) > max_count:
+        kept.sort()
+        for _, sidecar in kept[: len(kept) - max_count]:
+            deleted += _remove(sidecar)
+    return deleted
+
+
+def _remove(sidecar: Path) -> bool:
+    try:
+        sidecar.unlink()
+    except OSError:
+        return False
+    return True
@@ -0,0 +1,374 @@
+"""State of the files PySUS downloaded, kept in a DuckDB database.
+
+Each downloaded or converted file has a :class:`LocalFileState` row with
+its remote origin and download status. :class:`LocalStateStore` answers
+the lookups of completed files from memory and commits status changes in
+batches, keeping the database open only for the length of a batch.
+"""
+
+import enum
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import (
+    Connection,
+    DateTime,
+    Enum,
+    Index,
+    Integer,
+    String,
+    create_engine,
+    delete,
+    event,
+    select,
+)
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
+from sqlalchemy.pool import NullPool
+from sqlalchemy.schema import CreateIndex
+
+
+class Base(DeclarativeBase):
+    """Base declarative class for SQLAlchemy ORM models."""
+
+
+class DownloadStatus(enum.Enum):
+    """Download status values tracked for each local file."""
+
+    PENDING = "pending"
+    DOWNLOADING = "downloading"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    MISSING = "missing"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _keep_wal_on_close(dbapi_connection: Any, _record: Any) -> None:
+    # checkpoints are made by the store, not on every disconnection
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA disable_checkpoint_on_shutdown")
+    cursor.close()
+
+
+def _checkpoint(conn: Connection) -> None:
+    """Move the WAL of the database into its file."""
+    conn.exec_driver_sql("CHECKPOINT")
+    conn.commit()
+
+
+class LocalFileState(Base):
+    """ORM model tracking the state of a downloaded local file."""
+
+    __tablename__ = "local_file_state"
+    __table_args__ = (
+        Index(
+            "ix_local_file_state_remote",
+            "remote_path",
+            "client_name",
+            "status",
+        ),
+    )
+
+    path: Mapped[str] = mapped_column(String, primary_key=True)
+    remote_path: Mapped[str] = mapped_column(String, nullable=False)
+    client_name: Mapped[str] = mapped_column(String, nullable=False)
+
+    year: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    month: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    state: Mapped[str | None] = mapped_column(String, nullable=True)
+    group: Mapped[str | None] = mapped_column(String, nullable=True)
+
+    status: Mapped[DownloadStatus] = mapped_column(
+        Enum(DownloadStatus),
+        default=DownloadStatus.PENDING,
+    )
+    sha256: Mapped[str | None] = mapped_column(String, nullable=True)
+    last_synced: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=_utcnow,
+    )
+
+
+class LocalStateStore:
+    """Long-lived store of the :class:`LocalFileState` rows of a database.
+
+    DuckDB locks a database file while a connection to it is open. Inside
+    :meth:`batch` the store keeps the connection it first opens until the
+    outermost batch ends; outside a batch it connects only to read or
+    commit. Other stores, in this or other processes, use the database in
+    between. The completed files are read on the first lookup and then
+    kept up to date by the writes of the store; they are read again when
+    the database files changed since, which means another store
+    committed.
+
+    Writes made inside :meth:`batch` are buffered and committed in one
+    transaction when the outermost batch ends, or every *batch_size*
+    writes. Outside a batch each write is committed right away. The WAL
+    is checkpointed into the database at the end of a batch and on
+    :meth:`close`.
+
+    Parameters
+    ----------
+    db_path : Path
+        Path to the DuckDB database file, created if missing.
+    batch_size : int
+        Buffered writes committed together at most.
+    """
+
+    def __init__(self, db_path: Path, batch_size: int = 256):
+        self.db_path = Path(db_path).resolve()
+        self.engine = create_engine(
+            f"duckdb:///{self.db_path.as_posix()}",
+            poolclass=NullPool,
+        )
+        event.listen(self.engine, "connect", _keep_wal_on_close)
+        Base.metadata.create_all(self.engine)
+        with self.engine.begin() as conn:
+            # create_all skips the indexes of tables that already exist
+            for index in LocalFileState.__table__.indexes:
+                conn.execute(CreateIndex(index, if_not_exists=True))
+        self.Session = sessionmaker(bind=self.engine)
+        self.batch_size = batch_size
+
+        self._pending: dict[str, dict[str, Any] | None] = {}
+        self._depth = 0
+        self._completed: dict[tuple[str, str], list[str]] | None = None
+        self._completed_keys: dict[str, tuple[str, str]] = {}
+        self._loaded_stamp: tuple | None = None
+        self._conn: Connection | None = None
+
+    def completed_paths(self, client_name: str, remote_path: str) -> list[str]:
+        """Return the local paths downloaded from *remote_path*.
+
+        Parquet files come first.
+        """
+        paths = self._index().get((client_name, remote_path), [])
+        return sorted(paths, key=lambda p: not p.endswith(".parquet"))
+
+    def completed_remote_paths(self) -> set[str]:
+        """Return the remote paths of every completed file."""
+        return {remote_path for _, remote_path in self._index()}
+
+    def records(self) -> list[LocalFileState]:
+        """Return every row of the database."""
+        self.flush()
+        with self._connect() as conn, self.Session(bind=conn) as session:
+            return list(session.scalars(select(LocalFileState)))
+
+    def write(
+        self,
+        path: str | Path,
+        remote_path: str,
+        client_name: str,
+        status: DownloadStatus,
+        year: int | None = None,
+        month: int | None = None,
+        state: str | None = None,
+        group: str | None = None,
+        sha256: str | None = None,
+    ) -> None:
+        """Set the status of *path*, adding its row if it has none.
+
+        The *sha256* digest is stored when given, and cleared when the file
+        is being downloaded again. The remaining fields are only stored
+        with a new row.
+        """
+        path = str(path)
+        entry = self._pending.get(path)
+        if entry is None:
+            entry = {
+                "remote_path": str(remote_path),
+                "client_name": client_name,
+                "year": year,
+                "month": month,
+                "state": state,
+                "group": group,
+                # a deleted row is replaced instead of updated
+                "replace": path in self._pending,
+            }
+            self._pending[path] = entry
+        entry["status"] = status
+        entry["last_synced"] = _utcnow()
+        if sha256 is not None or status is DownloadStatus.DOWNLOADING:
+            entry["sha256"] = sha256
+
+        self._forget(path)
+        if self._completed is not None and status is DownloadStatus.COMPLETED:
+            key = (entry["client_name"], entry["remote_path"])
+            self._completed.setdefault(key, []).append(path)
+            self._completed_keys[path] = key
+        self._maybe_flush()
+
+    def delete(self, path: str | Path) -> None:
+        """Delete the row of *path*."""
+        path = str(path)
+        self._pending[path] = None
+        self._forget(path)
+        self._maybe_flush()
+
+    @contextmanager
+    def batch(self) -> Iterator["LocalStateStore"]:
+        """Buffer the writes made until the context exits."""
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                try:
+                    self.flush()
+                finally:
+                    self._release()
+
+    def flush(self) -> None:
+        """Commit the buffered writes in one transaction."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        try:
+            self._commit(pending)
+        except Exception:
+            self._pending = {**pending, **self._pending}
+            raise
+
+    def close(self) -> None:
+        """Commit the buffered writes and close the database."""
+        self.flush()
+        with self._connect() as conn:
+            _checkpoint(conn)
+        self.engine.dispose()
+
+    def _stamp(self) -> tuple:
+        """Return the size and mtime of the database and its WAL file."""
+        stamp = []
+        for path in (self.db_path, Path(f"{self.db_path}.wal")):
+            try:
+                stat = path.stat()
+            except OSError:
+                stamp.append(None)
+            else:
+                stamp.append((stat.st_size, stat.st_mtime_ns))
+        return tuple(stamp)
+
+    @contextmanager
+    def _connect(self) -> Iterator[Connection]:
+        """Yield the connection of the batch, or a new one."""
+        if self._conn is not None:
+            yield self._conn
+            if self._conn.in_transaction():
+                self._conn.commit()
+            return
+        conn = self.engine.connect()
+        # the lock held by the connection keeps other stores from
+        # committing until it is closed
+        if self._stamp() != self._loaded_stamp:
+            self._completed = None
+        if self._depth:
+            self._conn = conn
+            yield conn
+            if conn.in_transaction():
+                conn.commit()
+            return
+        try:
+            yield conn
+            self._loaded_stamp = self._stamp()
+        finally:
+            conn.close()
+
+    def _release(self) -> None:
+        """Checkpoint and close the connection of the batch."""
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            _checkpoint(conn)
+            self._loaded_stamp = self._stamp()
+        finally:
+            conn.close()
+
+    def _commit(self, pending: dict[str, dict[str, Any] | None]) -> None:
+        with self._connect() as conn, self.Session(bind=conn) as session:
+            self._apply(session, pending)
+            session.commit()
+
+    def _apply(
+        self, session: Any, pending: dict[str, dict[str, Any] | None]
+    ) -> None:
+        deleted = [path for path, entry in pending.items() if entry is None]
+        written = {
+            path: entry for path, entry in pending.items() if entry is not None
+        }
+        if deleted:
+            session.execute(
+                delete(LocalFileState).where(LocalFileState.path.in_(deleted))
+            )
+        if not written:
+            return
+        existing = {
+            record.path: record
+            for record in session.scalars(
+                select(LocalFileState).where(
+                    LocalFileState.path.in_(list(written))
+                )
+            )
+        }
+        for path, entry in written.items():
+            entry = dict(entry)
+            replace = entry.pop("replace")
+            record = existing.get(path)
+            if record is None:
+                session.add(LocalFileState(path=path, **entry))
+                continue
+            if replace:
+                for key, value in entry.items():
+                    setattr(record, key, value)
+            else:
+                record.status = entry["status"]
+                record.last_synced = entry["last_synced"]
+                if "sha256" in entry:
+                    record.sha256 = entry["sha256"]
+
+    def _maybe_flush(self) -> None:
+        if not self._depth or len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def _index(self) -> dict[tuple[str, str], list[str]]:
+        # no other store commits while the batch holds the connection
+        if (
+            self._completed is not None
+            and self._conn is None
+            and self._stamp() != self._loaded_stamp
+        ):
+            self._completed = None
+        if self._completed is None:
+            self.flush()
+            with self._connect() as conn:
+                rows = conn.execute(
+                    select(
+                        LocalFileState.path,
+                        LocalFileState.client_name,
+                        LocalFileState.remote_path,
+                    ).where(LocalFileState.status == DownloadStatus.COMPLETED)
+                ).all()
+            completed: dict[tuple[str, str], list[str]] = {}
+            self._completed_keys = {}
+            for path, client_name, remote_path in rows:
+                key = (client_name, remote_path)
+                completed.setdefault(key, []).append(path)
+                self._completed_keys[path] = key
+            self._completed = completed
+        return self._completed
+
+    def _forget(self, path: str) -> None:
+        key = self._completed_keys.pop(path, None)
+        if key is None or self._completed is None:
+            return
+        paths = self._completed[key]
+        paths.remove(path)
+        if not paths:
+            del self._completed[key]
@@ -1,3 +1,8 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
 GEOCODE_PREFIXES = (
     "ID_MUNICIP",
     "ID_MN_RESI",
@@ -10,6 +15,23 @@ GEOCODE_PREFIXES = (
 )
 
 
+#: Codes whose published verification digit differs from the computed one.
+MISCALCULATED: dict[str, str] = {
+    "2201911": "2201919",
+    "2201986": "2201988",
+    "2202257": "2202251",
+    "2611531": "2611533",
+    "3117835": "3117836",
+    "3152139": "3152131",
+    "4305876": "4305871",
+    "5203963": "5203962",
+    "5203930": "5203939",
+}
+
+#: Digit weights of the IBGE verification digit.
+_DV_WEIGHTS = np.array([1, 2, 1, 2, 1, 2], dtype=np.uint8)
+
+
 def is_geocode_column(name: str) -> bool:
     """Check if a column name corresponds to an IBGE municipality code."""
     upper = name.upper()
@@ -33,20 +55,8 @@ def add_dv(geocode: str) -> str:
     if not geocode or not str(geocode).isdigit():
         return geocode
 
-    miscalculated = {
-        "2201911": "2201919",
-        "2201986": "2201988",
-        "2202257": "2202251",
-        "2611531": "2611533",
-        "3117835": "3117836",
-        "3152139": "3152131",
-        "4305876": "4305871",
-        "5203963": "5203962",
-        "5203930": "5203939",
-    }
-
     if len(str(geocode)) == 7:
-        return miscalculated.get(str(geocode), geocode)
+        return MISCALCULATED.get(str(geocode), geocode)
 
     if len(str(geocode)) == 6:
         weight = [1, 2, 1, 2, 1, 2]
@@ -59,6 +69,113 @@ def add_dv(geocode: str) -> str:
         )
         dv = 0 if total % 10 == 0 else 10 - (total % 10)
         code = str(geocode) + str(dv)
-        return miscalculated.get(code, code)
+        return MISCALCULATED.get(code, code)
 
     return geocode
+
+
+def add_dv_series(geocodes: pd.Series) -> pd.Series:
+    """Add the IBGE verification digit to a column of municipality codes.
+
+    The vectorized :func:`add_dv`: 6-digit codes get their digit computed
+    over the whole column at once, 7-digit codes are checked against
+    :data:`MISCALCULATED`, and other values are kept. Numbers are handled
+    as their text; missing values stay missing.
+
+    Parameters
+    ----------
+    geocodes : pd.Series
+        The municipality codes, as text, numbers or categories.
+
+    Returns
+    -------
+    pd.Series
+        The codes as ``string[pyarrow]`` (``category`` for categorical
+        input), with the index of *geocodes*.
+    """
+    if isinstance(geocodes.dtype, pd.CategoricalDtype):
+        categories = geocodes.cat.categories.to_series()
+        fixed = add_dv_series(categories.astype("string[pyarrow]"))
+        return geocodes.map(dict(zip(categories, fixed))).astype("category")
+
+    if pd.api.types.infer_dtype(geocodes, skipna=True) in ("string", "empty"):
+        codes = pa.array(geocodes, type=pa.string(), from_pandas=True)
+    else:
+        codes = pa.array(geocodes.astype("string[pyarrow]"))
+    if isinstance(codes, pa.ChunkedArray):
+        codes = codes.combine_chunks()
+    codes = codes.cast(pa.string())
+
+    six = pc.fill_null(pc.match_substring_regex(codes, "^[0-9]{6}$"), False)
+    positions = np.flatnonzero(six.to_numpy(zero_copy_only=False))
+    if positions.size:
+        # All-ASCII codes of equal length: their bytes are a digit matrix
+        selected = pc.take(codes, pa.array(positions))
+        data = np.frombuffer(
+            selected.buffers()[2], dtype=np.uint8, count=6 * positions.size
+        ).reshape(-1, 6)
+        products = (data - ord("0")) * _DV_WEIGHTS
+        total = (products // 10 + products % 10).sum(axis=1, dtype=np.int64)
+        dv = (10 - total % 10) % 10
+        with_dv = np.column_stack([data, (dv + ord("0")).astype(np.uint8)])
+        offsets = np.arange(0, 7 * positions.size + 1, 7, dtype=np.int32)
+        computed = pa.Array.from_buffers(
+            pa.string(),
+            positions.size,
+            [None, pa.py_buffer(offsets), pa.py_buffer(with_dv.tobytes())],
+        )
+        codes = pc.replace_with_mask(codes, six, computed)
+
+    known = pa.array(list(MISCALCULATED))
+    corrected = pc.take(
+        pa.array(list(MISCALCULATED.values())),
+        pc.index_in(codes, value_set=known),
+    )
+    codes = pc.coalesce(corrected, codes)
+    return pd.Series(
+        pd.arrays.ArrowStringArray(codes),
+        index=geocodes.index,
+        name=geocodes.name,
+    )
+
+
+def add_dv_macro(name: str = "add_dv") -> str:
+    """Return the SQL creating a DuckDB macro equivalent to :func:`add_dv`.
+
+    Lets queries add the verification digit inside DuckDB instead of
+    calling back into Python for each row. The macro is temporary (per
+    connection) and takes and returns ``VARCHAR``.
+
+    Parameters
+    ----------
+    name : str
+        Name of the macro.
+
+    Returns
+    -------
+    str
+        A ``CREATE OR REPLACE TEMP MACRO`` statement.
+    """
+    text = "CAST(geocode AS VARCHAR)"
+    terms = []
+    for i, weight in enumerate(_DV_WEIGHTS, start=1):
+        digit = f"CAST(substr({text}, {i}, 1) AS INTEGER)"
+        terms.append(
+            digit
+            if weight == 1
+            else f"(2 * {digit}) // 10 + (2 * {digit}) % 10"
+        )
+    total = " + ".join(f"({term})" for term in terms)
+    computed = f"{text} || CAST((10 - ({total}) % 10) % 10 AS VARCHAR)"
+    code = (
+        f"CASE WHEN regexp_full_match({text}, '[0-9]{{6}}') "
+        f"THEN {computed} ELSE {text} END"
+    )
+    fixes = " ".join(
+        f"WHEN '{wrong}' THEN '{right}'"
+        for wrong, right in MISCALCULATED.items()
+    )
+    return (
+        f"CREATE OR REPLACE TEMP MACRO {name}(geocode) AS "
+        f"CASE {code} {fixes} ELSE {code} END"
+    )
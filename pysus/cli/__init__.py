@@ -94,5 +94,45 @@ def web(
         stcli.main()
 
 
+@app.command()
+def relayout(
+    dry_run: bool = typer.Option(  # noqa: B008
+        False,
+        "--dry-run",
+        help="Only print the moves, without making them",
+    ),
+):
+    """Move the cached Parquet files to the partitioned layout."""
+    import asyncio
+    from pathlib import Path
+
+    from pysus.api.client import PySUS
+
+    async def _relayout() -> list[tuple[Path, Path]]:
+        async with PySUS() as pysus:
+            return pysus.relayout(dry_run=dry_run)
+
+    moves = asyncio.run(_relayout())
+    for old, new in moves:
+        print(f"{old} -> {new}")
+    print(f"{len(moves)} files {'to move' if dry_run else 'moved'}")
+
+
+@app.command()
+def prune_metadata(
+    max_count: int = typer.Option(  # noqa: B008
+        None,
+        "--max",
+        help="Metadata files kept at most, the most recent ones "
+        "(default: 10000)",
+    ),
+):
+    """Delete the cached metadata of deleted or changed files."""
+    from pysus.api.sidecar import MAX_SIDECARS, prune_sidecars
+
+    deleted = prune_sidecars(MAX_SIDECARS if max_count is None else max_count)
+    print(f"{deleted} metadata files deleted")
+
+
 if __name__ == "__main__":
     app()
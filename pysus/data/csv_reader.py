@@ -0,0 +1,299 @@
+"""Readers for large delimited text files.
+
+Counting the records of a multi-GB CSV through :mod:`csv` decodes and
+splits every line in Python. :func:`count_csv_records` reads the raw bytes
+in large blocks instead: a block without quote characters is counted with
+``bytes.count``, and in one with quotes each line feed is checked against
+the number of quotes before it (numpy ``searchsorted``), so that line
+breaks inside quoted fields are not counted.
+
+:func:`iter_csv_batches` reads the records into Arrow record batches with
+the multithreaded ``pyarrow.csv`` parser, for conversions that never need
+pandas. They read a file path or a stream, such as an archive member
+(see :mod:`pysus.data.sources`).
+"""
+
+import codecs
+import csv
+import io
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import BinaryIO
+
+import chardet
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+from .sources import Source, is_path, read_sample
+
+#: Bytes read per block when scanning a file.
+BLOCK_SIZE = 16 * 1024**2
+
+
+def count_csv_records(
+    path: str | Path,
+    quotechar: str = '"',
+    block_size: int = BLOCK_SIZE,
+) -> int:
+    """Return the number of records in a CSV file, header included.
+
+    Counts the line feeds outside quoted fields, plus a last record that
+    doesn't end with one, as :func:`csv.reader` would split the file.
+    Doubled quotes (``""``) inside a quoted field toggle the quote state
+    twice and need no special handling.
+
+    Parameters
+    ----------
+    path : str or Path
+        The CSV file.
+    quotechar : str
+        The single-byte quote character.
+    block_size : int
+        Bytes read at a time.
+
+    Returns
+    -------
+    int
+    """
+    quote = ord(quotechar)
+    newlines = 0
+    in_quotes = False
+    last = None
+    with open(path, "rb") as f:
+        while block := f.read(block_size):
+            last = block[-1]
+            if not in_quotes and quote not in block:
+                newlines += block.count(b"\n")
+                continue
+            data = np.frombuffer(block, dtype=np.uint8)
+            quotes = np.flatnonzero(data == quote)
+            breaks = np.flatnonzero(data == ord("\n"))
+            # a line feed is outside quotes if an even number precede it
+            before = np.searchsorted(quotes, breaks) + in_quotes
+            newlines += int(np.count_nonzero((before & 1) == 0))
+            in_quotes = (len(quotes) + in_quotes) % 2 == 1
+    if last is None:
+        return 0
+    return newlines + (last != ord("\n"))
+
+
+#: Bytes of input the Arrow reader parses at a time. Its background
+#: reader queues a few dozen blocks ahead of the parser, so this bounds
+#: memory as much as speed.
+ARROW_BLOCK_SIZE = 1024**2
+
+_UTF8 = frozenset({"utf-8", "utf8", "ascii", "us-ascii"})
+
+#: Bytes sampled to detect the encoding and the delimiter of a CSV.
+SAMPLE_SIZE = 300 * 1024
+
+
+def detect_encoding(sample: bytes) -> str:
+    """Return the encoding chardet detects in *sample*.
+
+    ASCII, or no confident guess, is reported as ``"iso-8859-1"``: the
+    encoding of most DATASUS files, which reads any byte.
+    """
+    encoding = chardet.detect(sample)["encoding"]
+    if encoding is None or encoding.lower() == "ascii":
+        return "iso-8859-1"
+    return encoding
+
+
+def detect_delimiter(text: str) -> str:
+    """Return the delimiter :class:`csv.Sniffer` finds in *text*, or ``","``."""
+    try:
+        return csv.Sniffer().sniff(text).delimiter
+    except csv.Error:
+        return ","
+
+
+def _decode_sample(sample: bytes, encoding: str) -> str:
+    """Decode *sample*, ignoring a character cut at its end."""
+    return codecs.getincrementaldecoder(encoding)().decode(sample)
+
+
+def sniff_csv(sample: bytes) -> tuple[str, str]:
+    """Return the encoding and the delimiter of a CSV from its first bytes.
+
+    For streams, which can't be reopened as text to sniff the delimiter;
+    undecodable bytes in *sample* are replaced.
+    """
+    encoding = detect_encoding(sample)
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    return encoding, detect_delimiter(decoder.decode(sample[: 10 * 1024]))
+
+
+def read_csv_header(
+    source: Source, encoding: str = "utf-8", delimiter: str = ","
+) -> list[str]:
+    """Return the column names in the first record of a CSV file."""
+    if encoding.lower() in _UTF8:
+        encoding = "utf-8-sig"  # Arrow skips the BOM as well
+    if is_path(source):
+        with open(source, encoding=encoding, newline="") as f:
+            return next(csv.reader(f, delimiter=delimiter), [])
+    text = _decode_sample(read_sample(source), encoding)
+    rows = csv.reader(io.StringIO(text, newline=""), delimiter=delimiter)
+    return next(rows, [])
+
+
+class TranscodingReader(io.RawIOBase):
+    """Read a file or stream in some encoding as UTF-8, a block at a time.
+
+    ``pyarrow.csv`` only parses UTF-8. This reader decodes *block_size*
+    bytes whenever the previous block has been consumed, with an
+    incremental decoder, so multi-byte characters may straddle blocks.
+
+    Parameters
+    ----------
+    source : str, Path or binary file object
+        A stream is read from its current position and left open.
+    encoding : str
+        Encoding of the file, such as ``"latin-1"``.
+    block_size : int
+        Bytes decoded at a time.
+    """
+
+    def __init__(
+        self,
+        source: Source,
+        encoding: str,
+        block_size: int = ARROW_BLOCK_SIZE,
+    ):
+        super().__init__()
+        self._owned = is_path(source)
+        self._file = open(source, "rb") if self._owned else source
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._block_size = block_size
+        self._buffer = b""
+        self._offset = 0
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            return b"".join(iter(lambda: self.read(self._block_size), b""))
+        while self._offset >= len(self._buffer) and not self._eof:
+            raw = self._file.read(self._block_size)
+            self._eof = not raw
+            text = self._decoder.decode(raw, final=self._eof)
+            self._buffer, self._offset = text.encode("utf-8"), 0
+        chunk = self._buffer[self._offset : self._offset + size]
+        self._offset += len(chunk)
+        return chunk
+
+    def readinto(self, buffer) -> int:
+        chunk = self.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    def close(self) -> None:
+        if self._owned:
+            self._file.close()
+        super().close()
+
+
+def csv_arrow_options(
+    source: Source,
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    typed: bool = False,
+    column_types: Mapping[str, pa.DataType] | None = None,
+    block_size: int = ARROW_BLOCK_SIZE,
+    use_threads: bool = True,
+) -> tuple[pacsv.ReadOptions, pacsv.ParseOptions, pacsv.ConvertOptions]:
+    """Return the ``pyarrow.csv`` options reading a CSV like PySUS does.
+
+    Columns are read as strings unless *typed*, in which case Arrow infers
+    their types; *column_types* fixes the types of the columns named.
+    Empty and ``NA``-like values are null, as with :func:`pandas.read_csv`,
+    and quoted fields may hold line breaks. The options expect UTF-8
+    input; see :func:`open_csv_source` for other encodings.
+    """
+    types = dict(column_types or {})
+    if not typed:
+        names = read_csv_header(source, encoding, delimiter)
+        types = {name: pa.string() for name in names} | types
+    read_options = pacsv.ReadOptions(
+        block_size=block_size, use_threads=use_threads
+    )
+    parse_options = pacsv.ParseOptions(
+        delimiter=delimiter, newlines_in_values=True
+    )
+    convert_options = pacsv.ConvertOptions(
+        column_types=types, strings_can_be_null=True
+    )
+    return read_options, parse_options, convert_options
+
+
+def open_csv_source(
+    source: Source, encoding: str, block_size: int = ARROW_BLOCK_SIZE
+) -> str | BinaryIO:
+    """Return what ``pyarrow.csv`` should read for a file in *encoding*.
+
+    UTF-8 and ASCII files and streams are read directly; others (DATASUS
+    dumps are mostly latin-1) through a :class:`TranscodingReader`.
+    """
+    if encoding.lower() in _UTF8:
+        return str(source) if is_path(source) else source
+    return TranscodingReader(source, encoding, block_size)
+
+
+def iter_csv_batches(
+    source: Source,
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    batch_size: int | None = None,
+    typed: bool = False,
+    column_types: Mapping[str, pa.DataType] | None = None,
+    block_size: int = ARROW_BLOCK_SIZE,
+    use_threads: bool = True,
+) -> Iterator[pa.RecordBatch]:
+    """Yield the records of a CSV file as Arrow record batches.
+
+    Built on ``pyarrow.csv.open_csv``: blocks of *block_size* bytes are
+    parsed in Arrow's thread pool while earlier batches are consumed, so
+    memory stays bounded by the blocks read ahead. With *typed*, types
+    are inferred from the first block; a later value that doesn't convert
+    raises ``pyarrow.ArrowInvalid``.
+
+    Parameters
+    ----------
+    source : str, Path or binary file object
+        A stream must be peekable (see :func:`~pysus.data.sources.peekable`)
+        and is read to its end but not closed.
+    encoding : str
+        Encoding of the file.
+    delimiter : str
+    batch_size : int, optional
+        Maximum rows per batch; batches are a block each by default.
+    typed, column_types, block_size, use_threads
+        See :func:`csv_arrow_options`.
+    """
+    if not read_csv_header(source, encoding, delimiter):
+        return  # empty file
+    reader = pacsv.open_csv(
+        open_csv_source(source, encoding, block_size),
+        *csv_arrow_options(
+            source,
+            encoding,
+            delimiter,
+            typed,
+            column_types,
+            block_size,
+            use_threads,
+        ),
+    )
+    try:
+        for batch in reader:
+            if batch_size is None:
+                yield batch
+                continue
+            for start in range(0, batch.num_rows, batch_size):
+                yield batch.slice(start, batch_size)
+    finally:
+        reader.close()
@@ -0,0 +1,152 @@
+"""Streaming reader for DATASUS DBC files.
+
+A DBC is a DBF whose records are compressed with PKWare DCL implode, behind
+an uncompressed copy of the DBF header. ``pyreaddbc`` only decompresses
+file to file, and holds the GIL while it does, so the decompressor runs in
+a child process writing into an OS pipe while this process decodes records
+from the read end as they arrive. No temporary DBF is written and memory is
+bounded by the batch size plus the pipe buffer.
+"""
+
+import os
+import subprocess
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO
+
+import pyarrow as pa
+
+from .dbf_reader import DBFSchema, DBFStreamReader, Dictionary, _parse_header
+
+# Child process: decompress argv[1] into the inherited pipe at argv[2].
+_DECOMPRESS = (
+    "import sys; from pyreaddbc import dbc2dbf; "
+    "dbc2dbf(sys.argv[1], sys.argv[2])"
+)
+
+#: Whether DBC files can be streamed through a pipe on this platform.
+#: Elsewhere callers fall back to decompressing into a temporary DBF.
+STREAMING_SUPPORTED = os.name == "posix" and os.path.isdir("/dev/fd")
+
+
+def read_dbc_schema(path: str | Path) -> DBFSchema:
+    """Return the DBF schema stored in the uncompressed DBC header."""
+    return _parse_header(path)
+
+
+@contextmanager
+def open_dbc(path: str | Path) -> Iterator[BinaryIO]:
+    """Yield a binary stream of the decompressed DBF bytes of *path*.
+
+    The stream is the read end of a pipe fed by a ``pyreaddbc`` child
+    process. On exit the pipe is closed and the child reaped; if it was
+    left before the end of the data the child is terminated.
+
+    Raises
+    ------
+    ValueError
+        If the decompressor reports an error. Errors raised while the
+        stream is being consumed are re-raised with the decompressor's
+        message attached.
+    """
+    path = Path(path)
+    if not STREAMING_SUPPORTED:
+        raise NotImplementedError("Streaming DBC requires POSIX pipes")
+    if not path.is_file():
+        raise FileNotFoundError(path)
+
+    read_fd, write_fd = os.pipe()
+    try:
+        proc = subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                _DECOMPRESS,
+                str(path),
+                f"/dev/fd/{write_fd}",
+            ],
+            pass_fds=(write_fd,),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+    except BaseException:
+        os.close(read_fd)
+        raise
+    finally:
+        os.close(write_fd)
+
+    stream = os.fdopen(read_fd, "rb")
+    try:
+        yield stream
+    except BaseException as err:
+        message = _finish(proc, stream)
+        if message and isinstance(err, ValueError):
+            raise ValueError(f"{err} ({path.name}: {message})") from err
+        raise
+    else:
+        message = _finish(proc, stream)
+        if message:
+            raise ValueError(f"Could not decompress {path.name}: {message}")
+
+
+def _finish(proc: subprocess.Popen, stream: BinaryIO) -> str:
+    """Close *stream*, reap *proc* and return what it reported, if anything.
+
+    Closing the read end first makes a child that is still writing fail
+    with a broken pipe, so it never blocks on a reader that went away.
+    """
+    stream.close()
+    try:
+        output, _ = proc.communicate(timeout=5)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        output, _ = proc.communicate()
+    # pyreaddbc prints its errors instead of raising; trailing bytes after
+    # the compressed stream are only a warning and the data is complete.
+    lines = output.decode("utf-8", "replace").splitlines()
+    message = " ".join(
+        line.strip()
+        for line in lines
+        if line.strip() not in ("", "Success")
+        and not line.startswith("blast warning")
+    )
+    if proc.returncode and not message:
+        message = f"decompressor exited with status {proc.returncode}"
+    return message
+
+
+def iter_dbc_batches(
+    path: str | Path,
+    columns: list[str] | None = None,
+    batch_size: int = 100_000,
+    encoding: str = "latin-1",
+    typed: bool = False,
+    dictionary: Dictionary = False,
+) -> Iterator[pa.RecordBatch]:
+    """Decompress a DBC file and stream its records as Arrow batches.
+
+    A single sequential pass: records are decoded as the decompressor
+    produces them, without a temporary DBF on disk.
+
+    Parameters
+    ----------
+    path : str or Path
+    columns, batch_size, encoding, typed
+        See :func:`pysus.data.dbf_reader.iter_dbf_batches`.
+    dictionary : bool or list[str]
+        See :func:`pysus.data.dbf_reader.iter_dbf_batches`. The stream
+        cannot be sampled ahead, so ``True`` picks the columns from the
+        first batch.
+
+    Yields
+    ------
+    pa.RecordBatch
+        Non-empty batches with the schema
+        ``read_dbc_schema(path).arrow_schema(typed, columns, encoded)``.
+    """
+    with open_dbc(path) as stream:
+        reader = DBFStreamReader(stream, encoding)
+        yield from reader.iter_batches(columns, batch_size, typed, dictionary)
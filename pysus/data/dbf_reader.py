@@ -5,16 +5,39 @@ numpy's frombuffer with structured dtypes, avoiding the per-row
 Python-object overhead of dbfread.
 
 Suitable for large DATASUS files (SIA-PA, PNI, etc.) where dbfread's
-row-by-row materialisation is the bottleneck.
+row-by-row materialisation is the bottleneck. Character columns are decoded
+a whole column buffer at a time into Arrow string arrays.
 """
 
+import codecs
+import functools
+import mmap
+import os
 import struct
-from collections.abc import Iterator
+import threading
+from collections import deque
+from collections.abc import Collection, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, BinaryIO, Literal
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+DTypeBackend = Literal["numpy", "pyarrow"]
+
+DBFFilter = tuple[str, str, Any]
+DBFFilters = list[DBFFilter] | list[list[DBFFilter]]
+Dictionary = bool | list[str]
+
+#: Records sampled to pick the fields to dictionary-encode with
+#: ``dictionary=True``.
+DICTIONARY_SAMPLE_SIZE = 10_000
+#: Most distinct values a sampled field may have to be dictionary-encoded.
+DICTIONARY_MAX_VALUES = 1_000
 
 
 @dataclass
@@ -23,6 +46,25 @@ class DBFField:
     type_: str
     length: int
     offset: int  # byte offset within record (includes delete-flag byte)
+    decimal: int = 0
+
+    @property
+    def arrow_type(self) -> pa.DataType:
+        """Return the native Arrow type of the field's values.
+
+        ``N`` fields without decimals that fit in 64 bits are integers,
+        other ``N`` and ``F`` fields are doubles, ``D`` are dates and ``L``
+        booleans; everything else is text.
+        """
+        if self.type_ == "N" and self.decimal == 0 and self.length < 19:
+            return pa.int64()
+        if self.type_ in ("N", "F"):
+            return pa.float64()
+        if self.type_ == "D":
+            return pa.date32()
+        if self.type_ == "L":
+            return pa.bool_()
+        return pa.string()
 
 
 @dataclass
@@ -42,29 +84,59 @@ class DBFSchema:
             spec.append((f.name, f"S{f.length}"))
         return np.dtype(spec)
 
+    def arrow_schema(
+        self,
+        typed: bool = False,
+        columns: list[str] | None = None,
+        dictionary: Collection[str] = (),
+    ) -> pa.Schema:
+        """Return the Arrow schema of the decoded records.
+
+        With *typed* each field gets its :attr:`DBFField.arrow_type`,
+        otherwise every field is a string. *columns* restricts the schema
+        to those fields (case-insensitive), in file order. Text fields
+        named in *dictionary* are ``dictionary<int32, string>``.
+        """
+        schema = []
+        for f in _select_fields(self, columns):
+            type_ = f.arrow_type if typed else pa.string()
+            if f.name in dictionary and pa.types.is_string(type_):
+                type_ = pa.dictionary(pa.int32(), type_)
+            schema.append((f.name, type_))
+        return pa.schema(schema)
+
 
 def _parse_header(path: str | Path) -> DBFSchema:
     """Parse a DBF header and return a ``DBFSchema``."""
     with open(path, "rb") as fh:
-        header = fh.read(32)
-        if len(header) < 32 or header[0] not in (
-            0x02,
-            0x03,
-            0x30,
-            0x31,
-            0x43,
-            0x63,
-            0x83,
-            0x8B,
-            0x8C,
-            0xF5,
-        ):
-            raise ValueError(f"Not a valid dBASE file: {path}")
-
-        num_records = struct.unpack("<I", header[4:8])[0]
-        header_len = struct.unpack("<H", header[8:10])[0]
-        record_len = struct.unpack("<H", header[10:12])[0]
-        field_bytes = fh.read(header_len - 32)
+        return _read_header(fh, path)
+
+
+def _read_header(fh: BinaryIO, name: Any) -> DBFSchema:
+    """Read a DBF header from the current position of *fh*.
+
+    Exactly ``header_len`` bytes are consumed, so a sequential stream is
+    left at the first record.
+    """
+    header = fh.read(32)
+    if len(header) < 32 or header[0] not in (
+        0x02,
+        0x03,
+        0x30,
+        0x31,
+        0x43,
+        0x63,
+        0x83,
+        0x8B,
+        0x8C,
+        0xF5,
+    ):
+        raise ValueError(f"Not a valid dBASE file: {name}")
+
+    num_records = struct.unpack("<I", header[4:8])[0]
+    header_len = struct.unpack("<H", header[8:10])[0]
+    record_len = struct.unpack("<H", header[10:12])[0]
+    field_bytes = fh.read(header_len - 32)
 
     fields = []
     offset = 1
@@ -81,7 +153,8 @@ def _parse_header(path: str | Path) -> DBFSchema:
         )
         type_ = chr(raw[11])
         length = raw[16]
-        fields.append(DBFField(name, type_, length, offset))
+        decimal = raw[17]
+        fields.append(DBFField(name, type_, length, offset, decimal))
         offset += length
         pos += 32
 
@@ -93,11 +166,261 @@ def _parse_header(path: str | Path) -> DBFSchema:
     )
 
 
-_ENCODING = "latin-1"
+@dataclass(frozen=True)
+class _Codec:
+    """Per-byte properties of a single-byte text encoding."""
+
+    utf8_len: np.ndarray  # (256,) UTF-8 length of each decoded character
+    whitespace: str  # decoded characters that ``str.strip`` removes
+    ascii_compatible: bool  # bytes < 0x80 decode to themselves
+
+
+@functools.lru_cache(maxsize=None)
+def _single_byte_codec(encoding: str) -> _Codec | None:
+    """Return the byte tables of *encoding*, if it is a single-byte codec.
+
+    Only single-byte codecs (latin-1, cp1252, ...) map every byte to exactly
+    one character, so only those can be decoded column-wise; multi-byte
+    codecs return ``None``.
+    """
+    chars = []
+    for b in range(256):
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        ch = decoder.decode(bytes([b]))
+        if len(ch) != 1:
+            return None
+        chars.append(ch)
+    return _Codec(
+        utf8_len=np.array(
+            [len(c.encode("utf-8")) for c in chars], dtype=np.uint8
+        ),
+        whitespace="".join(c for c in chars if c.isspace()),
+        ascii_compatible="".join(chars[:128]) == bytes(range(128)).decode(),
+    )
+
+
+def _transcode(arr: pa.Array, encoding: str, codec: _Codec) -> pa.Array:
+    """Re-encode a binary array from *encoding* to a UTF-8 string array.
+
+    The value buffer is decoded in one call; only the offsets of values
+    following a multi-byte UTF-8 character need shifting.
+    """
+    large = pa.types.is_large_binary(arr.type)
+    _, offsets_buf, data_buf = arr.buffers()
+    offsets = np.frombuffer(offsets_buf, dtype=np.int64 if large else np.int32)
+    offsets = offsets[arr.offset : arr.offset + len(arr) + 1].astype(np.int64)
+    values = (
+        np.frombuffer(data_buf, dtype=np.uint8)[offsets[0] : offsets[-1]]
+        if data_buf is not None
+        else np.empty(0, dtype=np.uint8)
+    )
+    offsets -= offsets[0]
+
+    data = values.tobytes().decode(encoding, errors="replace").encode("utf-8")
+
+    if codec.ascii_compatible:
+        wide = np.flatnonzero(values >= 0x80)
+    else:
+        wide = np.flatnonzero(codec.utf8_len[values] > 1)
+    extra = np.zeros(len(wide) + 1, dtype=np.int64)
+    np.cumsum(codec.utf8_len[values[wide]] - 1, out=extra[1:])
+    offsets += extra[np.searchsorted(wide, offsets)]
+
+    if offsets[-1] <= np.iinfo(np.int32).max:
+        type_, offsets = pa.string(), offsets.astype(np.int32)
+    else:
+        type_ = pa.large_string()
+    return pa.Array.from_buffers(
+        type_, len(arr), [None, pa.py_buffer(offsets), pa.py_buffer(data)]
+    )
+
+
+def _decode_column(col: np.ndarray, encoding: str) -> pa.Array:
+    """Decode a fixed-width ``S{n}`` column into an Arrow string array.
+
+    Equivalent to decoding every cell on its own: NUL bytes are dropped and
+    surrounding whitespace is stripped. For single-byte encodings the
+    column buffer is wrapped as an Arrow array without copying and decoded
+    with Arrow compute kernels, without a Python call per cell.
+    """
+    codec = _single_byte_codec(encoding)
+    if codec is None:
+        decoded = [
+            v.decode(encoding, errors="replace").replace("\x00", "").strip()
+            for v in col.tolist()
+        ]
+        return pa.array(decoded, type=pa.string())
+
+    n = len(col)
+    width = col.dtype.itemsize
+    raw = np.ascontiguousarray(col).view(np.uint8)
+    offsets = np.arange(n + 1, dtype=np.int64) * width
+    if n * width <= np.iinfo(np.int32).max:
+        type_, offsets = pa.binary(), offsets.astype(np.int32)
+    else:
+        type_ = pa.large_binary()
+    arr = pa.Array.from_buffers(
+        type_, n, [None, pa.py_buffer(offsets), pa.py_buffer(raw)]
+    )
+
+    if not raw.all():
+        arr = pc.replace_substring(arr, b"\x00", b"")
+    if codec.ascii_compatible and raw.max(initial=0) < 0x80:
+        arr = arr.cast(
+            pa.large_string() if type_ == pa.large_binary() else pa.string()
+        )
+    else:
+        arr = _transcode(arr, encoding, codec)
+    return pc.utf8_trim(arr, characters=codec.whitespace)
+
+
+_INT_PATTERN = r"^[+-]?\d+$"
+_FLOAT_PATTERN = r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$"
+
+
+def _parse_numbers(text: pa.Array, type_: pa.DataType) -> pa.Array:
+    """Cast decoded numeric text to *type_*; blanks and junk become null."""
+    pattern = _INT_PATTERN if pa.types.is_integer(type_) else _FLOAT_PATTERN
+    valid = pc.match_substring_regex(text, pattern)
+    return pc.if_else(valid, text, pa.scalar(None, text.type)).cast(type_)
+
+
+def _typed_column(field: DBFField, text: pa.Array) -> pa.Array:
+    """Parse a decoded fixed-width field into its native Arrow type.
+
+    The whole column is parsed with Arrow compute kernels; blank or
+    malformed values become nulls.
+    """
+    type_ = field.arrow_type
+    if pa.types.is_integer(type_) or pa.types.is_floating(type_):
+        return _parse_numbers(text, type_)
+    if pa.types.is_date(type_):
+        stamps = pc.strptime(
+            text, format="%Y%m%d", unit="s", error_is_null=True
+        )
+        return stamps.cast(pa.date32())
+    if pa.types.is_boolean(type_):
+        flag = pc.utf8_upper(text)
+        null = pa.scalar(None, pa.bool_())
+        return pc.if_else(
+            pc.is_in(flag, pa.array(["T", "Y"])),
+            True,
+            pc.if_else(pc.is_in(flag, pa.array(["F", "N"])), False, null),
+        )
+    return text
+
+
+_NULLABLE_DTYPES = {
+    pa.int64(): pd.Int64Dtype(),
+    pa.float64(): pd.Float64Dtype(),
+    pa.bool_(): pd.BooleanDtype(),
+}
+
+
+def _to_pandas(arr: pa.Array, dtype_backend: DTypeBackend = "numpy"):
+    """Convert a decoded Arrow column into a pandas array.
+
+    ``"numpy"`` returns an object array of ``str`` for text (the historical
+    output), nullable ``Int64``/``Float64``/``boolean`` arrays for numbers
+    and flags and ``datetime.date`` objects for dates. ``"pyarrow"``
+    returns pyarrow-backed arrays (``StringDtype`` for text). Dictionary
+    arrays become a ``Categorical`` with either backend.
+    """
+    if pa.types.is_dictionary(arr.type):
+        return arr.to_pandas().array
+    is_text = pa.types.is_string(arr.type)
+    is_text = is_text or pa.types.is_large_string(arr.type)
+    if dtype_backend == "pyarrow":
+        if is_text:
+            return pd.arrays.ArrowStringArray(arr)
+        return pd.arrays.ArrowExtensionArray(arr)
+    if is_text:
+        return arr.to_numpy(zero_copy_only=False)
+    return arr.to_pandas(types_mapper=_NULLABLE_DTYPES.get).array
+
+
+def _records_batch(
+    records: np.ndarray,
+    fields: list[DBFField],
+    encoding: str,
+    typed: bool = False,
+    dictionary: Collection[str] = (),
+) -> pa.RecordBatch:
+    """Decode the *fields* of a structured record array into a RecordBatch.
+
+    Text fields named in *dictionary* are dictionary-encoded.
+    """
+    arrays = []
+    for f in fields:
+        arr = _decode_column(records[f.name], encoding)
+        if typed:
+            arr = _typed_column(f, arr)
+        if f.name in dictionary and pa.types.is_string(arr.type):
+            arr = pc.dictionary_encode(arr)
+        arrays.append(arr)
+    return pa.RecordBatch.from_arrays(arrays, names=[f.name for f in fields])
+
+
+def _records_frame(
+    records: np.ndarray,
+    fields: list[DBFField],
+    encoding: str,
+    dtype_backend: DTypeBackend = "numpy",
+    typed: bool = False,
+    dictionary: Collection[str] = (),
+) -> pd.DataFrame:
+    """Decode the *fields* of a structured record array into a DataFrame."""
+    batch = _records_batch(records, fields, encoding, typed, dictionary)
+    return pd.DataFrame(
+        {
+            name: _to_pandas(arr, dtype_backend)
+            for name, arr in zip(batch.schema.names, batch.columns)
+        }
+    )
 
 
-def _decode(val: bytes) -> str:
-    return val.decode(_ENCODING, errors="replace").replace("\x00", "").strip()
+def _select_fields(
+    schema: DBFSchema, columns: list[str] | None
+) -> list[DBFField]:
+    """Return the fields named in *columns* (case-insensitive), or all."""
+    if columns is None:
+        return list(schema.fields)
+    cols_lower = {c.lower() for c in columns}
+    return [f for f in schema.fields if f.name.lower() in cols_lower]
+
+
+def _dictionary_fields(
+    records: np.ndarray | None,
+    fields: list[DBFField],
+    dictionary: Dictionary,
+    typed: bool = False,
+) -> frozenset[str]:
+    """Resolve *dictionary* to the names of the fields to dictionary-encode.
+
+    A list names the fields (case-insensitive). ``True`` picks the text
+    fields with at most :data:`DICTIONARY_MAX_VALUES` distinct raw values,
+    and no more than one per ten records, in an evenly spaced sample of
+    :data:`DICTIONARY_SAMPLE_SIZE` live *records* (only read in that
+    case); none under ten live records. Only fields decoded as text are
+    eligible.
+    """
+    text = [f for f in fields if not typed or pa.types.is_string(f.arrow_type)]
+    if dictionary is False or not text:
+        return frozenset()
+    if dictionary is not True:
+        wanted = {c.lower() for c in dictionary}
+        return frozenset(f.name for f in text if f.name.lower() in wanted)
+
+    if len(records) > DICTIONARY_SAMPLE_SIZE:
+        index = np.linspace(0, len(records) - 1, DICTIONARY_SAMPLE_SIZE)
+        records = records[index.astype(np.intp)]
+    records = records[records["_deleted"] != b"*"]
+    limit = min(DICTIONARY_MAX_VALUES, len(records) // 10)
+    if not limit:
+        return frozenset()
+    return frozenset(
+        f.name for f in text if len(np.unique(records[f.name])) <= limit
+    )
 
 
 def read_dbf_schema(path: str | Path) -> DBFSchema:
@@ -105,10 +428,414 @@ def read_dbf_schema(path: str | Path) -> DBFSchema:
     return _parse_header(path)
 
 
+class DBFReader:
+    """A DBF file opened for decoding, safe to share between threads.
+
+    The header is parsed once; the reader keeps the schema, the text
+    encoding, the record dtype and a read-only memory map of the file. The
+    methods never modify that state -- each call decodes into buffers of its
+    own -- so a single reader, or many readers over different files, can be
+    used from any number of threads at once. The map is opened on first use
+    and released by :meth:`close` or on leaving a ``with`` block.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to the DBF file.
+    encoding : str
+        Text encoding for character fields (default ``latin-1``, the encoding
+        DATASUS uses).
+    """
+
+    def __init__(self, path: str | Path, encoding: str = "latin-1"):
+        self.path = Path(path)
+        self.encoding = encoding
+        self.schema = _parse_header(self.path)
+        self.dtype = self.schema.build_dtype()
+        self._lock = threading.Lock()
+        self._mm: mmap.mmap | None = None
+        self._records: np.ndarray | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"DBFReader({str(self.path)!r}, encoding={self.encoding!r}, "
+            f"records={self.schema.num_records})"
+        )
+
+    def __enter__(self) -> "DBFReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory map.
+
+        Views handed out earlier keep the mapping alive until they are
+        garbage-collected; a closed reader re-opens the map if used again.
+        """
+        with self._lock:
+            mm, self._mm = self._mm, None
+            self._records = None
+        if mm is not None:
+            try:
+                mm.close()
+            except BufferError:
+                pass  # a caller still holds a view; unmapped once released
+
+    @property
+    def records(self) -> np.ndarray:
+        """All records as a zero-copy structured view of the mapped file."""
+        records = self._records
+        if records is not None:
+            return records
+        with self._lock:
+            if self._records is None:
+                n = self.schema.num_records
+                if n == 0:
+                    self._records = np.empty(0, dtype=self.dtype)
+                else:
+                    with open(self.path, "rb") as fh:
+                        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    self._records = np.frombuffer(
+                        mm, self.dtype, count=n, offset=self.schema.header_len
+                    )
+                    self._mm = mm
+            return self._records
+
+    def fields(self, columns: list[str] | None = None) -> list[DBFField]:
+        """Return the fields named in *columns* (case-insensitive), or all."""
+        return _select_fields(self.schema, columns)
+
+    def dictionary_fields(
+        self,
+        columns: list[str] | None = None,
+        dictionary: Dictionary = True,
+        typed: bool = False,
+    ) -> frozenset[str]:
+        """Return the names of the fields *dictionary* selects.
+
+        With ``True`` the low-cardinality text fields are detected from an
+        evenly spaced sample of the records; see :func:`iter_dbf_batches`.
+        """
+        records = self.records if dictionary is True else None
+        return _dictionary_fields(
+            records, self.fields(columns), dictionary, typed
+        )
+
+    def read(
+        self,
+        columns: list[str] | None = None,
+        dtype_backend: DTypeBackend = "numpy",
+        typed: bool = False,
+        workers: int | None = 1,
+        dictionary: Dictionary = False,
+    ) -> pd.DataFrame:
+        """Read every live record into a DataFrame.
+
+        See :func:`read_dbf_fast` for the parameters.
+        """
+        target = self.fields(columns)
+        n = self.schema.num_records
+        if n == 0:
+            return pd.DataFrame(columns=self.schema.field_names)
+
+        workers = _resolve_workers(workers)
+        if workers > 1:
+            batches = list(
+                self.iter_batches(
+                    columns=[f.name for f in target],
+                    batch_size=-(-n // workers),
+                    typed=typed,
+                    workers=workers,
+                    dictionary=dictionary,
+                )
+            )
+            if not batches:
+                return pd.DataFrame(columns=[f.name for f in target])
+            table = pa.Table.from_batches(batches).unify_dictionaries()
+            return pd.DataFrame(
+                {
+                    name: _to_pandas(col.combine_chunks(), dtype_backend)
+                    for name, col in zip(table.column_names, table.columns)
+                }
+            )
+
+        records = self.records
+        records = records[
+            records["_deleted"] != b"*"
+        ]  # skip deleted rows (matches dbfread)
+        if len(records) == 0:
+            return pd.DataFrame(columns=[f.name for f in target])
+
+        return _records_frame(
+            records,
+            target,
+            self.encoding,
+            dtype_backend,
+            typed,
+            _dictionary_fields(records, target, dictionary, typed),
+        )
+
+    def read_filtered(
+        self,
+        column: str | None = None,
+        values: list[str] | None = None,
+        columns: list[str] | None = None,
+        prefix_match: bool = True,
+        filters: DBFFilters | None = None,
+        chunk_size: int = 100_000,
+        typed: bool = False,
+        dictionary: Dictionary = False,
+    ) -> pd.DataFrame:
+        """Read only the records matching *column*/*values* and *filters*.
+
+        See :func:`read_dbf_filtered` for the parameters.
+        """
+        if column is None and not filters:
+            raise ValueError("Either column/values or filters must be given")
+
+        schema = self.schema
+        if schema.num_records == 0:
+            cols = columns or schema.field_names
+            return pd.DataFrame(columns=cols)
+
+        legacy = None
+        if column is not None:
+            # Bare (unpadded) targets. The prefix-vs-exact decision is made
+            # per value by comparing its length to the field width, so a
+            # value shorter than the field must NOT be pre-padded:
+            # pre-padding broke exact match (the scanned field is stripped
+            # of trailing padding).
+            legacy = (
+                _find_field(schema, column),
+                [val.encode(self.encoding) for val in values or []],
+            )
+        dnf = [
+            [(_find_field(schema, name), op, val) for name, op, val in conj]
+            for conj in _normalize_filters(filters)
+        ]
+
+        matched: list[np.ndarray] = []
+        for records in self._chunks(chunk_size):
+            mask = _scan_records(
+                records, legacy, prefix_match, dnf, self.encoding
+            )
+            if mask.any():
+                matched.append(records[mask])
+            del records
+
+        if not matched:
+            cols = columns or schema.field_names
+            return pd.DataFrame(columns=cols)
+
+        records = np.concatenate(matched)
+        target = self.fields(columns)
+        return _records_frame(
+            records,
+            target,
+            self.encoding,
+            typed=typed,
+            dictionary=_dictionary_fields(records, target, dictionary, typed),
+        )
+
+    def stream(
+        self,
+        chunk_size: int = 100_000,
+        dtype_backend: DTypeBackend = "numpy",
+        memory_map: bool = True,
+        typed: bool = False,
+        dictionary: Dictionary = False,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield the records as DataFrames of at most *chunk_size* rows.
+
+        See :func:`stream_dbf_fast` for the parameters.
+        """
+        fields = self.schema.fields
+        encoded = self.dictionary_fields(None, dictionary, typed)
+        for records in self._chunks(chunk_size, memory_map):
+            deleted = records["_deleted"] == b"*"
+            if deleted.any():
+                records = records[~deleted]  # skip deleted rows
+            frame = _records_frame(
+                records, fields, self.encoding, dtype_backend, typed, encoded
+            )
+            del records
+            yield frame
+
+    def iter_batches(
+        self,
+        columns: list[str] | None = None,
+        batch_size: int = 100_000,
+        typed: bool = False,
+        memory_map: bool = True,
+        workers: int | None = 1,
+        dictionary: Dictionary = False,
+    ) -> Iterator[pa.RecordBatch]:
+        """Yield the live records as Arrow record batches.
+
+        See :func:`iter_dbf_batches` for the parameters.
+        """
+        target = self.fields(columns)
+        workers = _resolve_workers(workers)
+        encoded = self.dictionary_fields(columns, dictionary, typed)
+        if workers > 1:
+            yield from self._iter_batches_parallel(
+                target, typed, batch_size, workers, encoded
+            )
+            return
+
+        for records in self._chunks(batch_size, memory_map):
+            batch = _live_batch(records, target, self.encoding, typed, encoded)
+            del records
+            if batch is not None:
+                yield batch
+
+    def _chunks(
+        self, chunk_size: int, memory_map: bool = True
+    ) -> Iterator[np.ndarray]:
+        """Yield structured record arrays of at most *chunk_size* rows.
+
+        With *memory_map* the arrays are zero-copy views into the mapped
+        file, whose pages are released after each step; otherwise each
+        chunk is read with one ``read`` call. Either way at most one chunk
+        of records is held in memory.
+        """
+        n = self.schema.num_records
+        rl = self.schema.record_len
+        if n == 0:
+            return
+
+        if not memory_map:
+            with open(self.path, "rb") as fh:
+                fh.seek(self.schema.header_len)
+                for start in range(0, n, chunk_size):
+                    count = min(chunk_size, n - start)
+                    raw = fh.read(count * rl)
+                    yield np.frombuffer(raw, self.dtype, count=count)
+            return
+
+        records = self.records
+        for start in range(0, n, chunk_size):
+            yield records[start : start + chunk_size]
+            mm = self._mm
+            if mm is not None:
+                offset = self.schema.header_len + start * rl
+                _drop_pages(mm, offset, offset + chunk_size * rl)
+
+    def _iter_batches_parallel(
+        self,
+        fields: list[DBFField],
+        typed: bool,
+        batch_size: int,
+        workers: int,
+        dictionary: Collection[str] = (),
+    ) -> Iterator[pa.RecordBatch]:
+        """Decode record ranges in a thread pool, yielding in file order.
+
+        Records have a fixed width, so the ``[start, start + batch_size)``
+        ranges of the mapped file are independent. The Arrow kernels doing
+        the decoding release the GIL, which lets the threads run on
+        separate cores.
+        """
+        n = self.schema.num_records
+        if n == 0:
+            return
+
+        records = self.records
+        ranges = (
+            records[start : start + batch_size]
+            for start in range(0, n, batch_size)
+        )
+        args = (fields, self.encoding, typed, dictionary)
+        pending: deque = deque()
+        pool = ThreadPoolExecutor(workers, thread_name_prefix="dbf-decode")
+        try:
+            for _, chunk in zip(range(2 * workers), ranges):
+                pending.append(pool.submit(_live_batch, chunk, *args))
+            while pending:
+                batch = pending.popleft().result()
+                chunk = next(ranges, None)
+                if chunk is not None:
+                    pending.append(pool.submit(_live_batch, chunk, *args))
+                del chunk
+                if batch is not None:
+                    yield batch
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            pending.clear()
+
+
+class DBFStreamReader:
+    """Decode a DBF read sequentially from a binary stream.
+
+    For sources that cannot be mapped or seeked, such as the read end of a
+    pipe fed by a decompressor. The header is consumed on construction and
+    records are read one batch at a time, so memory is bounded by the batch
+    size whatever the size of the file.
+
+    Parameters
+    ----------
+    stream : binary file object
+        Positioned at the start of the DBF header.
+    encoding : str
+        See :class:`DBFReader`.
+    """
+
+    def __init__(self, stream: BinaryIO, encoding: str = "latin-1"):
+        self.stream = stream
+        self.encoding = encoding
+        name = getattr(stream, "name", None)
+        self.schema = _read_header(
+            stream, name if isinstance(name, str) else "<stream>"
+        )
+        self.dtype = self.schema.build_dtype()
+
+    def iter_batches(
+        self,
+        columns: list[str] | None = None,
+        batch_size: int = 100_000,
+        typed: bool = False,
+        dictionary: Dictionary = False,
+    ) -> Iterator[pa.RecordBatch]:
+        """Yield the live records as Arrow record batches.
+
+        See :func:`iter_dbf_batches` for the parameters; with
+        ``dictionary=True`` the fields are picked from the first batch.
+        Raises ``ValueError`` if the stream ends before the number of
+        records announced in the header.
+        """
+        target = _select_fields(self.schema, columns)
+        encoded = None
+        n = self.schema.num_records
+        rl = self.schema.record_len
+        for start in range(0, n, batch_size):
+            count = min(batch_size, n - start)
+            raw = self.stream.read(count * rl)
+            if len(raw) < count * rl:
+                raise ValueError(
+                    f"Truncated DBF stream: header announces {n} records, "
+                    f"got {start + len(raw) // rl}"
+                )
+            records = np.frombuffer(raw, self.dtype, count=count)
+            if encoded is None:
+                encoded = _dictionary_fields(records, target, dictionary, typed)
+            batch = _live_batch(records, target, self.encoding, typed, encoded)
+            del records, raw
+            if batch is not None:
+                yield batch
+
+
 def read_dbf_fast(
     path: str | Path,
     columns: list[str] | None = None,
     encoding: str = "latin-1",
+    dtype_backend: DTypeBackend = "numpy",
+    typed: bool = False,
+    workers: int | None = 1,
+    dictionary: Dictionary = False,
 ) -> pd.DataFrame:
     """Read an entire DBF file into a DataFrame using vectorised byte access.
 
@@ -121,72 +848,53 @@ def read_dbf_fast(
     encoding : str
         Text encoding for character fields (default ``latin-1``, the encoding
         DATASUS uses).
+    dtype_backend : {"numpy", "pyarrow"}
+        ``"numpy"`` (default) returns object columns of ``str``;
+        ``"pyarrow"`` returns pyarrow-backed ``string`` columns.
+    typed : bool
+        If ``True`` parse ``N``/``F`` fields into numbers, ``D`` into dates
+        and ``L`` into booleans (blank or malformed values become missing);
+        by default every field is returned as text.
+    workers : int, optional
+        Number of threads decoding disjoint record ranges concurrently
+        (``None`` uses every CPU). The ranges are reassembled in file
+        order, so the result does not depend on *workers*.
+    dictionary : bool or list[str]
+        Text columns to return as ``category``: a list of names, or
+        ``True`` to pick the low-cardinality ones (see
+        :func:`iter_dbf_batches`). ``False`` (default) decodes none.
 
     Returns
     -------
     pd.DataFrame
     """
-    global _ENCODING
-    _ENCODING = encoding
-
-    path = Path(path)
-    schema = _parse_header(path)
-    n = schema.num_records
-    if n == 0:
-        return pd.DataFrame(columns=schema.field_names)
-
-    cols_lower = None if columns is None else {c.lower() for c in columns}
-    target = [
-        f
-        for f in schema.fields
-        if cols_lower is None or f.name.lower() in cols_lower
-    ]
-    dtype = schema.build_dtype()
-
-    with open(path, "rb") as fh:
-        fh.seek(schema.header_len)
-        raw = fh.read(n * schema.record_len)
-
-    records: np.ndarray = np.frombuffer(raw, dtype=dtype, count=n)
-    records = records[
-        records["_deleted"] != b"*"
-    ]  # skip deleted rows (matches dbfread)
-    n = len(records)
-    if n == 0:
-        return pd.DataFrame(columns=[f.name for f in target])
-
-    data = {}
-    for fld in target:
-        col: np.ndarray = records[fld.name]
-        decoded = np.empty(n, dtype=object)
-        for i in range(n):
-            val = col[i]
-            b = val if isinstance(val, bytes) else val.tobytes()
-            decoded[i] = _decode(b)
-        data[fld.name] = decoded
-
-    return pd.DataFrame(data)
+    with DBFReader(path, encoding) as reader:
+        return reader.read(columns, dtype_backend, typed, workers, dictionary)
 
 
 def read_dbf_filtered(
     path: str | Path,
-    column: str,
-    values: list[str],
+    column: str | None = None,
+    values: list[str] | None = None,
     columns: list[str] | None = None,
     encoding: str = "latin-1",
     prefix_match: bool = True,
+    filters: DBFFilters | None = None,
+    chunk_size: int = 100_000,
+    typed: bool = False,
+    dictionary: Dictionary = False,
 ) -> pd.DataFrame:
-    """Read only DBF records where *column* matches one of *values*.
+    """Read only DBF records matching *column*/*values* and/or *filters*.
 
-    The scan is performed at the byte level -- unmatched rows are never
-    decoded or materialised.
+    The scan is performed on the raw record bytes with vectorised numpy
+    comparisons -- unmatched rows are never decoded or materialised.
 
     Parameters
     ----------
     path : str or Path
-    column : str
+    column : str, optional
         Column name to filter on.
-    values : list[str]
+    values : list[str], optional
         Target values.  For ``prefix_match=True`` a 3-char value will
         match any longer value that starts with it.
     columns : list[str], optional
@@ -194,44 +902,64 @@ def read_dbf_filtered(
     encoding : str
     prefix_match : bool
         If ``True``, a value of length < field length acts as a prefix.
+    filters : list of tuples or list of lists of tuples, optional
+        Predicates in disjunctive normal form, like ``pyarrow.parquet``:
+        ``(column, op, value)`` tuples in a list are AND-ed, and a list of
+        such lists is OR-ed. Supported ops are ``"=="``, ``"in"``,
+        ``"prefix"`` (a string or a list of prefixes), ``"between"``
+        (inclusive ``(low, high)``) and ``"<"``, ``"<="``, ``">"``,
+        ``">="``. Values are compared as raw bytes with trailing padding
+        removed, which orders ``YYYYMMDD`` dates correctly; blank fields
+        never satisfy a range. Combined with *column*/*values* by AND.
+    chunk_size : int
+        Number of records scanned per step.
+    typed : bool
+        See :func:`read_dbf_fast`. Filters always compare the raw text.
+    dictionary : bool or list[str]
+        See :func:`read_dbf_fast`; detection samples the matched records.
 
     Returns
     -------
     pd.DataFrame
     """
-    global _ENCODING
-    _ENCODING = encoding
-
-    path = Path(path)
-    schema = _parse_header(path)
-    n = schema.num_records
-    if n == 0:
-        cols = columns or schema.field_names
-        return pd.DataFrame(columns=cols)
-
-    filter_field = _find_field(schema, column)
-
-    # Bare (unpadded) targets. The prefix-vs-exact decision is made per value
-    # in _scan_column by comparing the value length to the field width, so a
-    # value shorter than the field must NOT be pre-padded: pre-padding broke
-    # exact match (the scanned chunk is stripped of trailing padding first).
-    target_bytes: list[bytes] = [val.encode(encoding) for val in values]
-
-    matches = _scan_column(
-        path, schema, filter_field, target_bytes, prefix_match
-    )
+    if column is None and not filters:
+        raise ValueError("Either column/values or filters must be given")
+
+    with DBFReader(path, encoding) as reader:
+        return reader.read_filtered(
+            column,
+            values,
+            columns,
+            prefix_match,
+            filters,
+            chunk_size,
+            typed,
+            dictionary,
+        )
+
 
-    if not matches:
-        cols = columns or schema.field_names
-        return pd.DataFrame(columns=cols)
+def _drop_pages(mm: mmap.mmap, start: int, end: int) -> None:
+    """Tell the kernel the mapped bytes ``[start, end)`` are no longer needed.
 
-    return _materialize_rows(path, schema, matches, columns)
+    Keeps the resident set of a streamed file bounded by the chunk size; the
+    pages stay in the page cache and are simply re-faulted if touched again.
+    """
+    if not hasattr(mmap, "MADV_DONTNEED"):
+        return
+    start -= start % mmap.PAGESIZE
+    end = min(end, len(mm))
+    if end > start:
+        mm.madvise(mmap.MADV_DONTNEED, start, end - start)
 
 
 def stream_dbf_fast(
     path: str | Path,
     chunk_size: int = 100_000,
     encoding: str = "latin-1",
+    dtype_backend: DTypeBackend = "numpy",
+    memory_map: bool = True,
+    typed: bool = False,
+    dictionary: Dictionary = False,
 ) -> Iterator[pd.DataFrame]:
     """Stream records from a DBF file in chunks using vectorised byte access.
 
@@ -241,46 +969,107 @@ def stream_dbf_fast(
     chunk_size : int
         Number of rows per chunk.
     encoding : str
+    dtype_backend : {"numpy", "pyarrow"}
+        See :func:`read_dbf_fast`.
+    memory_map : bool
+        If ``True`` (default) decode each chunk straight from a read-only
+        memory map of the file; if ``False`` read each chunk with a file
+        read. Peak memory depends on *chunk_size*, not on the file size.
+    typed : bool
+        See :func:`read_dbf_fast`.
+    dictionary : bool or list[str]
+        See :func:`read_dbf_fast`. The columns are chosen once, so every
+        chunk has the same dtypes.
 
     Yields
     ------
     pd.DataFrame
     """
-    global _ENCODING
-    _ENCODING = encoding
+    with DBFReader(path, encoding) as reader:
+        yield from reader.stream(
+            chunk_size, dtype_backend, memory_map, typed, dictionary
+        )
 
-    path = Path(path)
-    schema = _parse_header(path)
-    n = schema.num_records
-    rl = schema.record_len
-    dtype = schema.build_dtype()
 
-    with open(path, "rb") as fh:
-        fh.seek(schema.header_len)
-        raw = fh.read(n * rl)
+def iter_dbf_batches(
+    path: str | Path,
+    columns: list[str] | None = None,
+    batch_size: int = 100_000,
+    encoding: str = "latin-1",
+    typed: bool = False,
+    memory_map: bool = True,
+    workers: int | None = 1,
+    dictionary: Dictionary = False,
+) -> Iterator[pa.RecordBatch]:
+    """Stream records from a DBF file as Arrow record batches.
 
-    for start in range(0, n, chunk_size):
-        end = min(start + chunk_size, n)
-        chunk_n = end - start
-        chunk_raw = raw[start * rl : end * rl]
+    Columns are decoded straight from the record bytes into Arrow arrays,
+    without building pandas objects, so the batches can be handed to a
+    ``pyarrow.parquet.ParquetWriter`` as they are.
 
-        records: np.ndarray = np.frombuffer(
-            chunk_raw, dtype=dtype, count=chunk_n
+    Parameters
+    ----------
+    path : str or Path
+    columns : list[str], optional
+        Subset of columns to decode (case-insensitive). If *None* all
+        columns are returned.
+    batch_size : int
+        Maximum number of rows per batch.
+    encoding : str
+    typed : bool
+        See :func:`read_dbf_fast`.
+    memory_map : bool
+        See :func:`stream_dbf_fast`. Ignored when *workers* > 1, which
+        always maps the file.
+    workers : int, optional
+        Number of threads decoding consecutive batches concurrently
+        (``None`` uses every CPU). At most ``2 * workers`` batches are in
+        flight and they are yielded in file order.
+    dictionary : bool or list[str]
+        Text columns to dictionary-encode, which keeps repetitive codes
+        (UF, sex, outcome...) compact in memory and in Parquet. A list
+        names them; ``True`` picks every text column with at most
+        :data:`DICTIONARY_MAX_VALUES` distinct values, and no more than
+        one per ten records, in a sample of
+        :data:`DICTIONARY_SAMPLE_SIZE` records spread over the file. Each
+        batch carries its own dictionary.
+
+    Yields
+    ------
+    pa.RecordBatch
+        Non-empty batches, all with the schema
+        ``read_dbf_schema(path).arrow_schema(typed, columns, encoded)``,
+        ``encoded`` being the dictionary-encoded column names. Deleted
+        records are skipped.
+    """
+    with DBFReader(path, encoding) as reader:
+        yield from reader.iter_batches(
+            columns, batch_size, typed, memory_map, workers, dictionary
         )
-        records = records[records["_deleted"] != b"*"]  # skip deleted rows
-        chunk_n = len(records)
 
-        data = {}
-        for fld in schema.fields:
-            col: np.ndarray = records[fld.name]
-            decoded = np.empty(chunk_n, dtype=object)
-            for i in range(chunk_n):
-                val = col[i]
-                b = val if isinstance(val, bytes) else val.tobytes()
-                decoded[i] = _decode(b)
-            data[fld.name] = decoded
 
-        yield pd.DataFrame(data)
+def _resolve_workers(workers: int | None) -> int:
+    if workers is None:
+        return os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be a positive integer, not {workers}")
+    return workers
+
+
+def _live_batch(
+    records: np.ndarray,
+    fields: list[DBFField],
+    encoding: str,
+    typed: bool,
+    dictionary: Collection[str] = (),
+) -> pa.RecordBatch | None:
+    """Decode the live (non-deleted) *records*; ``None`` if there are none."""
+    deleted = records["_deleted"] == b"*"
+    if deleted.any():
+        records = records[~deleted]
+    if not len(records):
+        return None
+    return _records_batch(records, fields, encoding, typed, dictionary)
 
 
 def _find_field(schema: DBFSchema, name: str) -> DBFField:
@@ -293,70 +1082,105 @@ def _find_field(schema: DBFSchema, name: str) -> DBFField:
     )
 
 
-def _scan_column(
-    path: Path,
-    schema: DBFSchema,
-    field: DBFField,
-    target_bytes: list[bytes],
+_RANGE_OPS = {
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+}
+_FILTER_OPS = {"==", "=", "in", "prefix", "between", *_RANGE_OPS}
+
+
+def _normalize_filters(
+    filters: DBFFilters | None,
+) -> list[list[DBFFilter]]:
+    """Return *filters* as a list of AND-ed conjunctions to be OR-ed."""
+    if not filters:
+        return []
+    if isinstance(filters[0], tuple):
+        dnf = [list(filters)]
+    else:
+        dnf = [list(conj) for conj in filters]  # type: ignore[union-attr]
+    for conj in dnf:
+        for _, op, _ in conj:
+            if op not in _FILTER_OPS:
+                raise ValueError(f"Unsupported filter operator: {op!r}")
+    return dnf  # type: ignore[return-value]
+
+
+def _stripped(records: np.ndarray, field: DBFField) -> np.ndarray:
+    """Return *field*'s bytes without the trailing space/NUL padding."""
+    return np.strings.rstrip(records[field.name], b"\x00 ")
+
+
+def _predicate_mask(
+    data: np.ndarray,
+    op: str,
+    value,
+    encoding: str,
+) -> np.ndarray:
+    """Evaluate one ``(column, op, value)`` predicate over stripped bytes."""
+
+    def enc(v) -> bytes:
+        return str(v).encode(encoding)
+
+    if op in ("==", "="):
+        return data == enc(value)
+    if op == "in":
+        return np.isin(data, np.array([enc(v) for v in value], dtype="S"))
+    if op == "prefix":
+        prefixes = [value] if isinstance(value, str) else value
+        mask = np.zeros(len(data), dtype=bool)
+        for prefix in prefixes:
+            mask |= np.strings.startswith(data, enc(prefix))
+        return mask
+    if op == "between":
+        low, high = value
+        return (data != b"") & (data >= enc(low)) & (data <= enc(high))
+    return (data != b"") & _RANGE_OPS[op](data, enc(value))
+
+
+def _scan_records(
+    records: np.ndarray,
+    legacy: tuple[DBFField, list[bytes]] | None,
     prefix_match: bool,
-) -> list[int]:
-    """Scan *field* for any of *target_bytes*; return matching row indices."""
-    matches: list[int] = []
-    field_width = field.length
-    field_offset_in_record = field.offset
-
-    with open(path, "rb") as fh:
-        for row_idx in range(schema.num_records):
-            record_start = schema.header_len + row_idx * schema.record_len
-            fh.seek(record_start)
-            delete_flag = fh.read(1)
-            if delete_flag in (b"\x00", b"*"):
-                continue
-
-            fh.seek(record_start + field_offset_in_record)
-            chunk = fh.read(field_width)
-
-            stripped = chunk.rstrip(
-                b"\x00 "
-            )  # DATASUS pads with spaces and/or NULs
-            for target in target_bytes:
-                if prefix_match and len(target) < field_width:
-                    if stripped.startswith(target):
-                        matches.append(row_idx)
-                        break
-                else:
-                    if stripped == target:
-                        matches.append(row_idx)
-                        break
-
-    return matches
-
-
-def _materialize_rows(
-    path: Path,
-    schema: DBFSchema,
-    row_indices: list[int],
-    columns: list[str] | None,
-) -> pd.DataFrame:
-    """Read only the specified rows from the DBF and return a DataFrame."""
-    cols_lower = None if columns is None else {c.lower() for c in columns}
-    target_fields = [
-        f
-        for f in schema.fields
-        if cols_lower is None or f.name.lower() in cols_lower
-    ]
-
-    data: dict[str, list[str]] = {f.name: [] for f in target_fields}
-
-    with open(path, "rb") as fh:
-        for row_idx in row_indices:
-            offset = schema.header_len + row_idx * schema.record_len
-            fh.seek(offset)
-            record = fh.read(schema.record_len)
-            if len(record) < schema.record_len:
-                continue
-            for fld in target_fields:
-                raw = record[fld.offset : fld.offset + fld.length]
-                data[fld.name].append(_decode(raw))
-
-    return pd.DataFrame(data)
+    dnf: list[list[tuple[DBFField, str, object]]],
+    encoding: str,
+) -> np.ndarray:
+    """Return the boolean mask of live *records* matching every predicate."""
+    flags = records["_deleted"]
+    mask = (flags != b"*") & (flags != b"")  # b"" is a NUL flag byte
+
+    columns: dict[str, np.ndarray] = {}
+
+    def column(field: DBFField) -> np.ndarray:
+        if field.name not in columns:
+            columns[field.name] = _stripped(records, field)
+        return columns[field.name]
+
+    if legacy is not None:
+        field, targets = legacy
+        data = column(field)
+        match = np.zeros(len(records), dtype=bool)
+        exact = []
+        for target in targets:
+            if prefix_match and len(target) < field.length:
+                match |= np.strings.startswith(data, target)
+            else:
+                exact.append(target)
+        if exact:
+            match |= np.isin(data, np.array(exact, dtype="S"))
+        mask &= match
+
+    if dnf:
+        any_match = np.zeros(len(records), dtype=bool)
+        for conj in dnf:
+            conj_match = np.ones(len(records), dtype=bool)
+            for field, op, value in conj:
+                conj_match &= _predicate_mask(
+                    column(field), op, value, encoding
+                )
+            any_match |= conj_match
+        mask &= any_match
+
+    return mask
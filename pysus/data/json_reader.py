@@ -0,0 +1,502 @@
+"""Incremental readers for JSON Lines and JSON array files.
+
+The DEMAS endpoints of the Saude client are saved as JSON Lines with
+millions of rows, and OpenDataSUS publishes large top-level JSON arrays.
+Neither is read whole here: JSON Lines files are parsed a block at a time
+by ``pyarrow.json``, and JSON arrays are rewritten as JSON Lines blocks by
+a numpy scan of their structure and handed to the same parser.
+Both produce Arrow record batches of one schema, inferred from the first
+block, so they can be written to Parquet as they are read.
+
+:func:`iter_json_text_batches` is the fallback for files Arrow can't read
+with one schema (a column changing type, a key first seen deep into the
+file): every value is kept as its JSON text.
+
+The batch readers also accept streams, such as archive members (see
+:mod:`pysus.data.sources`).
+"""
+
+import codecs
+import io
+import itertools
+import json
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.json as pajson
+
+from .sources import Source, is_path, open_binary, read_sample
+
+#: Bytes of input parsed at a time. A JSON Lines record must fit in one.
+BLOCK_SIZE = 1024**2
+
+#: Bytes read per block when counting records.
+SCAN_BLOCK_SIZE = 16 * 1024**2
+
+_WHITESPACE = " \t\r\n"
+_SPACE_BYTES = np.frombuffer(_WHITESPACE.encode(), dtype=np.uint8)
+
+#: Structural bytes of JSON: +1 opens a level, -1 closes one.
+_COMMA = 2
+_STRUCTURE = np.zeros(256, dtype=np.int8)
+_STRUCTURE[list(b"[{")] = 1
+_STRUCTURE[list(b"]}")] = -1
+_STRUCTURE[ord(",")] = _COMMA
+
+
+def iter_line_blocks(
+    source: Source, block_size: int = BLOCK_SIZE
+) -> Iterator[bytes]:
+    """Yield the bytes of a file or stream in blocks of whole lines.
+
+    Blocks are about *block_size* bytes; a line longer than that makes a
+    block of its own.
+    """
+    rest = b""
+    with open_binary(source) as f:
+        while data := f.read(block_size):
+            data = rest + data
+            end = data.rfind(b"\n") + 1
+            if not end:
+                rest = data
+                continue
+            rest = data[end:]
+            yield data[:end]
+    if rest:
+        yield rest
+
+
+def _count_lines(block: bytes) -> int:
+    """Return the number of non-blank lines in *block*."""
+    data = np.frombuffer(block, dtype=np.uint8)
+    starts = np.flatnonzero(data[:-1] == ord("\n")) + 1
+    if not len(data):
+        return 0
+    if (
+        not np.isin(data[starts], _SPACE_BYTES).any()
+        and not block[:1].isspace()
+    ):
+        return len(starts) + 1
+    # blank or indented lines
+    return sum(1 for line in block.split(b"\n") if line.strip())
+
+
+def count_jsonl_records(
+    path: str | Path, block_size: int = SCAN_BLOCK_SIZE
+) -> int:
+    """Return the number of non-blank lines of a JSON Lines file.
+
+    The starts of the lines are checked in numpy; only blocks with blank
+    or indented lines are split into lines.
+    """
+    return sum(map(_count_lines, iter_line_blocks(path, block_size)))
+
+
+def iter_jsonl_records(path: str | Path) -> Iterator[Any]:
+    """Yield the decoded values of a JSON Lines file, skipping blank lines."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def is_json_array(source: Source) -> bool:
+    """Return whether the JSON document in *source* is a top-level array.
+
+    A stream is peeked at, so its leading whitespace must fit in its
+    buffer.
+    """
+    if not is_path(source):
+        sample = read_sample(source).removeprefix(codecs.BOM_UTF8)
+        return sample.lstrip()[:1] == b"["
+    with open(source, encoding="utf-8-sig") as f:
+        while chunk := f.read(1024):
+            chunk = chunk.lstrip(_WHITESPACE)
+            if chunk:
+                return chunk[0] == "["
+    return False
+
+
+def iter_json_records(
+    path: str | Path, block_size: int = BLOCK_SIZE
+) -> Iterator[Any]:
+    """Yield the elements of a JSON array file, decoded one at a time.
+
+    Text is read *block_size* characters at a time and each element is
+    decoded with :meth:`json.JSONDecoder.raw_decode` once the buffer holds
+    all of it, so memory is bounded by the largest element. A document
+    that isn't an array is decoded whole and yielded as one record.
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If the document is not valid JSON.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8-sig") as f:
+        if not is_json_array(path):
+            text = f.read()
+            if text.strip(_WHITESPACE):
+                yield json.loads(text)
+            return
+
+        buffer, pos, eof = "", 0, False
+        after_element = False
+
+        def fill() -> None:
+            nonlocal buffer, pos, eof
+            data = f.read(block_size)
+            eof = not data
+            buffer, pos = buffer[pos:] + data, 0
+
+        fill()
+        pos = buffer.index("[") + 1
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos == len(buffer):
+                if eof:
+                    raise json.JSONDecodeError(
+                        "Unterminated array", buffer, pos
+                    )
+                fill()
+                continue
+            char = buffer[pos]
+            if char == "]":
+                return
+            if after_element:
+                if char != ",":
+                    raise json.JSONDecodeError(
+                        "Expecting ',' delimiter", buffer, pos
+                    )
+                pos += 1
+                after_element = False
+                continue
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                fill()  # the element continues in the next block
+                continue
+            if end == len(buffer) and not eof:
+                fill()  # a number may go on in the next block
+                continue
+            yield value
+            pos, after_element = end, True
+
+
+def _escaped(data: np.ndarray, carry: bool) -> tuple[np.ndarray, bool]:
+    """Return the positions in *data* escaped by a backslash.
+
+    In a run of backslashes every other one escapes the next byte.
+    *carry* tells whether the previous block ended with an escaping
+    backslash; the second value returned tells the same of *data*.
+    """
+    slashes = np.flatnonzero(data == ord("\\"))
+    if not slashes.size:
+        return np.arange(int(carry)), False
+    index = np.arange(len(slashes))
+    starts = np.ones(len(slashes), dtype=bool)
+    starts[1:] = np.diff(slashes) != 1
+    first = np.maximum.accumulate(np.where(starts, index, 0))
+    in_run = index - first
+    if carry and slashes[0] == 0:
+        in_run[first == 0] += 1  # the first backslash is escaped
+    escaped = slashes[in_run % 2 == 0] + 1
+    if carry:
+        escaped = np.concatenate([[0], escaped])
+    ends_escaping = bool(escaped.size) and escaped[-1] == len(data)
+    return escaped[escaped < len(data)], ends_escaping
+
+
+def iter_json_array_blocks(
+    source: Source, block_size: int = BLOCK_SIZE
+) -> Iterator[bytes]:
+    """Yield the elements of a JSON array file or stream as JSON Lines blocks.
+
+    The array is rewritten a block at a time, without decoding it: line
+    breaks (only whitespace between tokens in JSON) become spaces, the
+    commas between top-level elements line breaks, and the outer brackets
+    spaces. Strings are delimited by the quotes no backslash escapes, and
+    brackets outside them give the nesting depth, all found with numpy.
+    Blocks end after the last element they complete, so they are about
+    *block_size* bytes unless an element is longer. A document that isn't
+    an array is yielded as one line.
+    """
+    if not is_json_array(source):
+        with open_binary(source) as f:
+            text = f.read().removeprefix(codecs.BOM_UTF8)
+        if text.strip():
+            yield text.replace(b"\r", b" ").replace(b"\n", b" ") + b"\n"
+        return
+
+    in_string, escaping, depth = False, False, 0
+    rest = b""
+    with open_binary(source) as f:
+        bom = f.read(len(codecs.BOM_UTF8))
+        head = b"" if bom == codecs.BOM_UTF8 else bom
+        while data := head + f.read(block_size):
+            head = b""
+            block = np.frombuffer(data, dtype=np.uint8).copy()
+            escaped, escaping = _escaped(block, escaping)
+            quotes = np.flatnonzero(block == ord('"'))
+            if escaped.size:
+                quotes = np.setdiff1d(quotes, escaped, assume_unique=True)
+            kinds = _STRUCTURE[block]
+            marks = np.flatnonzero(kinds)
+            # outside strings, an even number of quotes precede a mark
+            outside = (np.searchsorted(quotes, marks) + in_string) % 2 == 0
+            marks = marks[outside]
+            in_string = (len(quotes) + in_string) % 2 == 1
+
+            kinds = kinds[marks]
+            delta = np.where(kinds == _COMMA, 0, kinds).astype(np.int64)
+            after = depth + np.cumsum(delta)
+            before = after - delta
+            if after.size:
+                depth = int(after[-1])
+            separators = marks[(kinds == _COMMA) & (before == 1)]
+            outer = ((before == 0) & (delta == 1)) | (
+                (after == 0) & (delta == -1)
+            )
+
+            block[(block == ord("\n")) | (block == ord("\r"))] = ord(" ")
+            block[marks[outer]] = ord(" ")
+            block[separators] = ord("\n")
+            if depth == 0 and outer.any():
+                # the array closed: end its last line
+                rest += block.tobytes()
+                if rest.strip():
+                    yield rest + b"\n"
+                rest = b""
+                continue
+            if not separators.size:
+                rest += block.tobytes()
+                continue
+            end = separators[-1] + 1
+            yield rest + block[:end].tobytes()
+            rest = block[end:].tobytes()
+    if rest.strip():
+        yield rest + b"\n"
+
+
+def count_json_records(
+    path: str | Path, block_size: int = SCAN_BLOCK_SIZE
+) -> int:
+    """Return the number of elements of a JSON array file.
+
+    Counted on the lines of :func:`iter_json_array_blocks`, one per
+    element; a document that isn't an array counts as one record.
+    """
+    blocks = iter_json_array_blocks(path, block_size)
+    return sum(block.count(b"\n") for block in blocks)
+
+
+def infer_json_schema(sample: bytes) -> pa.Schema:
+    """Return the schema ``pyarrow.json`` infers for a JSON Lines sample.
+
+    Columns null throughout the sample are typed as strings.
+
+    Raises
+    ------
+    pyarrow.ArrowInvalid
+        If the sample isn't JSON Lines of objects.
+    """
+    if not sample.strip():
+        return pa.schema([])
+    schema = pajson.read_json(io.BytesIO(sample)).schema
+    return pa.schema(
+        [
+            field.with_type(pa.string())
+            if pa.types.is_null(field.type)
+            else field
+            for field in schema
+        ]
+    )
+
+
+def _json_options(
+    schema: pa.Schema, block_size: int, use_threads: bool
+) -> tuple[pajson.ReadOptions, pajson.ParseOptions]:
+    read_options = pajson.ReadOptions(
+        use_threads=use_threads, block_size=block_size
+    )
+    # a key missing from the schema raises rather than being dropped
+    parse_options = pajson.ParseOptions(
+        explicit_schema=schema, unexpected_field_behavior="error"
+    )
+    return read_options, parse_options
+
+
+def _sliced(
+    batches: Iterable[pa.RecordBatch], batch_size: int | None
+) -> Iterator[pa.RecordBatch]:
+    for batch in batches:
+        if batch_size is None:
+            yield batch
+            continue
+        for start in range(0, batch.num_rows, batch_size):
+            yield batch.slice(start, batch_size)
+
+
+def iter_json_batches(
+    blocks: Iterable[bytes],
+    schema: pa.Schema | None = None,
+    batch_size: int | None = None,
+    use_threads: bool = True,
+) -> Iterator[pa.RecordBatch]:
+    """Parse JSON Lines *blocks* into Arrow record batches of one schema.
+
+    Parameters
+    ----------
+    blocks : iterable of bytes
+        Blocks of whole lines, such as :func:`iter_line_blocks` yields.
+    schema : pa.Schema, optional
+        Schema of the records; inferred from the first block by default.
+    batch_size : int, optional
+        Maximum rows per batch; batches are a block each by default.
+    use_threads : bool
+        Parse each block in Arrow's thread pool.
+
+    Raises
+    ------
+    pyarrow.ArrowInvalid
+        If a record doesn't fit the schema.
+    """
+    blocks = iter(blocks)
+    first = next(blocks, None)
+    if first is None:
+        return
+    if schema is None:
+        schema = infer_json_schema(first)
+    if not schema:
+        return
+
+    def parse() -> Iterator[pa.RecordBatch]:
+        for data in itertools.chain([first], blocks):
+            if data.strip():
+                options = _json_options(schema, len(data), use_threads)
+                table = pajson.read_json(io.BytesIO(data), *options)
+                yield from table.to_batches()
+
+    yield from _sliced(parse(), batch_size)
+
+
+def iter_jsonl_batches(
+    source: Source,
+    batch_size: int | None = None,
+    schema: pa.Schema | None = None,
+    block_size: int = BLOCK_SIZE,
+    use_threads: bool = True,
+) -> Iterator[pa.RecordBatch]:
+    """Yield the records of a JSON Lines file as Arrow record batches.
+
+    Built on ``pyarrow.json.open_json`` where available (pyarrow >= 19):
+    blocks of *block_size* bytes are parsed in Arrow's thread pool while
+    earlier batches are consumed. Older versions parse the blocks of
+    :func:`iter_line_blocks` one at a time.
+
+    Parameters
+    ----------
+    source : str, Path or binary file object
+        A stream is read to its end but not closed; without *schema* it
+        must be peekable (see :func:`~pysus.data.sources.peekable`).
+    batch_size : int, optional
+        Maximum rows per batch; batches are a block each by default.
+    schema : pa.Schema, optional
+        Schema of the records; inferred from the first block by default.
+    block_size : int
+        Bytes parsed at a time; longer lines raise ``pyarrow.ArrowInvalid``
+        with ``open_json``.
+    use_threads : bool
+        Parse in Arrow's thread pool.
+
+    Raises
+    ------
+    pyarrow.ArrowInvalid
+        If a record doesn't fit the schema.
+    """
+    open_json = getattr(pajson, "open_json", None)
+    if open_json is None:
+        blocks = iter_line_blocks(source, block_size)
+        yield from iter_json_batches(blocks, schema, batch_size, use_threads)
+        return
+    if schema is None:
+        sample = read_sample(source, block_size)
+        if len(sample) == block_size and b"\n" in sample:
+            sample = sample[: sample.rfind(b"\n") + 1]
+        schema = infer_json_schema(sample)
+    if not schema:
+        return  # no records
+    reader = open_json(
+        str(source) if is_path(source) else source,
+        *_json_options(schema, block_size, use_threads),
+    )
+    try:
+        yield from _sliced(reader, batch_size)
+    finally:
+        reader.close()
+
+
+def _as_text(value: Any) -> str | None:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+def iter_json_text_batches(
+    records: Callable[[], Iterable[Any]], batch_size: int = 10000
+) -> Iterator[pa.RecordBatch]:
+    """Yield JSON objects as record batches of text columns.
+
+    Reads the records twice: once for the union of their keys, in the
+    order they are first seen, and once to build the batches. Strings are
+    kept, nulls and missing keys are null, and other values are stored as
+    their JSON text.
+
+    Parameters
+    ----------
+    records : callable
+        Returns a new iterator over the records each time it's called,
+        such as ``partial(iter_jsonl_records, path)``.
+    batch_size : int
+        Rows per batch.
+
+    Raises
+    ------
+    ValueError
+        If a record is not a JSON object.
+    """
+
+    def objects() -> Iterator[dict]:
+        for record in records():
+            if not isinstance(record, dict):
+                raise ValueError(
+                    f"Expected JSON objects, not {type(record).__name__}"
+                )
+            yield record
+
+    names = list(dict.fromkeys(key for record in objects() for key in record))
+    if not names:
+        return
+    schema = pa.schema([(name, pa.string()) for name in names])
+
+    def batch(rows: list[dict]) -> pa.RecordBatch:
+        columns = [[_as_text(row.get(name)) for row in rows] for name in names]
+        return pa.RecordBatch.from_arrays(
+            [pa.array(c, pa.string()) for c in columns], schema=schema
+        )
+
+    rows: list[dict] = []
+    for record in objects():
+        rows.append(record)
+        if len(rows) >= batch_size:
+            yield batch(rows)
+            rows = []
+    if rows:
+        yield batch(rows)
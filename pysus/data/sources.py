@@ -0,0 +1,53 @@
+"""Inputs of the text readers: a file path or an open binary stream.
+
+Archive members are read as streams (see
+:meth:`~pysus.api.models.BaseCompressedFile.open_stream`), which can be
+neither reopened nor seeked. Readers needing a sample of their input
+before parsing it (a header row, the encoding, a schema) peek at the
+stream's buffer instead of reading it twice, so streams must be wrapped
+by :func:`peekable`.
+"""
+
+import io
+import os
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from typing import BinaryIO
+
+#: A file path or a peekable binary stream.
+Source = str | Path | BinaryIO
+
+#: Bytes a reader may peek at in a stream.
+PEEK_SIZE = 1024**2
+
+
+def is_path(source: Source) -> bool:
+    """Return whether *source* is a file path rather than a stream."""
+    return isinstance(source, (str, os.PathLike))
+
+
+def peekable(stream: BinaryIO, size: int = PEEK_SIZE) -> io.BufferedReader:
+    """Wrap *stream* so that its first *size* bytes can be peeked at."""
+    return io.BufferedReader(stream, buffer_size=size)
+
+
+def read_sample(source: Source, size: int = PEEK_SIZE) -> bytes:
+    """Return the first *size* bytes of *source* without consuming them.
+
+    A stream must not have been read from; see :func:`peekable`.
+    """
+    if is_path(source):
+        with open(source, "rb") as f:
+            return f.read(size)
+    return source.peek(size)[:size]
+
+
+def open_binary(source: Source) -> AbstractContextManager[BinaryIO]:
+    """Open a path for binary reading, or pass a stream through.
+
+    Use as a context manager; a stream is left open on exit, its owner
+    closes it.
+    """
+    if is_path(source):
+        return open(source, "rb")
+    return nullcontext(source)
@@ -9,11 +9,10 @@ single source of truth for every file tracked by the workflow.
 
 from __future__ import annotations
 
-import hashlib
 from datetime import datetime
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from pysus.api.digest import sha256_of  # noqa: F401
 from pysus.api.errors import CatalogError
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -55,15 +54,6 @@ _FILES_BASE_COLUMNS = (
 )
 
 
-def sha256_of(path: Path) -> str:
-    """Compute the sha256 digest of a local file."""
-    digest = hashlib.sha256()
-    with open(path, "rb") as f:
-        while chunk := f.read(1024 * 1024):
-            digest.update(chunk)
-    return digest.hexdigest()
-
-
 class CatalogWriter:
     """Upsert dataset/group/file/column metadata into the DuckLake catalogs."""
 
@@ -28,6 +28,7 @@ from uuid import uuid4
 
 import httpx
 from pysus import CACHEPATH
+from pysus.api.digest import HashingWriter, record_sha256
 from pysus.api.ducklake.functional import upload_s3
 from pysus.api.errors import AuthenticationError, ConnectionError
 from pysus.api.models import BaseRemoteFile
@@ -46,6 +47,7 @@ from .records import (
 
 if TYPE_CHECKING:  # pragma: no cover
     from pysus.api.client import PySUS
+    from pysus.api.conversion import ConversionPool
     from pysus.api.ducklake.client import DuckLake
 
 _RETRYABLE = (
@@ -69,11 +71,13 @@ class SyncEngine:
         secret_key: str | None = None,
         dadosgov_token: str | None = None,
         pysus: PySUS | None = None,
+        conversion_pool: ConversionPool | None = None,
     ):
         self.access_key = access_key
         self.secret_key = secret_key
         self.dadosgov_token = dadosgov_token
         self.pysus = pysus
+        self.conversion_pool = conversion_pool
         self._ducklake = None
         self._changed_catalog = False
 
@@ -301,9 +305,7 @@ class SyncEngine:
                     raise RuntimeError(
                         f"{file.basename}: cannot convert to parquet"
                     )
-                parquet_file = await local_file.to_parquet(
-                    callback=callback,
-                )
+                parquet_file = await self._to_parquet(local_file, callback)
                 parquet_digest = sha256_of(parquet_file.path)
 
                 if existing and not force:
@@ -371,6 +373,36 @@ class SyncEngine:
                     pass
             raise exc
 
+    def _pool(self) -> ConversionPool | None:
+        """The conversion pool: the engine's own, else the client's."""
+        from pysus.api.conversion import ConversionPool
+
+        pool = self.conversion_pool
+        if pool is None:
+            pool = getattr(self.pysus, "conversion_pool", None)
+        return pool if isinstance(pool, ConversionPool) else None
+
+    async def _to_parquet(
+        self,
+        local_file: Any,
+        callback: Callable[[int, int], None] | None = None,
+    ) -> Any:
+        """Convert *local_file*, in the conversion pool if there is one.
+
+        A worker process can't report its progress, so with a pool
+        *callback* is only called with ``(0, 1)`` when the conversion
+        starts and ``(1, 1)`` when it is done.
+        """
+        pool = self._pool()
+        if pool is None:
+            return await local_file.to_parquet(callback=callback)
+        if callback:
+            callback(0, 1)
+        parquet_file = await pool.convert(local_file.path)
+        if callback:
+            callback(1, 1)
+        return parquet_file
+
     def _dataset_adapter_by_name(self, dataset_name: str):
         """Return (and register) the per-dataset adapter for *name*."""
         return self._require_ducklake().get_dataset_adapter(dataset_name)
@@ -421,7 +453,7 @@ class SyncEngine:
         output: Path,
         ftp_client: Any | None = None,
     ) -> None:
-        """Perform one raw download to *output*."""
+        """Perform one raw download to *output*, recording its digest."""
         from anyio import to_thread
 
         client = ftp_client if ftp_client is not None else file.client
@@ -437,10 +469,11 @@ class SyncEngine:
 
             def _retr():
                 total = ftp.size(remote_path) or 0
-                with open(output, "wb") as f:
+                with HashingWriter(open(output, "wb")) as f:
                     ftp.retrbinary(
                         f"RETR {remote_path}", lambda chunk: f.write(chunk)
                     )
+                record_sha256(output, f.hexdigest())
                 return total
 
             try:
@@ -459,10 +492,11 @@ class SyncEngine:
             remote_path = str(file.path)
 
             def _direct_retr():
-                with open(output, "wb") as f:
+                with HashingWriter(open(output, "wb")) as f:
                     ftp.retrbinary(
                         f"RETR {remote_path}", lambda chunk: f.write(chunk)
                     )
+                record_sha256(output, f.hexdigest())
 
             await to_thread.run_sync(_direct_retr)
             return
@@ -813,7 +847,7 @@ class SyncEngine:
         local_file = await ExtensionFactory.instantiate(raw_path)
         if not hasattr(local_file, "to_parquet"):
             raise RuntimeError(f"{file.basename}: cannot convert to parquet")
-        parquet_file = await local_file.to_parquet(callback=callback)
+        parquet_file = await self._to_parquet(local_file, callback)
         try:
             parquet_digest = await to_thread.run_sync(
                 sha256_of, parquet_file.path
@@ -499,9 +499,18 @@ class TestDuckLakeDownloadFile:
                 remote_path=record.path,
                 local_path=output,
                 callback=None,
+                client=client._http,
             )
             assert result == output
 
+            # later downloads reuse the client and its connections
+            http = client._http
+            await client.download(f, output)
+            assert mock_dl.await_args.kwargs["client"] is http
+
+        await client.close()
+        assert client._http is None
+
 
 class TestDuckLakeUploadCatalog:
     @pytest.mark.asyncio
@@ -1,3 +1,4 @@
+import hashlib
 import pathlib
 from datetime import datetime
 from unittest.mock import MagicMock, patch
@@ -5,6 +6,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from pysus.api.errors import ConnectionError, ParseError
 from pysus.api.ftp.client import FTP
+from pysus.api.sidecar import read_sidecar
 
 
 @pytest.fixture
@@ -190,6 +192,52 @@ async def test_download_file_without_callback(ftp_client):
         await ftp_client.download(mock_file, pathlib.Path("test.dbc"))
 
 
+@pytest.mark.asyncio
+async def test_download_file_throttles_callback(ftp_client, tmp_path):
+    mock_ftp_internal = MagicMock()
+    mock_ftp_internal.size.return_value = 300 * 8192
+    ftp_client._ftp = mock_ftp_internal
+
+    mock_file = MagicMock()
+    mock_file.path = "remote/path.dbc"
+
+    def simulate_retrbinary(cmd, cb):
+        for _ in range(300):
+            cb(b"x" * 8192)
+
+    mock_ftp_internal.retrbinary.side_effect = simulate_retrbinary
+    calls = []
+
+    with patch("pysus.api.ftp.client.time.monotonic", return_value=0.0):
+        await ftp_client.download(
+            mock_file,
+            tmp_path / "test.dbc",
+            callback=lambda current, total: calls.append(current),
+        )
+    assert calls == [128 * 8192, 256 * 8192, 300 * 8192]
+
+
+@pytest.mark.asyncio
+async def test_download_file_records_digest(ftp_client, tmp_path):
+    mock_ftp_internal = MagicMock()
+    ftp_client._ftp = mock_ftp_internal
+
+    mock_file = MagicMock()
+    mock_file.path = "remote/path.dbc"
+
+    def simulate_retrbinary(cmd, cb):
+        cb(b"chunk_")
+        cb(b"data")
+
+    mock_ftp_internal.retrbinary.side_effect = simulate_retrbinary
+
+    output = await ftp_client.download(mock_file, tmp_path / "test.dbc")
+    assert output.read_bytes() == b"chunk_data"
+    assert read_sidecar(output)["sha256"] == (
+        hashlib.sha256(b"chunk_data").hexdigest()
+    )
+
+
 @pytest.mark.asyncio
 async def test_list_directory_calls_ftp_methods(ftp_client):
     mock_ftp_internal = MagicMock()
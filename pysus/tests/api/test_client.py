@@ -9,6 +9,7 @@ from pysus.api.errors import (
     FormatError,
     ValidationError,
 )
+from pysus.api.sidecar import read_sidecar
 
 
 @pytest.fixture
@@ -602,6 +603,41 @@ class TestDownload:
         final_call = mock_update.call_args_list[1]
         assert final_call.kwargs["status"] == DownloadStatus.COMPLETED
 
+    @pytest.mark.asyncio
+    async def test_download_commits_statuses_once(self, test_db_path):
+        from pysus.api.extensions import ExtensionFactory
+        from sqlalchemy import event
+
+        mock_file = MagicMock()
+        mock_file.size = 1000
+        mock_file.client.name = "ftp"
+        mock_file.path = "/remote/test.dbc"
+
+        client = PySUS(db_path=test_db_path)
+        client._state.completed_remote_paths()
+        connects = []
+        event.listen(
+            client._state.engine, "connect", lambda *args: connects.append(1)
+        )
+
+        with (
+            patch.object(
+                client,
+                "_get_dest_path",
+                return_value=test_db_path.parent / "test.dbc",
+            ),
+            patch.object(
+                ExtensionFactory, "instantiate", new_callable=AsyncMock
+            ),
+        ):
+            client._ftp = AsyncMock()
+            await client.download(mock_file)
+
+        assert len(connects) == 1
+        assert client._state.completed_remote_paths() == {"/remote/test.dbc"}
+
+        await client.__aexit__(None, None, None)
+
     @pytest.mark.asyncio
     async def test_download_re_fetches_when_size_differs(self, test_db_path):
         import pathlib
@@ -884,6 +920,46 @@ class TestDownloadToParquet:
 
         await client.__aexit__(None, None, None)
 
+    @pytest.mark.asyncio
+    async def test_download_to_parquet_conversion_pool(
+        self, test_db_path, tmp_path
+    ):
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        pool = MagicMock()
+        client = PySUS(db_path=test_db_path, conversion_pool=pool)
+
+        original_path = tmp_path / "test.dbc"
+        original_path.write_text("dummy content")
+        mock_parquet_file = MagicMock()
+        mock_parquet_file.path = tmp_path / "test.parquet"
+        pool.convert = AsyncMock(return_value=mock_parquet_file)
+
+        mock_local_file = MagicMock()
+        mock_local_file.path = original_path
+        mock_local_file.to_parquet = AsyncMock()
+
+        mock_file = MagicMock()
+        mock_file.path = "/remote/test.dbc"
+        mock_file.client.name = "ftp"
+
+        with (
+            patch.object(
+                client, "download", new=AsyncMock(return_value=mock_local_file)
+            ),
+            patch.object(client, "_update_state", new=AsyncMock()),
+            patch.object(client, "_delete_record", new=AsyncMock()),
+        ):
+            result = await client.download_to_parquet(mock_file)
+
+        assert result == mock_parquet_file
+        pool.convert.assert_awaited_once_with(
+            original_path, output_path=None, write_options=None
+        )
+        mock_local_file.to_parquet.assert_not_awaited()
+
+        await client.__aexit__(None, None, None)
+
     @pytest.mark.asyncio
     async def test_download_to_parquet_not_tabular_raises(self, test_db_path):
         from unittest.mock import AsyncMock, MagicMock, patch
@@ -907,6 +983,292 @@ class TestDownloadToParquet:
         await client.__aexit__(None, None, None)
 
 
+def _remote(name, origin, size=100):
+    file = MagicMock()
+    file.basename = name
+    file.size = size
+    file.client.name = origin
+    return file
+
+
+class TestDownloadMany:
+    @pytest.mark.asyncio
+    async def test_download_many_limits_origins(self, test_db_path):
+        import asyncio
+
+        client = PySUS(db_path=test_db_path)
+        files = [_remote(f"f{i}", "FTP") for i in range(6)] + [
+            _remote(f"d{i}", "DuckLake") for i in range(6)
+        ]
+        running = {"ftp": 0, "ducklake": 0}
+        peak = {"ftp": 0, "ducklake": 0, "all": 0}
+        started = []
+
+        async def download(file, token, callback, timeout, ftp=None):
+            origin = file.client.name.lower()
+            started.append(origin)
+            running[origin] += 1
+            peak[origin] = max(peak[origin], running[origin])
+            peak["all"] = max(peak["all"], sum(running.values()))
+            callback(50, 100)
+            await asyncio.sleep(0.01)
+            callback(100, 100)
+            running[origin] -= 1
+            return MagicMock(name=file.basename)
+
+        states = []
+
+        with (
+            patch.object(client, "_download", new=download),
+            patch.object(
+                client, "_acquire_ftp", new=AsyncMock(return_value=None)
+            ),
+        ):
+            results = [
+                result
+                async for result in client.download_many(
+                    files,
+                    concurrency=4,
+                    per_origin_limits={"ftp": 1},
+                    callback=lambda p: states.append(
+                        (p.files_done, p.bytes_done, p.bytes_total)
+                    ),
+                )
+            ]
+
+        assert {f for f, _ in results} == set(files)
+        assert peak["ftp"] == 1
+        assert peak["all"] == 4
+        assert started[:2] == ["ftp", "ducklake"]
+        assert states[-1] == (12, 1200, 1200)
+
+        await client.__aexit__(None, None, None)
+
+    @pytest.mark.asyncio
+    async def test_download_many_failures(self, test_db_path):
+        client = PySUS(db_path=test_db_path)
+        good, bad = _remote("good", "DuckLake"), _remote("bad", "DuckLake")
+
+        async def download(file, token, callback, timeout, ftp=None):
+            if file is bad:
+                callback(40, 100)
+                raise DownloadError("boom")
+            callback(100, 100)
+            return MagicMock()
+
+        with patch.object(client, "_download", new=download):
+            states = []
+            results = dict(
+                [
+                    result
+                    async for result in client.download_many(
+                        [good, bad],
+                        return_exceptions=True,
+                        callback=states.append,
+                    )
+                ]
+            )
+            assert isinstance(results[bad], DownloadError)
+            assert states[-1].failed == 1
+            assert states[-1].bytes_done == states[-1].bytes_total == 100
+
+            with pytest.raises(DownloadError, match="boom"):
+                async for _ in client.download_many([bad]):
+                    pass
+
+        await client.__aexit__(None, None, None)
+
+    @pytest.mark.asyncio
+    async def test_download_many_pools_ftp_connections(self, test_db_path):
+        import asyncio
+
+        from pysus.api.ftp import FTPClient
+
+        client = PySUS(db_path=test_db_path)
+        files = [_remote(f"f{i}", "FTP") for i in range(4)]
+        used = []
+
+        async def download(file, token, callback, timeout, ftp=None):
+            used.append(ftp)
+            await asyncio.sleep(0.01)
+            return MagicMock()
+
+        with (
+            patch.object(client, "_download", new=download),
+            patch.object(
+                FTPClient, "connect", new_callable=AsyncMock
+            ) as mock_connect,
+            patch.object(
+                FTPClient, "close", new_callable=AsyncMock
+            ) as mock_close,
+        ):
+            async for _ in client.download_many(
+                files, per_origin_limits={"ftp": 2}
+            ):
+                pass
+            assert mock_connect.await_count == 2
+            assert len(set(map(id, used))) == 2
+            assert len(client._ftp_idle) == 2
+
+            await client.__aexit__(None, None, None)
+            assert client._ftp_idle == []
+            assert mock_close.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_download_many_cached_takes_no_connection(self, test_db_path):
+        client = PySUS(db_path=test_db_path)
+        files = []
+        for i in range(3):
+            local = test_db_path.parent / f"f{i}.csv"
+            local.write_text("a,b\n1,2\n")
+            file = _remote(f"f{i}.csv", "FTP", size=local.stat().st_size)
+            file.path = f"/remote/f{i}.csv"
+            await client._update_state(
+                local, file.path, "ftp", DownloadStatus.COMPLETED
+            )
+            files.append(file)
+
+        with (
+            patch.object(
+                client, "_acquire_ftp", side_effect=AssertionError("login")
+            ),
+            patch.object(
+                client, "_download", side_effect=AssertionError("download")
+            ),
+        ):
+            results = dict(
+                [result async for result in client.download_many(files)]
+            )
+        assert sorted(r.path.name for r in results.values()) == [
+            "f0.csv",
+            "f1.csv",
+            "f2.csv",
+        ]
+
+        await client.__aexit__(None, None, None)
+
+
+class TestPartitionedLayout:
+    @staticmethod
+    def _write(root, group, year, state, n):
+        import pandas as pd
+        from pysus.api.client import _partition_path
+
+        directory = _partition_path(root, "sinan", group, year, state, None)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{group}{year}{state or ''}.parquet"
+        pd.DataFrame({"ID_MUNICIP": ["261160"] * n, "N": range(n)}).to_parquet(
+            path
+        )
+        return path
+
+    @pytest.mark.asyncio
+    async def test_download_to_parquet_hive_layout(self, test_db_path):
+        import pandas as pd
+        from pysus.api.extensions import Parquet
+
+        client = PySUS(db_path=test_db_path, layout="hive")
+        source = test_db_path.parent / "DENGBR20.csv"
+        source.write_text("N\n1\n")
+
+        async def to_parquet(output_path=None, **kwargs):
+            pd.DataFrame({"N": [1]}).to_parquet(output_path)
+            return Parquet(path=output_path)
+
+        mock_local_file = MagicMock()
+        mock_local_file.path = source
+        mock_local_file.to_parquet = to_parquet
+        mock_file = _remote("DENGBR20.dbc", "FTP")
+        mock_file.path = "/remote/DENGBR20.dbc"
+        mock_file.dataset.name = "SINAN"
+        mock_file.group.name = "DENG"
+        mock_file.year, mock_file.state, mock_file.month = 2020, None, None
+
+        with patch.object(
+            client, "download", new=AsyncMock(return_value=mock_local_file)
+        ):
+            result = await client.download_to_parquet(mock_file)
+
+        assert result.path == (
+            client.partition_root
+            / "dataset=SINAN/group=DENG/year=2020/state=NULL/month=NULL"
+            / "DENGBR20.parquet"
+        )
+        assert not source.exists()
+        assert client.get_completed_remote_paths() == {"/remote/DENGBR20.dbc"}
+        await client.__aexit__(None, None, None)
+
+    def test_scan_prunes_partitions(self, tmp_path):
+        client = PySUS(db_path=tmp_path / "config.db")
+        root = client.partition_root
+        for year in (2019, 2020, 2021):
+            for state in ("RJ", "SP", "MG"):
+                self._write(root, "DENG", year, state, n=year - 2018)
+        self._write(root, "ZIKA", 2020, None, n=5)
+
+        result = client.scan(
+            "SINAN", group="deng", year=range(2020, 2022), state=["rj", "SP"]
+        )
+        df = result.to_df()
+        assert len(df) == 2 * 2 + 3 * 2
+        assert set(df["state"]) == {"RJ", "SP"}
+        assert set(df["ID_MUNICIP"]) == {"2611606"}
+        plan = client.duckdb_connection.sql(
+            "EXPLAIN ANALYZE " + result.sql_query()
+        ).fetchall()[0][1]
+        assert "Scanning Files: 4/10" in plan
+
+        zika = client.scan("sinan", group="ZIKA", add_dv=False, N=[0, 4])
+        assert sorted(zika.to_df()["N"]) == [0, 4]
+        assert zika.to_df()["state"].isna().all()
+
+        assert client.scan("SINAN", year=1999, month=3).to_df().empty
+        with pytest.raises(ValidationError, match="No partitioned files"):
+            client.scan("SIM")
+
+    @pytest.mark.asyncio
+    async def test_relayout(self, test_db_path):
+        import pandas as pd
+
+        client = PySUS(db_path=test_db_path)
+        flat = client.cachepath / "downloads/ftp/sinan/DENG/DENGBR20.parquet"
+        flat.parent.mkdir(parents=True)
+        pd.DataFrame({"N": [1, 2]}).to_parquet(flat)
+        await client._update_state(
+            flat,
+            "/remote/DENGBR20.dbc",
+            "ftp",
+            DownloadStatus.COMPLETED,
+            year=2020,
+            group="DENG",
+            sha256="digest",
+        )
+        await client._update_state(
+            client.cachepath / "downloads/ftp/sinan/DENG/gone.parquet",
+            "/remote/gone.dbc",
+            "ftp",
+            DownloadStatus.COMPLETED,
+        )
+
+        target = (
+            client.partition_root
+            / "dataset=SINAN/group=DENG/year=2020/state=NULL/month=NULL"
+            / "DENGBR20.parquet"
+        )
+        assert client.relayout(dry_run=True) == [(flat, target)]
+        assert flat.exists()
+
+        assert client.relayout() == [(flat, target)]
+        assert target.exists() and not flat.exists()
+        paths = client._state.completed_paths("ftp", "/remote/DENGBR20.dbc")
+        assert paths == [str(target)]
+        assert read_sidecar(target)["sha256"] == "digest"
+        assert len(client.scan("SINAN", year=2020).to_df()) == 2
+        assert client.relayout() == []
+
+        await client.__aexit__(None, None, None)
+
+
 class TestReadParquet:
     def test_read_parquet_single_path(self, tmp_path):
         import pandas as pd
@@ -963,7 +1325,6 @@ class TestReadParquet:
         assert list(df.columns) == ["a"]
 
     def test_read_parquet_intersection_no_common_columns(self, tmp_path):
-        import duckdb
         import pandas as pd
 
         parquet1 = tmp_path / "test1.parquet"
@@ -976,23 +1337,36 @@ class TestReadParquet:
 
         client = PySUS(db_path=tmp_path / "config.db")
 
-        original_execute = duckdb.execute
+        with pytest.raises(ValidationError, match="no column in common"):
+            client.read_parquet([parquet1, parquet2], mode="intersection")
 
-        def side_effect(sql, *args, **kwargs):
-            if sql == "SELECT * WHERE 1=0":
-                result = MagicMock()
-                result.description = []
-                result.df.return_value = pd.DataFrame()
-                result.fetchall.return_value = []
-                return result
-            return original_execute(sql, *args, **kwargs)
+    def test_read_parquet_connection_methods(self, tmp_path):
+        import pandas as pd
 
-        with patch.object(duckdb, "execute", side_effect=side_effect):
-            result = client.read_parquet(
-                [parquet1, parquet2], mode="intersection"
-            )
-            df = result.df()
-            assert len(df) == 0
+        parquet1 = tmp_path / "test1.parquet"
+        parquet2 = tmp_path / "test2.parquet"
+        pd.DataFrame({"a": [1, 2], "b": [3, 4]}).to_parquet(parquet1)
+        pd.DataFrame({"a": [5], "c": [6]}).to_parquet(parquet2)
+
+        client = PySUS(db_path=tmp_path / "config.db")
+        result = client.read_parquet(
+            [parquet1, parquet2], mode="intersection", add_dv=False
+        )
+
+        # the result methods of the DuckDBPyConnection formerly returned
+        assert sorted(result.df()["a"].tolist()) == [1, 2, 5]
+        assert sorted(result.fetchall()) == [(1,), (2,), (5,)]
+        assert result.fetchone() in [(1,), (2,), (5,)]
+        assert result.fetchdf().columns.tolist() == ["a"]
+
+        empty = client.read_parquet(
+            [parquet1, parquet2],
+            sql="SELECT * FROM t WHERE a > 10",
+            mode="intersection",
+            add_dv=False,
+        )
+        assert len(empty.df()) == 0
+        assert empty.fetchall() == []
 
     def test_read_parquet_strict_mode_matching_schemas(self, tmp_path):
         import pandas as pd
@@ -1111,9 +1485,9 @@ class TestReadParquet:
         client = PySUS(db_path=tmp_path / "config.db")
         result = client.read_parquet([parquet_file], add_dv=False)
 
-        from duckdb import DuckDBPyConnection
+        from pysus.api.relation import ParquetRelation
 
-        assert isinstance(result, DuckDBPyConnection)
+        assert isinstance(result, ParquetRelation)
         out = result.df()
         assert out["ID_MUNICIP"].iloc[0] == "261160"
 
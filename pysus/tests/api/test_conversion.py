@@ -0,0 +1,155 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pyarrow.parquet as pq
+import pytest
+from pysus.api import conversion
+from pysus.api.conversion import ConversionPool
+from pysus.api.errors import FormatError
+from pysus.api.extensions import Parquet
+from pysus.tests.data.test_dbf_reader import _create_dbf
+
+
+@pytest.fixture
+def dbf_files(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"file{i}.dbf"
+        _create_dbf(
+            path,
+            [("NAME", "C", 10, 0), ("N", "N", 3, 0)],
+            [(f"row{j}", i) for j in range(10 * (i + 1))],
+        )
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def thread_pool(monkeypatch):
+    """A ConversionPool running its jobs in threads, for fast tests."""
+
+    def pool(**kwargs):
+        pool = ConversionPool(**kwargs)
+        executor = ThreadPoolExecutor(pool.workers)
+        monkeypatch.setattr(pool, "_get_executor", lambda: executor)
+        return pool
+
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_convert_many_in_processes(dbf_files):
+    done = []
+    async with ConversionPool(workers=2) as pool:
+        results = [
+            file
+            async for file in pool.convert_many(
+                dbf_files, callback=lambda *a: done.append(a), typed=True
+            )
+        ]
+    assert all(isinstance(r, Parquet) for r in results)
+    assert sorted(r.path.name for r in results) == [
+        "file0.parquet",
+        "file1.parquet",
+        "file2.parquet",
+    ]
+    assert sorted(r.rows for r in results) == [10, 20, 30]
+    assert (
+        pq.read_table(dbf_files[1].with_suffix(".parquet"))["N"].to_pylist()
+        == [1] * 20
+    )
+    assert done == [(1, 3), (2, 3), (3, 3)]
+
+
+@pytest.mark.asyncio
+async def test_convert_output_path(thread_pool, dbf_files, tmp_path):
+    pool = thread_pool(workers=1)
+    out = tmp_path / "custom.parquet"
+    result = await pool.convert(dbf_files[0], output_path=out)
+    assert result.path == out
+    assert result.rows == 10
+
+
+@pytest.mark.asyncio
+async def test_convert_many_errors(thread_pool, dbf_files, tmp_path):
+    junk = tmp_path / "junk.pdf"
+    junk.write_bytes(b"%PDF-1.4 junk")
+    pool = thread_pool(workers=2)
+
+    results = [
+        r
+        async for r in pool.convert_many(
+            [dbf_files[0], junk], return_exceptions=True
+        )
+    ]
+    assert sum(isinstance(r, FormatError) for r in results) == 1
+    assert sum(isinstance(r, Parquet) for r in results) == 1
+
+    with pytest.raises(FormatError):
+        async for _ in pool.convert_many([junk]):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_convert_rejects_callback(dbf_files):
+    with pytest.raises(ValueError, match="callbacks"):
+        await ConversionPool(workers=1).convert(dbf_files[0], callback=print)
+
+
+def test_memory_limit(monkeypatch):
+    monkeypatch.setattr(conversion, "_available_memory", lambda: 1000)
+    assert ConversionPool().memory_limit == 500
+    assert ConversionPool(memory_limit=None).memory_limit is None
+    assert ConversionPool(memory_limit=64).memory_limit == 64
+
+    monkeypatch.setattr(conversion, "_available_memory", lambda: None)
+    assert ConversionPool().memory_limit is None
+
+
+def test_invalid_workers():
+    with pytest.raises(ValueError, match="positive"):
+        ConversionPool(workers=0)
+
+
+@pytest.mark.asyncio
+async def test_admission_respects_workers_and_memory(
+    thread_pool, dbf_files, monkeypatch
+):
+    lock = threading.Lock()
+    running = []
+    peak = 0
+
+    def fake_convert(path, output_path, options):
+        nonlocal peak
+        with lock:
+            running.append(path)
+            peak = max(peak, len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(path)
+        return path
+
+    async def instantiate(path):
+        return Parquet(path=path)
+
+    monkeypatch.setattr(conversion, "_convert_in_process", fake_convert)
+    monkeypatch.setattr(conversion.ExtensionFactory, "instantiate", instantiate)
+
+    pool = thread_pool(workers=3, memory_limit=10)
+    monkeypatch.setattr(pool, "estimate_memory", lambda path: 5)
+    await asyncio.gather(*(pool.convert(p) for p in dbf_files * 2))
+    assert peak == 2  # two 5-byte jobs fill the 10-byte budget
+
+    pool = thread_pool(workers=3, memory_limit=10)
+    monkeypatch.setattr(pool, "estimate_memory", lambda path: 50)
+    peak = 0
+    await asyncio.gather(*(pool.convert(p) for p in dbf_files))
+    assert peak == 1  # oversized jobs run alone
+
+    pool = thread_pool(workers=2, memory_limit=None)
+    assert pool.memory_limit is None
+    peak = 0
+    await asyncio.gather(*(pool.convert(p) for p in dbf_files * 2))
+    assert peak == 2
@@ -157,6 +157,11 @@ class TestCiha:
             assert args.kwargs["group"] == "CIHA"
 
 
+async def _completed_downloads(files):
+    for f in files:
+        yield f, f
+
+
 class TestFetchData:
     def test_fetch_data_single_year(self):
         with patch("pysus.api._impl.databases.PySUS") as mock_pysus_class:
@@ -270,18 +275,21 @@ class TestFetchData:
             mock_file = MagicMock()
             mock_file.path = "/tmp/test.parquet"
             mock_pysus.query = AsyncMock(return_value=[mock_file])
-            mock_pysus.download = AsyncMock(return_value=mock_file)
+            mock_pysus.download_many = MagicMock(
+                side_effect=_completed_downloads
+            )
             mock_pysus.read_parquet.return_value.df.return_value = MagicMock()
 
             from pysus.api._impl.databases import _fetch_data
 
-            _fetch_data(
+            result = _fetch_data(
                 dataset="sinan",
                 year=2024,
                 show_progress=False,
             )
 
-            mock_pysus.download.assert_called_once()
+            mock_pysus.download_many.assert_called_once_with([mock_file])
+            assert result == ["/tmp/test.parquet"]
 
     def test_fetch_data_no_files(self):
         with patch("pysus.api._impl.databases.PySUS") as mock_pysus_class:
@@ -310,32 +318,34 @@ class TestFetchData:
     def test_fetch_data_with_progress(self):
         with (
             patch("pysus.api._impl.databases.PySUS") as mock_pysus_class,
-            patch(
-                "pysus.api._impl.databases.tqdm.gather",
-                new_callable=AsyncMock,
-                return_value=[MagicMock(), MagicMock()],
-            ) as mock_tqdm_gather,
+            patch("pysus.api._impl.databases.tqdm") as mock_tqdm,
         ):
             mock_pysus = MagicMock()
             enter_mock = AsyncMock(return_value=mock_pysus)
-            exit_mock = AsyncMock()
+            exit_mock = AsyncMock(return_value=False)
             mock_pysus_class.return_value.__aenter__ = enter_mock
             mock_pysus_class.return_value.__aexit__ = exit_mock
 
-            mock_file = MagicMock()
-            mock_file.path = "/tmp/test.parquet"
-            mock_pysus.query = AsyncMock(return_value=[mock_file, mock_file])
-            mock_pysus.download = AsyncMock(return_value=mock_file)
-            mock_pysus.read_parquet.return_value.df.return_value = MagicMock()
+            first, second = MagicMock(), MagicMock()
+            first.path = "/tmp/a.parquet"
+            second.path = "/tmp/b.parquet"
+            mock_pysus.query = AsyncMock(return_value=[first, second])
+            mock_pysus.download_many = MagicMock(
+                side_effect=lambda files: _completed_downloads(files[::-1])
+            )
 
             from pysus.api._impl.databases import _fetch_data
 
-            _fetch_data(dataset="sinan", year=2024, show_progress=True)
-
-            assert mock_tqdm_gather.called
+            result = _fetch_data(dataset="sinan", year=2024, show_progress=True)
 
-            called_args = mock_tqdm_gather.call_args[0]
-            assert len(called_args) == 2
+            mock_tqdm.assert_called_once_with(
+                total=2,
+                desc="Downloading sinan",
+                unit="file",
+                disable=False,
+            )
+            assert mock_tqdm.return_value.update.call_count == 2
+            assert result == ["/tmp/a.parquet", "/tmp/b.parquet"]
 
 
 class TestFetchDataRunningLoop:
@@ -0,0 +1,31 @@
+import hashlib
+import io
+from unittest.mock import patch
+
+from pysus.api.digest import HashingWriter, record_sha256, sha256_of
+
+
+def test_hashing_writer():
+    sink = io.BytesIO()
+    with HashingWriter(sink) as f:
+        f.write(b"abc")
+        f.write(b"def")
+        assert f.tell() == 6
+        assert f.hexdigest() == hashlib.sha256(b"abcdef").hexdigest()
+    assert sink.closed
+
+
+def test_sha256_of_served_from_sidecar(tmp_path):
+    path = tmp_path / "data.dbc"
+    path.write_bytes(b"content")
+    expected = hashlib.sha256(b"content").hexdigest()
+
+    assert sha256_of(path) == expected
+    with patch("builtins.open", side_effect=AssertionError("file read")):
+        assert sha256_of(path) == expected
+
+    record_sha256(path, "recorded")
+    assert sha256_of(path) == "recorded"
+
+    path.write_bytes(b"other content")
+    assert sha256_of(path) == hashlib.sha256(b"other content").hexdigest()
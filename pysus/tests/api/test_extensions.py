@@ -1,13 +1,19 @@
+import asyncio
 import gzip
 import json
 import struct
 import tarfile
+import threading
+import time
 import zipfile
+from collections import OrderedDict
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 import pytest
 from pysus.api.errors import ConversionError, FormatError
@@ -26,8 +32,10 @@ from pysus.api.extensions import (
     Tar,
     Zip,
     _map_dtype,
+    _run_conversion,
 )
 from pysus.api.models import BaseLocalFile
+from pysus.data.csv_reader import iter_csv_batches
 
 
 @pytest.fixture
@@ -226,6 +234,73 @@ async def test_parquet_load_skips_add_dv_when_disabled(tmp_dir):
     assert parsed["ID_MUNICIP"].iloc[0] == "261160"
 
 
+@pytest.fixture
+def notifications(tmp_dir):
+    path = tmp_dir / "notifications.parquet"
+    table = pa.table(
+        {
+            "ID_MUNICIP": [f"{261160 + i % 3}" for i in range(100)],
+            "DT_NOTIFIC": [f"202301{i % 28 + 1:02d}" for i in range(100)],
+            "IDADE": [str(i) for i in range(100)],
+            "OTHER": ["x"] * 100,
+        }
+    )
+    pq.write_table(table, path, row_group_size=10)
+    return path
+
+
+@pytest.mark.asyncio
+async def test_parquet_load_columns_and_filters(notifications):
+    obj = Parquet(path=notifications, add_dv=True)
+    parsed = await obj.load(
+        columns=["ID_MUNICIP", "IDADE"],
+        filters=[("ID_MUNICIP", "==", "261161"), ("IDADE", "<", "50")],
+    )
+    assert list(parsed.columns) == ["ID_MUNICIP", "IDADE"]
+    assert set(parsed["ID_MUNICIP"]) == {"2611614"}
+    assert len(parsed) == len(
+        [i for i in range(100) if i % 3 == 1 and str(i) < "50"]
+    )
+
+    raw = await obj.load(
+        parse=False, filters=pc.field("IDADE").isin(["7", "42"])
+    )
+    assert list(raw.columns) == ["ID_MUNICIP", "DT_NOTIFIC", "IDADE", "OTHER"]
+    assert raw["IDADE"].tolist() == ["7", "42"]
+
+
+@pytest.mark.asyncio
+async def test_parquet_stream_columns_and_filters(notifications):
+    obj = Parquet(path=notifications, add_dv=True)
+    chunks = await collect_async(
+        obj.stream(
+            chunk_size=4,
+            parse=True,
+            columns=["DT_NOTIFIC"],
+            filters=[("IDADE", "in", ["1", "2", "95"])],
+        )
+    )
+    df = pd.concat(chunks)
+    assert list(df.columns) == ["DT_NOTIFIC"]
+    assert [str(d) for d in df["DT_NOTIFIC"]] == [
+        "2023-01-02",
+        "2023-01-03",
+        "2023-01-12",
+    ]
+    assert all(len(chunk) <= 4 for chunk in chunks)
+
+
+def test_parquet_scan_skips_row_groups(notifications):
+    obj = Parquet(path=notifications)
+    fragment = next(ds.dataset(notifications).get_fragments())
+    groups = fragment.split_by_row_group(pc.field("DT_NOTIFIC") > "20230125")
+    assert len(groups) < pq.ParquetFile(notifications).num_row_groups
+    batches = list(
+        obj._scan(100, columns=["IDADE"], filters=pc.field("IDADE") == "99")
+    )
+    assert sum(b.num_rows for b in batches) == 1
+
+
 @pytest.mark.asyncio
 async def test_dbf_decode_and_failure(tmp_dir):
     pytest.importorskip("dbfread")
@@ -544,6 +619,48 @@ def test_parse_dftypes_edge_cases():
     assert result["IDADE"].iloc[2] == 25
 
 
+def test_parse_dftypes_columnar_dtypes():
+    df = pd.DataFrame(
+        {
+            "DT_NOTIFIC": pd.Categorical(["20230101", "        ", None]),
+            "IDADE": [" 4 2", "", "7"],
+            "NOME": ["Ana", "   ", None],
+        },
+        index=[10, 20, 30],
+    )
+    result = Parquet.parse_dftypes(df)
+
+    assert result["DT_NOTIFIC"].dtype == "date32[pyarrow]"
+    assert str(result["DT_NOTIFIC"].iloc[0]) == "2023-01-01"
+    assert result["DT_NOTIFIC"].iloc[1:].isna().all()
+    assert result["IDADE"].dtype == "Int64"
+    assert result["IDADE"].tolist()[0::2] == [42, 7]
+    assert pd.isna(result["IDADE"].iloc[1])
+    assert result["NOME"].tolist()[:2] == ["Ana", ""]
+    assert list(result.index) == [10, 20, 30]
+
+
+def test_parse_dftypes_configurable_columns():
+    df = pd.DataFrame({"DT_OBITO": ["20200229"], "IDADE": ["12"]})
+    result = Parquet.parse_dftypes(
+        df, date_columns=["DT_OBITO"], int_columns=()
+    )
+    assert str(result["DT_OBITO"].iloc[0]) == "2020-02-29"
+    assert result["IDADE"].iloc[0] == "12"
+
+
+@pytest.mark.asyncio
+async def test_parquet_load_uses_instance_columns(tmp_dir):
+    path = tmp_dir / "test.parquet"
+    pd.DataFrame({"DT_OBITO": ["20200101"], "DT_NOTIFIC": ["x"]}).to_parquet(
+        path
+    )
+    obj = Parquet(path=path, date_columns=("DT_OBITO",), add_dv=False)
+    parsed = await obj.load()
+    assert str(parsed["DT_OBITO"].iloc[0]) == "2020-01-01"
+    assert parsed["DT_NOTIFIC"].iloc[0] == "x"
+
+
 # ---------------------------------------------------------------------------
 # New tests for lines 351-360, 370, 394, 402-403, 413-427: DBF
 # ---------------------------------------------------------------------------
@@ -643,6 +760,179 @@ async def test_dbf_to_parquet(tmp_dir):
     assert len(calls) >= 1
 
 
+@pytest.mark.asyncio
+async def test_dbf_to_parquet_typed(tmp_dir):
+    dbf_path = tmp_dir / "test.dbf"
+    _create_dbf(
+        dbf_path,
+        [("NAME", "C", 10, 0), ("AGE", "N", 3, 0), ("DT", "D", 8, 0)],
+        [("Alice", 30, "20240131"), ("Bob", "", ""), ("Carol", 7, "")],
+    )
+    obj = DBF(path=dbf_path)
+    result = await obj.to_parquet(chunk_size=1, typed=True)
+    schema = pq.read_schema(result.path)
+    assert schema.field("AGE").type == pa.int64()
+    assert schema.field("DT").type == pa.date32()
+    assert pq.read_table(result.path)["AGE"].to_pylist() == [30, None, 7]
+
+
+@pytest.mark.asyncio
+async def test_dbf_to_parquet_typed_empty(tmp_dir):
+    dbf_path = tmp_dir / "test.dbf"
+    _create_dbf(dbf_path, [("AGE", "N", 3, 0)], [])
+    result = await DBF(path=dbf_path).to_parquet(typed=True)
+    assert pq.read_schema(result.path).field("AGE").type == pa.int64()
+
+
+@pytest.mark.asyncio
+async def test_dbf_to_parquet_keeps_dictionary(tmp_dir):
+    dbf_path = tmp_dir / "test.dbf"
+    records = [(f"{i:04d}", ["SP", "RJ"][i % 2], " ") for i in range(100)]
+    _create_dbf(
+        dbf_path,
+        [("ID", "C", 4, 0), ("UF", "C", 2, 0), ("OBS", "C", 1, 0)],
+        records,
+    )
+    result = await DBF(path=dbf_path).to_parquet(chunk_size=30, dictionary=True)
+
+    schema = pq.read_schema(result.path)
+    assert pa.types.is_dictionary(schema.field("UF").type)
+    assert schema.field("ID").type == pa.string()
+
+    df = await result.load()
+    assert df["UF"].dtype == "category"
+    assert df["UF"].tolist() == [r[1] for r in records]
+    assert df["OBS"].tolist() == [""] * 100
+
+    chunks = [c async for c in result.stream(chunk_size=40)]
+    assert all(c["UF"].dtype == "category" for c in chunks)
+
+
+@pytest.mark.asyncio
+async def test_dbf_to_parquet_plain_strings_by_default(tmp_dir):
+    dbf_path = tmp_dir / "test.dbf"
+    _create_dbf(dbf_path, [("UF", "C", 2, 0)], [("SP",), ("RJ",)] * 50)
+    result = await DBF(path=dbf_path).to_parquet()
+    assert pq.read_schema(result.path).field("UF").type == pa.string()
+    assert (await result.load())["UF"].dtype != "category"
+
+
+def test_parquet_parse_dftypes_categorical():
+    df = pd.DataFrame(
+        {
+            "UF": pd.Categorical(["SP", "  ", "SP"]),
+            "IDADE": pd.Categorical(["10", "20", "10"]),
+            "DT_NOTIFIC": pd.Categorical(["20240101", "", "20240101"]),
+        }
+    )
+    parsed = Parquet.parse_dftypes(df)
+    assert parsed["UF"].tolist() == ["SP", "", "SP"]
+    assert parsed["UF"].dtype == "category"
+    assert parsed["IDADE"].tolist() == [10, 20, 10]
+    assert str(parsed["DT_NOTIFIC"].iloc[0]) == "2024-01-01"
+
+
+@pytest.mark.asyncio
+async def test_run_conversion_off_the_event_loop():
+    loop_thread = threading.get_ident()
+    threads, calls = set(), []
+
+    def convert(report):
+        threads.add(threading.get_ident())
+        for processed in range(1, 101):
+            report(processed)
+
+    def callback(processed, total):
+        threads.add(("callback", threading.get_ident()))
+        calls.append((processed, total))
+
+    await _run_conversion(convert, 100, callback)
+    assert calls == [(i, 100) for i in range(1, 101)]
+    assert ("callback", loop_thread) in threads
+    assert loop_thread not in threads
+
+
+@pytest.mark.asyncio
+async def test_run_conversion_keeps_loop_responsive():
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(heartbeat())
+    try:
+        await _run_conversion(lambda report: time.sleep(0.3), 0)
+    finally:
+        task.cancel()
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_run_conversion_propagates_errors():
+    def failing(report):
+        report(1)
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await _run_conversion(failing, 2, lambda *a: None)
+
+    reached = []
+
+    def convert(report):
+        for processed in range(1, 1000):
+            report(processed)
+            reached.append(processed)
+
+    def callback(processed, total):
+        if processed == 3:
+            raise RuntimeError("stop")
+
+    with pytest.raises(RuntimeError, match="stop"):
+        await _run_conversion(convert, 1000, callback)
+    assert len(reached) < 100  # stopped at a report once nobody listened
+
+
+@pytest.mark.asyncio
+async def test_dbf_load_and_to_parquet_workers(tmp_dir):
+    dbf_path = tmp_dir / "test.dbf"
+    records = [(f"N{i}", i) for i in range(50)]
+    _create_dbf(dbf_path, [("NAME", "C", 10, 0), ("AGE", "N", 3, 0)], records)
+    obj = DBF(path=dbf_path)
+
+    df = await obj.load(workers=4)
+    assert df["NAME"].tolist() == [name for name, _ in records]
+
+    result = await obj.to_parquet(chunk_size=8, workers=3)
+    table = pq.read_table(result.path)
+    assert table["NAME"].to_pylist() == df["NAME"].tolist()
+
+
+@pytest.mark.asyncio
+async def test_dbf_stream_batches(tmp_dir):
+    dbf_path = tmp_dir / "test.dbf"
+    _create_dbf(
+        dbf_path,
+        [("NAME", "C", 10, 0)],
+        [("Alice",), ("Bob",), ("Charlie",)],
+    )
+    obj = DBF(path=dbf_path)
+    batches = await collect_async(obj.stream_batches(chunk_size=2))
+    assert all(isinstance(b, pa.RecordBatch) for b in batches)
+    assert [b.num_rows for b in batches] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_tabular_stream_batches_from_pandas(tmp_dir):
+    path = tmp_dir / "data.csv"
+    path.write_text("a,b\n1,\n2,\n")
+    batches = await collect_async(CSV(path=path).stream_batches())
+    assert sum(b.num_rows for b in batches) == 2
+    assert batches[0].schema.field("b").type == pa.string()
+
+
 @pytest.mark.asyncio
 async def test_dbf_to_parquet_empty(tmp_dir):
     pytest.importorskip("dbfread")
@@ -852,6 +1142,134 @@ async def test_zip_to_parquet(tmp_dir):
     assert not temp_dir.exists()
 
 
+@pytest.mark.asyncio
+async def test_zip_to_parquet_streams_member(tmp_dir):
+    zip_path = tmp_dir / "data.zip"
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("notes.txt", "not a table")
+        z.writestr(
+            "sp.csv", "nome;uf\nSão Paulo;SP\nRio;RJ\n".encode("latin-1")
+        )
+
+    with patch.object(Zip, "extract") as extract:
+        pq_obj = await Zip(path=zip_path).to_parquet(chunk_size=1)
+    extract.assert_not_called()
+    assert pq.read_table(pq_obj.path).to_pydict() == {
+        "nome": ["São Paulo", "Rio"],
+        "uf": ["SP", "RJ"],
+    }
+    assert sorted(p.name for p in tmp_dir.iterdir()) == [
+        "data.parquet",
+        "data.zip",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_zip_to_parquet_member_errors(tmp_dir):
+    zip_path = tmp_dir / "data.zip"
+    with zipfile.ZipFile(zip_path, "w") as z:
+        z.writestr("docs/", "")
+        z.writestr("notes.txt", "not a table")
+    obj = Zip(path=zip_path)
+    assert await obj.tabular_members() == {}
+    with pytest.raises(ConversionError, match="No tabular file"):
+        await obj.to_parquet()
+    with pytest.raises(ConversionError, match="No tabular file"):
+        await obj.to_parquet(member="notes.txt")
+
+
+@pytest.mark.asyncio
+async def test_zip_members_to_parquet(tmp_dir):
+    dbf_path = tmp_dir / "source.dbf"
+    _create_dbf(dbf_path, [("UF", "C", 2, 0)], [("SP",), ("RJ",), ("MG",)])
+    parquet = pa.BufferOutputStream()
+    pq.write_table(pa.table({"q": [1, 2]}), parquet)
+    zip_path = tmp_dir / "data.zip"
+    with zipfile.ZipFile(zip_path, "w") as z:
+        z.write(dbf_path, arcname="2024/uf.dbf")
+        z.writestr("array.json", json.dumps([{"a": 1}, {"a": 2}]))
+        z.writestr("lines.json", '{"b": 1}\n{"b": 2}\n')
+        z.writestr("ragged.csv", "a,b\n1,2\n3\n")  # only pandas reads it
+        z.writestr("table.parquet", parquet.getvalue().to_pybytes())
+        z.writestr("notes.txt", "not a table")
+
+    progress = []
+    files = await Zip(path=zip_path).members_to_parquet(
+        tmp_dir / "out",
+        chunk_size=2,
+        callback=lambda done, total: progress.append((done, total)),
+        workers=2,
+    )
+    out = tmp_dir / "out"
+    assert [f.path for f in files] == [
+        out / "2024" / "uf.parquet",
+        out / "array.parquet",
+        out / "lines.parquet",
+        out / "ragged.parquet",
+        out / "table.parquet",
+    ]
+    tables = [pq.read_table(f.path).to_pydict() for f in files]
+    assert tables == [
+        {"UF": ["SP", "RJ", "MG"]},
+        {"a": [1, 2]},
+        {"b": [1, 2]},
+        {"a": ["1", "3"], "b": ["2", None]},
+        {"q": [1, 2]},
+    ]
+    assert progress == [(i, 5) for i in range(1, 6)]
+    assert not [p for p in out.iterdir() if p.name.startswith(".spool")]
+
+
+@pytest.mark.asyncio
+async def test_zip_members_to_parquet_blocks_traversal(tmp_dir):
+    zip_path = tmp_dir / "data.zip"
+    with zipfile.ZipFile(zip_path, "w") as z:
+        z.writestr("../evil.csv", "a\n1\n")
+    with pytest.raises(ValueError, match="Path traversal"):
+        await Zip(path=zip_path).members_to_parquet(tmp_dir / "out")
+
+
+@pytest.mark.asyncio
+async def test_gzip_open_stream_and_to_parquet(tmp_dir):
+    path = tmp_dir / "data.csv.gz"
+    with gzip.open(path, "wb") as f:
+        f.write(b"a,b\n1,2\n3,4\n")
+    obj = GZip(path=path)
+
+    with obj.open_stream("data.csv") as stream:
+        assert stream.peek(3)[:3] == b"a,b"
+        assert stream.read() == b"a,b\n1,2\n3,4\n"
+    with pytest.raises(KeyError):
+        obj.open_stream("other.csv")
+
+    pq_obj = await obj.to_parquet()
+    assert pq_obj.path == tmp_dir / "data.csv.parquet"
+    assert pq.read_table(pq_obj.path).to_pydict() == {
+        "a": ["1", "3"],
+        "b": ["2", "4"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_tar_open_stream_and_to_parquet(tmp_dir):
+    records = [{"id": i, "name": f"n{i}"} for i in range(5)]
+    member = tmp_dir / "records.json"
+    member.write_text(json.dumps(records, indent=2))
+    tar_path = tmp_dir / "data.tar.gz"
+    with tarfile.open(tar_path, "w:gz") as t:
+        t.add(tmp_dir, arcname="dir", recursive=False)
+        t.add(member, arcname="dir/records.json")
+    obj = Tar(path=tar_path)
+
+    with pytest.raises(KeyError, match="not a regular file"):
+        obj.open_stream("dir")
+    with obj.open_stream("dir/records.json") as stream:
+        assert json.load(stream) == records
+
+    pq_obj = await obj.to_parquet(tmp_dir / "out.parquet")
+    assert pq.read_table(pq_obj.path).to_pylist() == records
+
+
 # ---------------------------------------------------------------------------
 # New tests for lines 723-740: Zip._safe_cleanup
 # ---------------------------------------------------------------------------
@@ -943,6 +1361,59 @@ async def test_extension_factory_identify_csv_falls_back(tmp_dir):
     assert cls is CSV
 
 
+@pytest.mark.asyncio
+async def test_extension_factory_detection_persisted(tmp_dir, monkeypatch):
+    parquet = tmp_dir / "data.parquet"
+    pd.DataFrame({"a": [1]}).to_parquet(parquet)
+    text = tmp_dir / "data.csv"
+    text.write_text("a,b\n1,2\n")
+    assert await ExtensionFactory._identify(parquet) is Parquet
+    assert await ExtensionFactory._identify(text) is None
+
+    # a new process: empty memory cache, sidecars on disk
+    monkeypatch.setattr(ExtensionFactory, "_detection_cache", OrderedDict())
+    with patch("pysus.api.extensions._detect_type") as detect:
+        assert await ExtensionFactory._identify(parquet) is Parquet
+        assert await ExtensionFactory._identify(text) is None
+    detect.assert_not_called()
+
+    text.write_bytes(b'{"a": 1}\n{"a": 2}\n')
+    assert await ExtensionFactory._identify(text) is JSONL
+
+
+@pytest.mark.asyncio
+async def test_extension_factory_detection_cache_bounded(tmp_dir, monkeypatch):
+    monkeypatch.setattr(ExtensionFactory, "_detection_cache", OrderedDict())
+    monkeypatch.setattr(ExtensionFactory, "detection_cache_size", 2)
+    paths = [tmp_dir / f"{name}.txt" for name in "abc"]
+    for path in paths:
+        path.write_text(path.stem)
+    for path in (paths[0], paths[1], paths[0], paths[2]):
+        await ExtensionFactory._identify(path)
+    cached = [
+        Path(key.rsplit(":", 2)[0]).name
+        for key in ExtensionFactory._detection_cache
+    ]
+    assert cached == ["a.txt", "c.txt"]
+
+
+def test_parquet_footer_cached(tmp_dir):
+    path = tmp_dir / "data.parquet"
+    pd.DataFrame({"a": [1, 2], "b": pd.Categorical(["x", "y"])}).to_parquet(
+        path
+    )
+    first = Parquet(path=path)
+    assert first.rows == 2
+    schema = first.schema
+
+    with patch("pysus.api.extensions.pq.read_metadata") as read:
+        second = Parquet(path=path)
+        assert second.schema.equals(schema, check_metadata=True)
+        assert [c.name for c in second.columns] == ["a", "b"]
+        assert second.rows == 2
+    read.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_extension_factory_identify_zip(tmp_dir):
     path = tmp_dir / "test.zip"
@@ -1209,6 +1680,55 @@ async def test_zip_to_parquet_no_tabular(tmp_dir):
         await obj.to_parquet()
 
 
+@pytest.mark.asyncio
+async def test_dbc_to_parquet_streams_without_temp_dbf(tmp_dir):
+    from pysus.data.dbc_reader import STREAMING_SUPPORTED
+    from pysus.tests.data.test_dbc_reader import _create_dbc
+
+    if not STREAMING_SUPPORTED:
+        pytest.skip("DBC streaming needs POSIX pipes")
+
+    dbc_path = _create_dbc(
+        tmp_dir / "data.dbc",
+        [("NAME", "C", 10, 0), ("AGE", "N", 3, 0)],
+        [("Alice", 30), ("Bob", 25), ("Carol", 7)],
+    )
+    calls = []
+    with patch("pysus.api.extensions.dbc2dbf") as legacy:
+        result = await DBC(path=dbc_path).to_parquet(
+            chunk_size=2, typed=True, callback=lambda *a: calls.append(a)
+        )
+
+    legacy.assert_not_called()
+    assert not (tmp_dir / "data.dbf").exists()
+    assert isinstance(result, Parquet)
+    table = pq.read_table(result.path)
+    assert table["AGE"].to_pylist() == [30, 25, 7]
+    assert calls == [(2, 3), (3, 3)]
+
+
+@pytest.mark.asyncio
+async def test_dbc_to_parquet_streaming_dictionary(tmp_dir):
+    from pysus.data.dbc_reader import STREAMING_SUPPORTED
+    from pysus.tests.data.test_dbc_reader import _create_dbc
+
+    if not STREAMING_SUPPORTED:
+        pytest.skip("DBC streaming needs POSIX pipes")
+
+    dbc_path = _create_dbc(
+        tmp_dir / "data.dbc",
+        [("UF", "C", 2, 0), ("ID", "C", 4, 0)],
+        [(["SP", "RJ", "MG"][i % 3], f"{i:04d}") for i in range(90)],
+    )
+    result = await DBC(path=dbc_path).to_parquet(
+        chunk_size=40, dictionary=["uf"]
+    )
+    schema = pq.read_schema(result.path)
+    assert pa.types.is_dictionary(schema.field("UF").type)
+    assert schema.field("ID").type == pa.string()
+    assert pq.read_table(result.path).num_rows == 90
+
+
 @pytest.mark.asyncio
 async def test_dbc_to_parquet_permission_error_cleanup(tmp_dir):
     """Cover the PermissionError retry in DBC.to_parquet finally block."""
@@ -1521,6 +2041,91 @@ def test_csv_rows_quoted_newlines(tmp_dir):
     assert obj.rows == 2
 
 
+@pytest.mark.asyncio
+async def test_csv_metadata_cached_across_instances(tmp_dir):
+    path = tmp_dir / "data.csv"
+    path.write_text("name;age\nAna;30\nBia;25\n")
+    first = CSV(path=path)
+    assert first.rows == 2
+    assert [c.name for c in first.columns] == ["name", "age"]
+
+    second = CSV(path=path)
+    with (
+        patch("chardet.detect") as detect,
+        patch("pysus.api.extensions.count_csv_records") as count,
+        patch("csv.Sniffer.sniff") as sniff,
+    ):
+        assert second.rows == 2
+        assert [c.name for c in second.columns] == ["name", "age"]
+        assert await second._get_sep() == ";"
+        assert await second._get_encoding() == first._encoding
+    detect.assert_not_called()
+    count.assert_not_called()
+    sniff.assert_not_called()
+
+    path.write_text("name;age\nAna;30\n")
+    assert CSV(path=path).rows == 1
+
+
+@pytest.mark.asyncio
+async def test_csv_to_parquet_arrow_engine(tmp_dir):
+    path = tmp_dir / "data.csv"
+    path.write_bytes(
+        'ID_MUNICIP;NOME;IDADE\n261160;"Jo\xe3o\nda Silva";30\n'
+        "530010;;\n".encode("latin-1")
+    )
+    progress = []
+    result = await CSV(path=path).to_parquet(
+        callback=lambda done, total: progress.append((done, total))
+    )
+    table = pq.read_table(result.path)
+    assert table.schema.types == [pa.string()] * 3
+    assert table.to_pydict() == {
+        "ID_MUNICIP": ["261160", "530010"],
+        "NOME": ["Jo\xe3o\nda Silva", None],
+        "IDADE": ["30", None],
+    }
+    assert progress[-1] == (2, 2)
+
+    typed = await CSV(path=path).to_parquet(
+        tmp_dir / "typed.parquet", column_types={"IDADE": pa.int32()}
+    )
+    assert pq.read_schema(typed.path).field("IDADE").type == pa.int32()
+
+
+@pytest.mark.asyncio
+async def test_csv_to_parquet_falls_back_to_pandas(tmp_dir):
+    path = tmp_dir / "data.csv"
+    path.write_text("a,b\n1,2\n3\n")
+    with patch(
+        "pysus.api.extensions.iter_csv_batches",
+        wraps=iter_csv_batches,
+    ) as arrow:
+        result = await CSV(path=path).to_parquet()
+    arrow.assert_called_once()
+    assert pq.read_table(result.path).to_pydict() == {
+        "a": ["1", "3"],
+        "b": ["2", None],
+    }
+
+
+@pytest.mark.asyncio
+async def test_csv_arrow_engine_load_and_stream(tmp_dir):
+    path = tmp_dir / "data.csv"
+    path.write_text("a,b\n1,x\n2,y\n3,z\n")
+    obj = CSV(path=path)
+
+    df = await obj.load(engine="pyarrow")
+    assert df["a"].tolist() == [1, 2, 3]
+
+    chunks = await collect_async(obj.stream(chunk_size=2, engine="pyarrow"))
+    assert [len(c) for c in chunks] == [2, 1]
+    assert chunks[0]["a"].tolist() == ["1", "2"]
+
+    batches = await collect_async(obj.stream_batches(engine="pandas"))
+    assert pa.Table.from_batches(batches)["b"].to_pylist() == ["x", "y", "z"]
+
+
 @pytest.mark.asyncio
 async def test_tar_type_is_tar(tmp_dir):
     """Tar.type must be 'TAR', not 'ZIP'."""
@@ -1706,6 +2311,79 @@ class TestJSONL:
         assert obj.rows == 2
         assert obj.rows == 2
 
+    @pytest.mark.asyncio
+    async def test_to_parquet(self, tmp_dir):
+        path = tmp_dir / "test.jsonl"
+        rows = [{"i": i, "uf": "RJ" if i % 2 else None} for i in range(25)]
+        path.write_text("\n".join(json.dumps(r) for r in rows) + "\n")
+        progress = []
+        result = await JSONL(path=path).to_parquet(
+            chunk_size=10, callback=lambda *a: progress.append(a)
+        )
+        table = pq.read_table(result.path)
+        assert table.schema.field("i").type == pa.int64()
+        assert table.to_pylist() == rows
+        assert progress == [(10, 25), (20, 25), (25, 25)]
+
+    @pytest.mark.asyncio
+    async def test_to_parquet_falls_back_to_text(self, tmp_dir):
+        path = tmp_dir / "test.jsonl"
+        path.write_text('{"a": 1}\n{"a": "x", "b": [1]}\n')
+        result = await JSONL(path=path).to_parquet()
+        assert pq.read_table(result.path).to_pydict() == {
+            "a": ["1", "x"],
+            "b": [None, "[1]"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_stream_batches_untyped(self, tmp_dir):
+        path = tmp_dir / "test.jsonl"
+        path.write_text('{"a": 1}\n{"a": 2}\n')
+        batches = await collect_async(
+            JSONL(path=path).stream_batches(typed=False)
+        )
+        assert batches[0].column("a").to_pylist() == ["1", "2"]
+
+    def test_rows_cached_in_sidecar(self, tmp_dir):
+        path = tmp_dir / "test.jsonl"
+        path.write_text('{"a": 1}\n{"a": 2}\n')
+        assert JSONL(path=path).rows == 2
+        with patch(
+            "pysus.api.extensions.count_jsonl_records", side_effect=OSError
+        ):
+            assert JSONL(path=path).rows == 2
+        path.write_text('{"a": 1}\n')
+        assert JSONL(path=path).rows == 1
+
+
+@pytest.mark.asyncio
+async def test_json_to_parquet_streams_array(tmp_dir):
+    path = tmp_dir / "data.json"
+    rows = [{"id": i, "nome": f"município {i}"} for i in range(30)]
+    path.write_text(json.dumps(rows, indent=2, ensure_ascii=False))
+    obj = JSON(path=path)
+    assert obj.rows == 30
+    batches = await collect_async(obj.stream_batches(chunk_size=12))
+    assert [b.num_rows for b in batches] == [12, 12, 6]
+    result = await obj.to_parquet()
+    assert pq.read_table(result.path).to_pylist() == rows
+
+
+@pytest.mark.asyncio
+async def test_json_load_single_object(tmp_dir):
+    path = tmp_dir / "data.json"
+    path.write_text('{"name": "Alice", "age": 30}')
+    df = await JSON(path=path).load()
+    assert df.to_dict("records") == [{"name": "Alice", "age": 30}]
+
+
+@pytest.mark.asyncio
+async def test_json_to_parquet_rejects_scalars(tmp_dir):
+    path = tmp_dir / "data.json"
+    path.write_text("[1, 2, 3]")
+    with pytest.raises(ConversionError, match="JSON objects"):
+        await JSON(path=path).to_parquet()
+
 
 # -- JSONL detector -------------------------------------------------------
 
@@ -1,8 +1,9 @@
 import hashlib
+import io
 from collections.abc import AsyncGenerator, Callable
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pandas as pd
@@ -104,6 +105,9 @@ class MockCompressedFile(BaseCompressedFile):
     async def open_member(self, member_name: str) -> Any:
         return self._member_data.get(member_name, b"")
 
+    def open_stream(self, member_name: str) -> BinaryIO:
+        return io.BytesIO(self._member_data[member_name])
+
     async def extract(
         self,
         target_dir: Path = CACHEPATH,
@@ -0,0 +1,142 @@
+import hashlib
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from pydantic import ValidationError
+from pysus.api.extensions import DBF
+from pysus.api.parquet import ParquetBatchWriter, ParquetWriteOptions
+from pysus.api.sidecar import read_sidecar
+from pysus.tests.data.test_dbf_reader import _create_dbf
+
+
+def _batches(n, size):
+    for start in range(0, n, size):
+        values = list(range(start, min(start + size, n)))
+        yield pa.record_batch(
+            {
+                "id": pa.array(values, pa.int64()),
+                "uf": pa.array(
+                    [["SP", "RJ", "AC"][v % 3] for v in values]
+                ).dictionary_encode(),
+                "dt": pa.array([f"2024{v % 12 + 1:02d}01" for v in values]),
+            }
+        )
+
+
+def _write(path, options, n=10_000, size=1_000):
+    batches = list(_batches(n, size))
+    with ParquetBatchWriter(path, batches[0].schema, options) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+    return pq.ParquetFile(path)
+
+
+def test_row_groups_buffered_across_batches(tmp_path):
+    file = _write(
+        tmp_path / "out.parquet", ParquetWriteOptions(row_group_size=3_000)
+    )
+    groups = [
+        file.metadata.row_group(i).num_rows
+        for i in range(file.metadata.num_row_groups)
+    ]
+    assert groups == [3_000, 3_000, 3_000, 1_000]
+    assert file.read()["id"].to_pylist() == list(range(10_000))
+
+
+def test_compression_statistics_and_page_index(tmp_path):
+    file = _write(
+        tmp_path / "out.parquet",
+        ParquetWriteOptions(
+            compression="gzip", compression_level=9, write_statistics=["id"]
+        ),
+    )
+    group = file.metadata.row_group(0)
+    assert group.column(0).compression == "GZIP"
+    assert group.column(0).is_stats_set
+    assert not group.column(2).is_stats_set
+    assert group.column(0).has_offset_index
+
+
+def test_defaults(tmp_path):
+    options = ParquetWriteOptions()
+    file = _write(tmp_path / "out.parquet", options)
+    assert file.metadata.num_row_groups == 1
+    assert file.metadata.row_group(0).column(0).compression == "ZSTD"
+    assert pa.types.is_dictionary(file.schema_arrow.field("uf").type)
+
+
+def test_sort_by_within_row_groups(tmp_path):
+    file = _write(
+        tmp_path / "out.parquet",
+        ParquetWriteOptions(row_group_size=4_000, sort_by=["uf", "dt"]),
+    )
+    for i in range(file.metadata.num_row_groups):
+        group = file.read_row_group(i).to_pandas()
+        keys = list(zip(group["uf"].astype(str), group["dt"]))
+        assert keys == sorted(keys)
+    assert sorted(file.read()["id"].to_pylist()) == list(range(10_000))
+    sorting = file.metadata.row_group(0).sorting_columns
+    assert [c.column_index for c in sorting] == [1, 2]
+
+
+def test_sort_by_unknown_column(tmp_path):
+    with pytest.raises(ValueError, match="Sort columns"):
+        _write(tmp_path / "out.parquet", ParquetWriteOptions(sort_by="X"))
+
+
+def test_invalid_row_group_size():
+    with pytest.raises(ValidationError):
+        ParquetWriteOptions(row_group_size=0)
+
+
+def test_write_table_ignores_pandas_metadata(tmp_path):
+    first = pa.Table.from_pandas(pd.DataFrame({"a": [1, 2]}))
+    second = pa.Table.from_pandas(
+        pd.DataFrame({"a": [3]}, index=pd.RangeIndex(2, 3))
+    )
+    with ParquetBatchWriter(tmp_path / "out.parquet", first.schema) as writer:
+        writer.write_table(first)
+        writer.write_table(second)
+    assert pq.read_table(tmp_path / "out.parquet")["a"].to_pylist() == [
+        1,
+        2,
+        3,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_dbf_to_parquet_write_options(tmp_path):
+    dbf_path = tmp_path / "test.dbf"
+    _create_dbf(
+        dbf_path,
+        [("ID", "C", 4, 0), ("DT", "C", 8, 0)],
+        [(f"{i:04d}", f"2024{(99 - i) % 12 + 1:02d}01") for i in range(100)],
+    )
+    options = ParquetWriteOptions(row_group_size=40, sort_by="DT")
+    result = await DBF(path=dbf_path).to_parquet(
+        chunk_size=15, write_options=options
+    )
+    file = pq.ParquetFile(result.path)
+    assert file.metadata.num_row_groups == 3
+    first = file.read_row_group(0)["DT"].to_pylist()
+    assert first == sorted(first)
+
+    result = await DBF(path=dbf_path).to_parquet(
+        tmp_path / "slow.parquet",
+        chunk_size=15,
+        fast=False,
+        write_options=options,
+    )
+    assert pq.ParquetFile(result.path).metadata.num_row_groups == 3
+
+
+def test_writer_records_digest(tmp_path):
+    path = tmp_path / "out.parquet"
+    file = _write(path, ParquetWriteOptions(), n=1_000, size=100)
+    assert file.metadata.num_rows == 1_000
+    assert (
+        read_sidecar(path)["sha256"]
+        == hashlib.sha256(path.read_bytes()).hexdigest()
+    )
@@ -0,0 +1,89 @@
+from unittest.mock import patch
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+from pysus.api.relation import ParquetRelation, connect, read_schemas
+
+
+@pytest.fixture
+def parquet_files(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"part{i}.parquet"
+        pd.DataFrame(
+            {
+                "SG_UF": ["SP", "RJ", "SP"],
+                "N": [i, i + 1, i + 2],
+                f"X{i}": [1.0, 2.0, 3.0],
+            }
+        ).to_parquet(path)
+        paths.append(path)
+    return paths
+
+
+def test_connect_settings():
+    con = connect(threads=2, memory_limit="512MB")
+    threads, limit = con.execute(
+        "SELECT current_setting('threads'), current_setting('memory_limit')"
+    ).fetchone()
+    assert threads == 2
+    assert limit.replace(" ", "") in ("512.0MiB", "488.2MiB")
+    assert con.execute("SELECT __pysus_add_dv('261160')").fetchone() == (
+        "2611606",
+    )
+
+
+def test_read_schemas_from_footers(parquet_files):
+    schemas = read_schemas(parquet_files)
+    assert [s.names[-1] for s in schemas] == ["X0", "X1", "X2"]
+
+    with patch(
+        "pysus.api.extensions.pq.read_metadata",
+        side_effect=AssertionError("footer read twice"),
+    ):
+        assert read_schemas(parquet_files[:1])[0].field("N").type == pa.int64()
+
+
+def test_relation_pushdown(parquet_files):
+    con = connect(threads=1)
+    relation = ParquetRelation(
+        con.read_parquet([str(p) for p in parquet_files], union_by_name=True)
+    )
+    query = relation.select("SG_UF", "N").filter("N > 2")
+
+    plan = query.explain()
+    assert "Filters" in plan
+    assert "X0" not in plan
+
+    assert sorted(query.fetchall()) == [("RJ", 3), ("SP", 3), ("SP", 4)]
+    assert query.columns == ["SG_UF", "N"]
+
+    counts = relation.aggregate("SG_UF, count(*) AS n", "SG_UF").order("SG_UF")
+    assert counts.to_df().to_dict("list") == {
+        "SG_UF": ["RJ", "SP"],
+        "n": [3, 6],
+    }
+    table = relation.sql("SELECT sum(N) AS s FROM t").to_arrow()
+    assert table.column("s").to_pylist() == [18]
+
+    batches = list(relation.order("N").iter_batches(batch_size=4))
+    assert sum(b.num_rows for b in batches) == 9
+    assert all(b.num_rows <= 4 for b in batches)
+
+
+def test_read_parquet_uses_own_connection(tmp_path, parquet_files):
+    import duckdb
+    from pysus.api.client import PySUS
+
+    client = PySUS(db_path=tmp_path / "config.db", threads=1)
+    with patch.object(
+        duckdb, "execute", side_effect=AssertionError("global connection")
+    ):
+        result = client.read_parquet(parquet_files, mode="intersection")
+        assert result.columns == ["N", "SG_UF"]
+        assert len(result.filter("SG_UF = 'SP'").to_df()) == 6
+
+    con = client.duckdb_connection
+    assert con is client.duckdb_connection
+    assert con.execute("SELECT current_setting('threads')").fetchone() == (1,)
@@ -0,0 +1,106 @@
+import os
+
+from pysus.api import sidecar
+from pysus.api.sidecar import prune_sidecars, read_sidecar, update_sidecar
+
+
+def test_update_and_read(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n")
+    assert read_sidecar(path) == {}
+
+    update_sidecar(path, encoding="utf-8")
+    merged = update_sidecar(path, rows=1)
+    assert merged == {"encoding": "utf-8", "rows": 1}
+    assert read_sidecar(str(path)) == merged
+
+
+def test_stale_after_change(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n")
+    update_sidecar(path, rows=1)
+
+    path.write_text("a,b\n1,2\n3,4\n")
+    assert read_sidecar(path) == {}
+
+    update_sidecar(path, rows=2)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert read_sidecar(path) == {}
+
+
+def test_missing_file_and_corrupt_sidecar(tmp_path):
+    path = tmp_path / "data.csv"
+    assert read_sidecar(path) == {}
+    assert update_sidecar(path, rows=1) == {"rows": 1}
+
+    path.write_text("a\n")
+    update_sidecar(path, rows=0)
+    sidecar._sidecar_path(path.resolve()).write_text("{not json")
+    assert read_sidecar(path) == {}
+
+
+def test_unwritable_dir(tmp_path, monkeypatch):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    monkeypatch.setattr(sidecar, "SIDECAR_DIR", blocker / "metadata")
+    path = tmp_path / "data.csv"
+    path.write_text("a\n")
+    assert update_sidecar(path, rows=0) == {"rows": 0}
+    assert read_sidecar(path) == {}
+
+
+def _files(tmp_path, n):
+    paths = []
+    for i in range(n):
+        path = tmp_path / f"data{i}.csv"
+        path.write_text("a\n")
+        update_sidecar(path, rows=0)
+        stat = sidecar._sidecar_path(path.resolve()).stat()
+        os.utime(
+            sidecar._sidecar_path(path.resolve()),
+            ns=(stat.st_atime_ns, i * 10**9),
+        )
+        paths.append(path)
+    return paths
+
+
+def test_prune_missing_and_changed(tmp_path):
+    kept, deleted, changed = _files(tmp_path, 3)
+    deleted.unlink()
+    changed.write_text("a\nb\n")
+    (sidecar.SIDECAR_DIR / "corrupt.json").write_text("{not json")
+
+    assert prune_sidecars() == 3
+    assert [p.name for p in sidecar.SIDECAR_DIR.iterdir()] == [
+        sidecar._sidecar_path(kept.resolve()).name
+    ]
+    assert read_sidecar(kept) == {"rows": 0}
+
+
+def test_prune_oldest(tmp_path):
+    paths = _files(tmp_path, 4)
+    assert prune_sidecars(max_count=2) == 2
+    assert [bool(read_sidecar(p)) for p in paths] == [
+        False,
+        False,
+        True,
+        True,
+    ]
+    assert prune_sidecars(max_count=None) == 0
+
+
+def test_pruned_as_created(tmp_path, monkeypatch):
+    monkeypatch.setattr(sidecar, "PRUNE_EVERY", 3)
+    monkeypatch.setattr(sidecar, "_created", 0)
+    first, second = _files(tmp_path, 2)
+    first.unlink()
+    update_sidecar(second, rows=1)  # not a new metadata file
+    assert len(list(sidecar.SIDECAR_DIR.glob("*.json"))) == 2
+
+    third = tmp_path / "third.csv"
+    third.write_text("a\n")
+    update_sidecar(third, rows=0)
+    assert len(list(sidecar.SIDECAR_DIR.glob("*.json"))) == 2
+    assert read_sidecar(second) == {"rows": 1}
+    assert read_sidecar(third) == {"rows": 0}
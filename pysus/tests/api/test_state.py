@@ -0,0 +1,204 @@
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+from pysus.api.state import DownloadStatus, LocalFileState, LocalStateStore
+from sqlalchemy import create_engine, event, select, text
+from sqlalchemy.pool import NullPool
+
+COMPLETED = DownloadStatus.COMPLETED
+
+
+def _rows(store):
+    with store.Session() as session:
+        return {
+            r.path: r for r in session.scalars(select(LocalFileState)).all()
+        }
+
+
+def test_lookup_and_reopen(tmp_path):
+    db = tmp_path / "state.db"
+    store = LocalStateStore(db)
+    store.write("/c/A.dbc", "/r/A.dbc", "ftp", COMPLETED, year=2024)
+    store.write("/c/A.parquet", "/r/A.dbc", "ftp", COMPLETED)
+    store.write("/c/B.dbc", "/r/B.dbc", "ftp", DownloadStatus.FAILED)
+
+    assert store.completed_paths("ftp", "/r/A.dbc") == [
+        "/c/A.parquet",
+        "/c/A.dbc",
+    ]
+    assert store.completed_paths("ftp", "/r/B.dbc") == []
+    assert store.completed_remote_paths() == {"/r/A.dbc"}
+    store.close()
+
+    store = LocalStateStore(db)
+    assert store.completed_remote_paths() == {"/r/A.dbc"}
+    assert _rows(store)["/c/A.dbc"].year == 2024
+    store.close()
+
+
+def test_lookups_served_from_memory(tmp_path):
+    store = LocalStateStore(tmp_path / "state.db")
+    store.write("/c/A.dbc", "/r/A.dbc", "ftp", COMPLETED)
+    store.completed_remote_paths()
+
+    with (
+        patch.object(store, "Session", side_effect=AssertionError),
+        patch.object(store.engine, "connect", side_effect=AssertionError),
+    ):
+        with store.batch():
+            store.write("/c/B.dbc", "/r/B.dbc", "ftp", COMPLETED)
+            store.write("/c/A.dbc", "/r/A.dbc", "ftp", DownloadStatus.MISSING)
+            assert store.completed_remote_paths() == {"/r/B.dbc"}
+            assert store.completed_paths("ftp", "/r/A.dbc") == []
+            store.delete("/c/B.dbc")
+            assert store.completed_remote_paths() == set()
+            store._pending.clear()
+    store.close()
+
+
+def test_two_stores_share_database(tmp_path):
+    db = tmp_path / "state.db"
+    first = LocalStateStore(db)
+    second = LocalStateStore(db)
+    assert first.completed_remote_paths() == set()
+    assert second.completed_remote_paths() == set()
+
+    first.write("/c/A.dbc", "/r/A.dbc", "ftp", COMPLETED)
+    assert second.completed_remote_paths() == {"/r/A.dbc"}
+    second.write("/c/A.dbc", "/r/A.dbc", "ftp", DownloadStatus.MISSING)
+    second.write("/c/B.dbc", "/r/B.dbc", "ftp", COMPLETED)
+    assert first.completed_paths("ftp", "/r/A.dbc") == []
+    assert first.completed_remote_paths() == {"/r/B.dbc"}
+    first.close()
+    second.close()
+
+
+def test_other_process_uses_open_store(tmp_path):
+    db = tmp_path / "state.db"
+    store = LocalStateStore(db)
+    store.write("/c/A.dbc", "/r/A.dbc", "ftp", COMPLETED)
+    assert store.completed_remote_paths() == {"/r/A.dbc"}
+
+    script = (
+        "import sys\n"
+        "from pysus.api.state import DownloadStatus, LocalStateStore\n"
+        "store = LocalStateStore(sys.argv[1])\n"
+        "assert store.completed_remote_paths() == {'/r/A.dbc'}\n"
+        "store.write('/c/B.dbc', '/r/B.dbc', 'ftp', "
+        "DownloadStatus.COMPLETED)\n"
+        "store.close()\n"
+    )
+    subprocess.run([sys.executable, "-c", script, str(db)], check=True)
+
+    assert store.completed_remote_paths() == {"/r/A.dbc", "/r/B.dbc"}
+    store.close()
+
+
+def test_batch_keeps_one_connection(tmp_path):
+    db = tmp_path / "state.db"
+    wal = tmp_path / "state.db.wal"
+    store = LocalStateStore(db, batch_size=2)
+    connects = []
+    event.listen(store.engine, "connect", lambda *args: connects.append(1))
+
+    store.write("/c/A.dbc", "/r/A.dbc", "ftp", COMPLETED)
+    assert len(connects) == 1
+    assert wal.exists()  # committed, not checkpointed
+
+    connects.clear()
+    with store.batch():
+        for i in range(5):
+            store.write(f"/c/{i}.dbc", f"/r/{i}.dbc", "ftp", COMPLETED)
+        assert len(store.completed_remote_paths()) == 6
+        assert len(_rows(store)) == 6  # through another connection
+        assert wal.exists()
+    assert not wal.exists()
+    assert len(connects) == 2
+    assert len(_rows(store)) == 6
+    store.close()
+
+
+def test_batch_commits_once(tmp_path):
+    store = LocalStateStore(tmp_path / "state.db", batch_size=3)
+    with store.batch():
+        store.write("/c/A.dbc", "/r/A.dbc", "ftp", DownloadStatus.DOWNLOADING)
+        store.write("/c/A.dbc", "/r/A.dbc", "ftp", COMPLETED)
+        store.write("/c/B.dbc", "/r/B.dbc", "ftp", DownloadStatus.DOWNLOADING)
+        assert _rows(store) == {}
+        with store.batch():
+            store.write("/c/C.dbc", "/r/C.dbc", "ftp", COMPLETED)
+        assert set(_rows(store)) == {"/c/A.dbc", "/c/B.dbc", "/c/C.dbc"}
+        store.write("/c/B.dbc", "/r/B.dbc", "ftp", COMPLETED)
+        assert _rows(store)["/c/B.dbc"].status is DownloadStatus.DOWNLOADING
+    assert _rows(store)["/c/B.dbc"].status is COMPLETED
+    assert _rows(store)["/c/A.dbc"].status is COMPLETED
+    store.close()
+
+
+def test_delete_then_write_replaces_row(tmp_path):
+    store = LocalStateStore(tmp_path / "state.db")
+    store.write("/c/A.dbc", "/r/A.dbc", "ftp", COMPLETED, year=2023)
+    with store.batch():
+        store.delete("/c/A.dbc")
+        store.write("/c/A.dbc", "/r/A2.dbc", "ftp", COMPLETED, year=2024)
+    record = _rows(store)["/c/A.dbc"]
+    assert (record.remote_path, record.year) == ("/r/A2.dbc", 2024)
+
+    store.write("/c/A.dbc", "/r/other.dbc", "ftp", COMPLETED, year=2000)
+    assert _rows(store)["/c/A.dbc"].year == 2024
+
+    store.delete("/c/A.dbc")
+    assert _rows(store) == {}
+    store.close()
+
+
+def test_sha256_stored_and_cleared(tmp_path):
+    store = LocalStateStore(tmp_path / "state.db")
+    store.write("/c/A.dbc", "/r/A.dbc", "ftp", COMPLETED, sha256="aa")
+    store.write("/c/A.dbc", "/r/A.dbc", "ftp", COMPLETED)
+    assert _rows(store)["/c/A.dbc"].sha256 == "aa"
+
+    store.write("/c/A.dbc", "/r/A.dbc", "ftp", DownloadStatus.DOWNLOADING)
+    assert _rows(store)["/c/A.dbc"].sha256 is None
+    with store.batch():
+        store.write("/c/A.dbc", "/r/A.dbc", "ftp", DownloadStatus.DOWNLOADING)
+        store.write("/c/A.dbc", "/r/A.dbc", "ftp", COMPLETED, sha256="bb")
+    assert _rows(store)["/c/A.dbc"].sha256 == "bb"
+    store.close()
+
+
+def test_flush_failure_keeps_pending(tmp_path):
+    store = LocalStateStore(tmp_path / "state.db")
+    with patch.object(store, "_commit", side_effect=RuntimeError("disk")):
+        with pytest.raises(RuntimeError, match="disk"):
+            store.write("/c/A.dbc", "/r/A.dbc", "ftp", COMPLETED)
+    assert "/c/A.dbc" in store._pending
+    store.flush()
+    assert set(_rows(store)) == {"/c/A.dbc"}
+    store.close()
+
+
+def test_index_added_to_existing_table(tmp_path):
+    db = tmp_path / "state.db"
+    engine = create_engine(f"duckdb:///{db}", poolclass=NullPool)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE local_file_state (path VARCHAR PRIMARY KEY, "
+                "remote_path VARCHAR NOT NULL, client_name VARCHAR NOT NULL, "
+                "year INTEGER, month INTEGER, state VARCHAR, "
+                '"group" VARCHAR, status VARCHAR, sha256 VARCHAR, '
+                "last_synced TIMESTAMP)"
+            )
+        )
+    engine.dispose()
+
+    store = LocalStateStore(db)
+    with store.engine.connect() as conn:
+        indexes = conn.execute(
+            text("SELECT index_name FROM duckdb_indexes()")
+        ).scalars()
+        assert "ix_local_file_state_remote" in set(indexes)
+    store.close()
@@ -1,4 +1,11 @@
-from pysus.api.utils import add_dv, is_geocode_column
+import duckdb
+import pandas as pd
+from pysus.api.utils import (
+    add_dv,
+    add_dv_macro,
+    add_dv_series,
+    is_geocode_column,
+)
 
 
 def test_is_geocode_column_true():
@@ -50,3 +57,54 @@ def test_add_dv_5digit_returns_as_is():
 
 def test_add_dv_8digit_returns_as_is():
     assert add_dv("12345678") == "12345678"
+
+
+GEOCODES = [
+    "261160",
+    "530010",
+    "2611606",
+    "2201911",
+    "220191",
+    None,
+    "",
+    "abc",
+    "12345",
+    "12345678",
+    "26116a",
+]
+
+
+def test_add_dv_series_matches_add_dv():
+    codes = GEOCODES + [f"{n:06d}" for n in range(0, 999_999, 7_919)]
+    result = add_dv_series(pd.Series(codes, index=range(5, 5 + len(codes))))
+    assert [None if pd.isna(v) else v for v in result] == [
+        add_dv(c) for c in codes
+    ]
+    assert list(result.index) == list(range(5, 5 + len(codes)))
+
+
+def test_add_dv_series_numbers_and_categories():
+    assert add_dv_series(pd.Series([261160, 2611606])).tolist() == [
+        "2611606",
+        "2611606",
+    ]
+    result = add_dv_series(
+        pd.Series(["261160", "2611606", "220191"] * 2, dtype="category")
+    )
+    assert result.dtype == "category"
+    assert result.tolist() == ["2611606", "2611606", "2201919"] * 2
+
+
+def test_add_dv_series_arrow_strings():
+    result = add_dv_series(pd.Series(GEOCODES, dtype="string[pyarrow]"))
+    assert result.tolist()[:2] == ["2611606", "5300108"]
+
+
+def test_add_dv_macro_matches_add_dv():
+    con = duckdb.connect()
+    con.execute(add_dv_macro("dv"))
+    rows = con.execute(
+        "SELECT dv(code) FROM (SELECT unnest(?) AS code)", [GEOCODES]
+    ).fetchall()
+    assert [row[0] for row in rows] == [add_dv(c) for c in GEOCODES]
+    assert con.execute("SELECT dv(530010)").fetchone() == ("5300108",)
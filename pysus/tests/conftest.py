@@ -7,3 +7,14 @@ if "duckdb.functional" not in sys.modules:
     _mock = MagicMock()
     _mock.SPECIAL = "SPECIAL"
     sys.modules["duckdb.functional"] = _mock
+
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _sidecar_dir(tmp_path_factory, monkeypatch):
+    """Keep cached file metadata out of the user's CACHEPATH."""
+    monkeypatch.setattr(
+        "pysus.api.sidecar.SIDECAR_DIR", tmp_path_factory.mktemp("sidecar")
+    )
@@ -0,0 +1,114 @@
+import csv
+import io
+
+import pyarrow as pa
+import pytest
+from pysus.data.csv_reader import (
+    count_csv_records,
+    iter_csv_batches,
+    read_csv_header,
+    sniff_csv,
+)
+from pysus.data.sources import peekable
+
+
+def _csv_records(data: bytes) -> int:
+    lines = io.BytesIO(data)
+    return sum(1 for _ in csv.reader(line.decode("latin-1") for line in lines))
+
+
+CASES = [
+    b"",
+    b"a,b\n",
+    b"a,b\n1,2",
+    b"a,b\r\n1,2\r\n3,4\r\n",
+    b'a,b\n1,"x\ny"\n2,"say ""hi""\nthere"\n',
+    b'a,b\n"\n\n\n",1\n\n3,4\n',
+    b'a;b\n"\xe7\xe3o";"quoted, with sep"\n',
+]
+
+
+@pytest.mark.parametrize("data", CASES)
+@pytest.mark.parametrize("block_size", [1, 2, 3, 7, 1024])
+def test_count_csv_records_matches_csv_reader(tmp_path, data, block_size):
+    path = tmp_path / "data.csv"
+    path.write_bytes(data)
+    assert count_csv_records(path, block_size=block_size) == _csv_records(data)
+
+
+def test_count_csv_records_many_quotes(tmp_path):
+    # Many quoted line breaks, split across blocks
+    rows = [f'{i},"v{i}\nnext"' for i in range(500)]
+    data = ("id,text\n" + "\n".join(rows) + "\n").encode()
+    path = tmp_path / "data.csv"
+    path.write_bytes(data)
+    assert count_csv_records(path) == 501
+    assert count_csv_records(path, block_size=100) == 501
+
+
+def test_count_csv_records_quotechar(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_bytes(b"a,b\n'x\ny',1\n")
+    assert count_csv_records(path, quotechar="'") == 2
+    assert count_csv_records(path) == 3
+
+
+def test_iter_csv_batches_text_and_nulls(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_bytes(
+        'CO_MUN;NOME;VALOR\n001;"S\xe3o\nPaulo";1\n002;;NA\n'.encode("latin-1")
+    )
+    batches = list(iter_csv_batches(path, "iso-8859-1", ";"))
+    table = pa.Table.from_batches(batches)
+    assert table.schema == pa.schema(
+        [("CO_MUN", pa.string()), ("NOME", pa.string()), ("VALOR", pa.string())]
+    )
+    assert table.to_pydict() == {
+        "CO_MUN": ["001", "002"],
+        "NOME": ["S\xe3o\nPaulo", None],
+        "VALOR": ["1", None],
+    }
+
+
+def test_iter_csv_batches_types(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b,c\n1,2.5,x\n2,3.5,y\n")
+    table = pa.Table.from_batches(iter_csv_batches(path, typed=True))
+    assert table.schema.types == [pa.int64(), pa.float64(), pa.string()]
+
+    table = pa.Table.from_batches(
+        iter_csv_batches(path, column_types={"a": pa.int16()})
+    )
+    assert table.schema.types == [pa.int16(), pa.string(), pa.string()]
+
+
+def test_iter_csv_batches_batch_size_and_blocks(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("n\n" + "".join(f"{i}\n" for i in range(1000)))
+    batches = list(iter_csv_batches(path, batch_size=64, block_size=1024))
+    assert max(b.num_rows for b in batches) <= 64
+    values = pa.Table.from_batches(batches)["n"].to_pylist()
+    assert values == [str(i) for i in range(1000)]
+
+
+def test_iter_csv_batches_empty_and_bom(tmp_path):
+    empty = tmp_path / "empty.csv"
+    empty.write_bytes(b"")
+    assert list(iter_csv_batches(empty)) == []
+
+    bom = tmp_path / "bom.csv"
+    bom.write_bytes(b"\xef\xbb\xbfa,b\n1,2\n")
+    assert read_csv_header(bom) == ["a", "b"]
+    table = pa.Table.from_batches(iter_csv_batches(bom))
+    assert table.to_pydict() == {"a": ["1"], "b": ["2"]}
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "iso-8859-1"])
+def test_iter_csv_batches_stream(encoding):
+    raw = 'NOME;UF\n"S\xe3o\nPaulo";SP\nRio;RJ\n'.encode(encoding)
+    stream = peekable(io.BytesIO(raw))
+    assert sniff_csv(raw)[1] == ";"
+    assert read_csv_header(stream, encoding, ";") == ["NOME", "UF"]
+    table = pa.Table.from_batches(iter_csv_batches(stream, encoding, ";"))
+    assert table["NOME"].to_pylist() == ["S\xe3o\nPaulo", "Rio"]
+    assert not stream.closed
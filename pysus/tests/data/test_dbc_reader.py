@@ -0,0 +1,140 @@
+import struct
+from pathlib import Path
+
+import pyarrow as pa
+import pytest
+from pyreaddbc import dbc2dbf
+from pysus.data.dbc_reader import (
+    STREAMING_SUPPORTED,
+    iter_dbc_batches,
+    open_dbc,
+    read_dbc_schema,
+)
+from pysus.data.dbf_reader import DBFStreamReader, iter_dbf_batches
+
+from .test_dbf_reader import _create_dbf
+
+pytestmark = pytest.mark.skipif(
+    not STREAMING_SUPPORTED, reason="DBC streaming needs POSIX pipes"
+)
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _implode_literals(data: bytes) -> bytes:
+    """PKWare DCL stream with every byte stored as an uncoded literal."""
+    out = bytearray([0, 6])  # uncoded literals, 4 KiB dictionary
+    acc = nbits = 0
+
+    def put(value, count):
+        nonlocal acc, nbits
+        acc |= value << nbits
+        nbits += count
+        while nbits >= 8:
+            out.append(acc & 0xFF)
+            acc >>= 8
+            nbits -= 8
+
+    for byte in data:
+        put(0, 1)
+        put(byte, 8)
+    put(1, 1)  # length code 15 + 8 extra bits of ones = end of stream
+    put(0, 7)
+    put(0xFF, 8)
+    if nbits:
+        out.append(acc & 0xFF)
+    return bytes(out)
+
+
+def _create_dbc(path: Path, fields, records) -> Path:
+    dbf_path = path.with_suffix(".src.dbf")
+    _create_dbf(dbf_path, fields, records)
+    raw = dbf_path.read_bytes()
+    header_len = struct.unpack("<H", raw[8:10])[0]
+    path.write_bytes(
+        raw[:header_len] + b"\x00" * 4 + _implode_literals(raw[header_len:])
+    )
+    return path
+
+
+@pytest.fixture
+def tmp_dir(tmp_path):
+    return tmp_path
+
+
+@pytest.fixture
+def sample_dbc(tmp_dir):
+    return _create_dbc(
+        tmp_dir / "sample.dbc",
+        [("NAME", "C", 6, 0), ("AGE", "N", 3, 0)],
+        [(f"n{i}", i % 100) for i in range(2500)],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_helper_matches_pyreaddbc(sample_dbc, tmp_dir):
+    out = tmp_dir / "out.dbf"
+    dbc2dbf(str(sample_dbc), str(out))
+    assert out.read_bytes() == sample_dbc.with_suffix(".src.dbf").read_bytes()
+
+
+def test_read_dbc_schema(sample_dbc):
+    schema = read_dbc_schema(sample_dbc)
+    assert schema.num_records == 2500
+    assert schema.field_names == ["NAME", "AGE"]
+
+
+def test_iter_dbc_batches_matches_dbf(sample_dbc):
+    batches = list(iter_dbc_batches(sample_dbc, batch_size=1000, typed=True))
+    assert [b.num_rows for b in batches] == [1000, 1000, 500]
+    expected = iter_dbf_batches(
+        sample_dbc.with_suffix(".src.dbf"), batch_size=1000, typed=True
+    )
+    assert pa.Table.from_batches(batches).equals(
+        pa.Table.from_batches(list(expected))
+    )
+
+
+def test_iter_dbc_batches_columns(sample_dbc):
+    batches = list(iter_dbc_batches(sample_dbc, columns=["age"]))
+    assert batches[0].schema.names == ["AGE"]
+
+
+def test_iter_dbc_batches_early_close(sample_dbc):
+    batches = iter_dbc_batches(sample_dbc, batch_size=10)
+    assert next(batches).num_rows == 10
+    batches.close()
+
+
+def test_open_dbc_reports_truncated_stream(sample_dbc, tmp_dir):
+    raw = sample_dbc.read_bytes()
+    broken = tmp_dir / "broken.dbc"
+    broken.write_bytes(raw[: len(raw) // 2])
+    with pytest.raises(ValueError, match="Truncated.*broken.dbc"):
+        list(iter_dbc_batches(broken))
+
+
+def test_open_dbc_invalid_file(tmp_dir):
+    junk = tmp_dir / "junk.dbc"
+    junk.write_bytes(b"dummy")
+    with pytest.raises(ValueError, match="Not a valid dBASE"):
+        list(iter_dbc_batches(junk))
+
+
+def test_open_dbc_missing_file(tmp_dir):
+    with pytest.raises(FileNotFoundError):
+        with open_dbc(tmp_dir / "missing.dbc"):
+            pass
+
+
+def test_stream_reader_header(sample_dbc):
+    with open_dbc(sample_dbc) as stream:
+        reader = DBFStreamReader(stream)
+        assert reader.schema.num_records == 2500
+        assert sum(b.num_rows for b in reader.iter_batches()) == 2500
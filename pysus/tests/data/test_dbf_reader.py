@@ -1,11 +1,19 @@
+import mmap
 import struct
 from datetime import date
 from pathlib import Path
+from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 from pysus.data.dbf_reader import (
+    DBFReader,
+    DBFStreamReader,
+    _decode_column,
     _parse_header,
+    iter_dbf_batches,
     read_dbf_fast,
     read_dbf_filtered,
     read_dbf_schema,
@@ -220,6 +228,133 @@ def test_read_fast_strips_nul_bytes(tmp_dir):
     assert df["VAL"].iloc[0] == "abcd"
 
 
+def test_read_fast_pyarrow_backend(simple_dbf):
+    df = read_dbf_fast(simple_dbf, dtype_backend="pyarrow")
+    assert df["NAME"].dtype == pd.StringDtype("pyarrow")
+    pd.testing.assert_frame_equal(df.astype(object), read_dbf_fast(simple_dbf))
+
+
+def test_read_fast_strips_leading_nul_and_whitespace(tmp_dir):
+    dbf_path = tmp_dir / "lead.dbf"
+    _create_dbf(dbf_path, [("VAL", "C", 8, 0)], [("x",)])
+    raw = bytearray(dbf_path.read_bytes())
+    raw[-8:] = b"\x00 \tab \x00 "
+    dbf_path.write_bytes(bytes(raw))
+
+    df = read_dbf_fast(dbf_path)
+    assert df["VAL"].iloc[0] == "ab"
+
+
+# ---------------------------------------------------------------------------
+# Typed decoding
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def typed_dbf(tmp_dir):
+    dbf_path = tmp_dir / "typed.dbf"
+    _create_dbf(
+        dbf_path,
+        [
+            ("NAME", "C", 6, 0),
+            ("AGE", "N", 3, 0),
+            ("VAL", "N", 8, 2),
+            ("RATE", "F", 6, 0),
+            ("DT", "D", 8, 0),
+            ("OK", "L", 1, 0),
+        ],
+        [
+            ("Ana", " 30", " 1234.50", "1e-3", "20240131", "T"),
+            ("Bia", "", "", "", "", "?"),
+            ("Caio", "-7", "abc", "-.5", "20241399", "n"),
+        ],
+    )
+    return dbf_path
+
+
+def test_read_fast_typed(typed_dbf):
+    df = read_dbf_fast(typed_dbf, typed=True)
+    assert df["NAME"].dtype == object
+    assert df["AGE"].dtype == pd.Int64Dtype()
+    assert df["VAL"].dtype == pd.Float64Dtype()
+    assert df["OK"].dtype == pd.BooleanDtype()
+    assert df["AGE"].tolist() == [30, pd.NA, -7]
+    assert df["VAL"].tolist() == [1234.5, pd.NA, pd.NA]
+    assert df["RATE"].tolist() == [0.001, pd.NA, -0.5]
+    assert df["DT"].tolist() == [date(2024, 1, 31), None, None]
+    assert df["OK"].tolist() == [True, pd.NA, False]
+
+
+def test_read_fast_typed_pyarrow_backend(typed_dbf):
+    df = read_dbf_fast(typed_dbf, dtype_backend="pyarrow", typed=True)
+    assert str(df["AGE"].dtype) == "int64[pyarrow]"
+    assert str(df["DT"].dtype) == "date32[day][pyarrow]"
+    assert df["NAME"].dtype == pd.StringDtype("pyarrow")
+
+
+def test_read_fast_untyped_by_default(typed_dbf):
+    df = read_dbf_fast(typed_dbf)
+    assert df["AGE"].tolist() == ["30", "", "-7"]
+
+
+def test_stream_fast_typed_matches_read_fast(typed_dbf):
+    chunks = list(stream_dbf_fast(typed_dbf, chunk_size=2, typed=True))
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks, ignore_index=True),
+        read_dbf_fast(typed_dbf, typed=True),
+    )
+
+
+def test_read_filtered_typed(typed_dbf):
+    df = read_dbf_filtered(
+        typed_dbf, filters=[("DT", ">=", "20240101")], typed=True
+    )
+    assert df["AGE"].tolist() == [30, -7]
+
+
+def test_schema_arrow_types(typed_dbf):
+    schema = read_dbf_schema(typed_dbf)
+    assert [f.decimal for f in schema.fields] == [0, 0, 2, 0, 0, 0]
+    assert [str(t) for t in schema.arrow_schema(typed=True).types] == [
+        "string",
+        "int64",
+        "double",
+        "double",
+        "date32[day]",
+        "bool",
+    ]
+    assert set(schema.arrow_schema().types) == {pa.string()}
+
+
+# ---------------------------------------------------------------------------
+# _decode_column
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("encoding", ["latin-1", "cp1252", "utf-8"])
+def test_decode_column_matches_per_cell_decode(encoding):
+    rng = np.random.default_rng(0)
+    pool = np.array(
+        [0, 0, 9, 32, 32, 65, 66, 0x81, 0x85, 0xA0, 0xC3, 0xA9, 0xE3],
+        dtype=np.uint8,
+    )
+    raw = rng.choice(pool, size=(2000, 7)).astype(np.uint8)
+    col = np.frombuffer(raw.tobytes(), dtype="S7")
+
+    expected = [
+        bytes(row)
+        .decode(encoding, errors="replace")
+        .replace("\x00", "")
+        .strip()
+        for row in raw
+    ]
+    assert _decode_column(col, encoding).to_pylist() == expected
+
+
+def test_decode_column_empty():
+    assert len(_decode_column(np.array([], dtype="S3"), "latin-1")) == 0
+
+
 # ---------------------------------------------------------------------------
 # read_dbf_filtered
 # ---------------------------------------------------------------------------
@@ -291,6 +426,77 @@ def test_read_filtered_empty_file(empty_dbf):
     assert len(df) == 0
 
 
+@pytest.fixture
+def notific_dbf(tmp_dir):
+    dbf_path = tmp_dir / "notific.dbf"
+    _create_dbf(
+        dbf_path,
+        [("ID_MUNICIP", "C", 6, 0), ("DT_NOTIFIC", "D", 8, 0)],
+        [
+            ("330455", "20200115"),
+            ("355030", "20201231"),
+            ("330455", "20210301"),
+            ("310620", ""),
+            ("355030", "20190704"),
+        ],
+    )
+    return dbf_path
+
+
+def test_read_filtered_filters_in_and_between(notific_dbf):
+    df = read_dbf_filtered(
+        notific_dbf,
+        filters=[
+            ("ID_MUNICIP", "in", ["330455", "355030"]),
+            ("DT_NOTIFIC", "between", ("20200101", "20201231")),
+        ],
+    )
+    assert list(df["DT_NOTIFIC"]) == ["20200115", "20201231"]
+
+
+def test_read_filtered_filters_range_skips_blank(notific_dbf):
+    df = read_dbf_filtered(
+        notific_dbf, filters=[("DT_NOTIFIC", "<", "20200601")]
+    )
+    assert list(df["DT_NOTIFIC"]) == ["20200115", "20190704"]
+
+
+def test_read_filtered_filters_or(notific_dbf):
+    df = read_dbf_filtered(
+        notific_dbf,
+        filters=[
+            [("ID_MUNICIP", "prefix", "31")],
+            [("DT_NOTIFIC", ">=", "20210101")],
+        ],
+    )
+    assert list(df["ID_MUNICIP"]) == ["330455", "310620"]
+
+
+def test_read_filtered_filters_and_legacy_column(notific_dbf):
+    df = read_dbf_filtered(
+        notific_dbf,
+        column="ID_MUNICIP",
+        values=["355030"],
+        filters=[("DT_NOTIFIC", "==", "20190704")],
+    )
+    assert len(df) == 1
+
+
+def test_read_filtered_filters_unknown_op(notific_dbf):
+    with pytest.raises(ValueError, match="Unsupported filter operator"):
+        read_dbf_filtered(notific_dbf, filters=[("ID_MUNICIP", "~", "3")])
+
+
+def test_read_filtered_requires_predicate(notific_dbf):
+    with pytest.raises(ValueError, match="column/values or filters"):
+        read_dbf_filtered(notific_dbf)
+
+
+def test_read_filtered_filters_missing_column(notific_dbf):
+    with pytest.raises(KeyError, match="not found"):
+        read_dbf_filtered(notific_dbf, filters=[("NOPE", "==", "1")])
+
+
 # ---------------------------------------------------------------------------
 # stream_dbf_fast
 # ---------------------------------------------------------------------------
@@ -343,6 +549,65 @@ def test_stream_fast_wide(wide_dbf):
     assert total == 100
 
 
+def test_stream_fast_pyarrow_backend(simple_dbf):
+    chunks = list(
+        stream_dbf_fast(simple_dbf, chunk_size=2, dtype_backend="pyarrow")
+    )
+    assert all(c["CITY"].dtype == pd.StringDtype("pyarrow") for c in chunks)
+    assert list(pd.concat(chunks)["CITY"]) == ["Sao Paulo", "Rio", "Brasilia"]
+
+
+def test_stream_fast_memory_map_matches_file_reads(wide_dbf):
+    mapped = pd.concat(stream_dbf_fast(wide_dbf, chunk_size=7))
+    read = pd.concat(stream_dbf_fast(wide_dbf, chunk_size=7, memory_map=False))
+    pd.testing.assert_frame_equal(mapped, read)
+
+
+def test_stream_fast_early_close_releases_map(wide_dbf):
+    gen = stream_dbf_fast(wide_dbf, chunk_size=10)
+    first = next(gen)
+    gen.close()
+    assert len(first) == 10
+
+
+def _rss_file() -> int | None:
+    """Resident bytes of file mappings, which tracemalloc doesn't see."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("RssFile:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+@pytest.mark.skipif(
+    _rss_file() is None or not hasattr(mmap, "MADV_DONTNEED"),
+    reason="needs /proc/self/status and madvise(MADV_DONTNEED)",
+)
+def test_stream_fast_memory_bounded_by_chunk(tmp_dir):
+    dbf_path = tmp_dir / "big.dbf"
+    _create_dbf(
+        dbf_path,
+        [("TEXT", "C", 200, 0)],
+        [(f"row{i}",) for i in range(100_000)],
+    )
+    file_size = dbf_path.stat().st_size
+
+    def peak_mapped() -> int:
+        baseline = _rss_file()
+        peak = 0
+        for _ in stream_dbf_fast(dbf_path, chunk_size=2_000):
+            peak = max(peak, _rss_file() - baseline)
+        return peak
+
+    assert peak_mapped() < file_size / 2
+    # without releasing the read chunks, the whole file stays resident
+    with patch("pysus.data.dbf_reader._drop_pages"):
+        assert peak_mapped() > file_size * 0.9
+
+
 def test_stream_fast_output_matches_read_fast(simple_dbf):
     df_full = read_dbf_fast(simple_dbf)
     chunks = list(stream_dbf_fast(simple_dbf, chunk_size=2))
@@ -350,6 +615,249 @@ def test_stream_fast_output_matches_read_fast(simple_dbf):
     pd.testing.assert_frame_equal(df_full, df_streamed)
 
 
+# ---------------------------------------------------------------------------
+# iter_dbf_batches
+# ---------------------------------------------------------------------------
+
+
+def test_iter_batches_matches_read_fast(simple_dbf):
+    batches = list(iter_dbf_batches(simple_dbf, batch_size=2))
+    assert [b.num_rows for b in batches] == [2, 1]
+    table = pa.Table.from_batches(batches)
+    assert table.schema == read_dbf_schema(simple_dbf).arrow_schema()
+    pd.testing.assert_frame_equal(table.to_pandas(), read_dbf_fast(simple_dbf))
+
+
+def test_iter_batches_columns_and_typed(typed_dbf):
+    batches = list(
+        iter_dbf_batches(typed_dbf, columns=["age", "dt"], typed=True)
+    )
+    schema = read_dbf_schema(typed_dbf).arrow_schema(True, ["AGE", "DT"])
+    assert batches[0].schema == schema
+    assert batches[0].column(0).to_pylist() == [30, None, -7]
+
+
+def test_iter_batches_skips_deleted_and_empty_chunks(tmp_dir):
+    dbf_path = tmp_dir / "deleted.dbf"
+    _create_dbf(dbf_path, [("X", "C", 3, 0)], [("a",), ("b",), ("c",)])
+    raw = bytearray(dbf_path.read_bytes())
+    header_len = read_dbf_schema(dbf_path).header_len
+    raw[header_len] = raw[header_len + 4] = ord("*")
+    dbf_path.write_bytes(bytes(raw))
+
+    batches = list(iter_dbf_batches(dbf_path, batch_size=2))
+    assert [b.column(0).to_pylist() for b in batches] == [["c"]]
+
+
+def test_iter_batches_empty(empty_dbf):
+    assert list(iter_dbf_batches(empty_dbf)) == []
+
+
+# ---------------------------------------------------------------------------
+# Parallel decoding
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def deleted_wide_dbf(wide_dbf):
+    schema = read_dbf_schema(wide_dbf)
+    raw = bytearray(wide_dbf.read_bytes())
+    for i in (0, 17, 18, 99):
+        raw[schema.header_len + i * schema.record_len] = ord("*")
+    wide_dbf.write_bytes(bytes(raw))
+    return wide_dbf
+
+
+@pytest.mark.parametrize("workers", [2, 3, 8, None])
+def test_read_fast_workers_matches_serial(deleted_wide_dbf, workers):
+    expected = read_dbf_fast(deleted_wide_dbf)
+    df = read_dbf_fast(deleted_wide_dbf, workers=workers)
+    assert len(df) == 96
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_read_fast_workers_typed_columns(typed_dbf):
+    pd.testing.assert_frame_equal(
+        read_dbf_fast(typed_dbf, columns=["age", "ok"], typed=True, workers=2),
+        read_dbf_fast(typed_dbf, columns=["age", "ok"], typed=True),
+    )
+
+
+def test_iter_batches_workers_in_order(deleted_wide_dbf):
+    serial = list(iter_dbf_batches(deleted_wide_dbf, batch_size=7))
+    parallel = list(iter_dbf_batches(deleted_wide_dbf, batch_size=7, workers=4))
+    assert [b.num_rows for b in parallel] == [b.num_rows for b in serial]
+    assert pa.Table.from_batches(parallel).equals(pa.Table.from_batches(serial))
+
+
+def test_iter_batches_workers_early_close(wide_dbf):
+    batches = iter_dbf_batches(wide_dbf, batch_size=5, workers=3)
+    assert next(batches).num_rows == 5
+    batches.close()
+
+
+def test_read_fast_invalid_workers(simple_dbf):
+    with pytest.raises(ValueError, match="workers"):
+        read_dbf_fast(simple_dbf, workers=0)
+
+
+# ---------------------------------------------------------------------------
+# Dictionary encoding
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def coded_dbf(tmp_dir):
+    """Low-cardinality UF/SEXO codes next to a unique ID and a number."""
+    path = tmp_dir / "coded.dbf"
+    _create_dbf(
+        path,
+        [
+            ("ID", "C", 6, 0),
+            ("UF", "C", 2, 0),
+            ("SEXO", "C", 1, 0),
+            ("IDADE", "N", 3, 0),
+        ],
+        [
+            (f"{i:06d}", ["SP", "RJ", "MG"][i % 3], "MF"[i % 2], i % 20)
+            for i in range(300)
+        ],
+    )
+    return path
+
+
+def test_dictionary_detects_low_cardinality_text(coded_dbf):
+    with DBFReader(coded_dbf) as reader:
+        assert reader.dictionary_fields() == {"UF", "SEXO", "IDADE"}
+        assert reader.dictionary_fields(typed=True) == {"UF", "SEXO"}
+        assert reader.dictionary_fields(["uf", "id"]) == {"UF"}
+        assert reader.dictionary_fields(dictionary=["sexo"]) == {"SEXO"}
+        assert reader.dictionary_fields(dictionary=False) == frozenset()
+
+
+def test_dictionary_ignores_small_samples(simple_dbf):
+    with DBFReader(simple_dbf) as reader:
+        assert reader.dictionary_fields() == frozenset()
+
+
+def test_dictionary_ignores_empty_files(tmp_dir):
+    path = tmp_dir / "empty.dbf"
+    _create_dbf(path, [("UF", "C", 2, 0), ("SEXO", "C", 1, 0)], [])
+    with DBFReader(path) as reader:
+        assert reader.dictionary_fields() == frozenset()
+
+
+def test_iter_batches_dictionary(coded_dbf):
+    batches = list(
+        iter_dbf_batches(coded_dbf, batch_size=100, typed=True, dictionary=True)
+    )
+    schema = read_dbf_schema(coded_dbf).arrow_schema(
+        typed=True, dictionary={"UF", "SEXO"}
+    )
+    assert schema.field("UF").type == pa.dictionary(pa.int32(), pa.string())
+    assert all(b.schema == schema for b in batches)
+    plain = pa.Table.from_batches(
+        list(iter_dbf_batches(coded_dbf, batch_size=100, typed=True))
+    )
+    decoded = pa.Table.from_batches(batches).cast(plain.schema)
+    assert decoded.equals(plain)
+
+
+@pytest.mark.parametrize("dtype_backend", ["numpy", "pyarrow"])
+def test_read_fast_dictionary_categories(coded_dbf, dtype_backend):
+    df = read_dbf_fast(
+        coded_dbf, dtype_backend=dtype_backend, dictionary=["UF"]
+    )
+    assert isinstance(df["UF"].dtype, pd.CategoricalDtype)
+    assert sorted(df["UF"].cat.categories) == ["MG", "RJ", "SP"]
+    assert df["SEXO"].dtype != "category"
+    expected = read_dbf_fast(coded_dbf, dtype_backend=dtype_backend)
+    assert df["UF"].astype(object).tolist() == expected["UF"].tolist()
+
+
+def test_read_fast_dictionary_workers(coded_dbf):
+    serial = read_dbf_fast(coded_dbf, dictionary=True)
+    parallel = read_dbf_fast(coded_dbf, dictionary=True, workers=4)
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_stream_fast_dictionary_same_columns_per_chunk(coded_dbf):
+    chunks = list(stream_dbf_fast(coded_dbf, chunk_size=7, dictionary=True))
+    assert all(c["UF"].dtype == "category" for c in chunks)
+    assert all(c["ID"].dtype == object for c in chunks)
+
+
+def test_read_filtered_dictionary(coded_dbf):
+    df = read_dbf_filtered(
+        coded_dbf, filters=[("SEXO", "==", "M")], dictionary=["SEXO"]
+    )
+    assert df["SEXO"].dtype == "category"
+    assert set(df["SEXO"]) == {"M"}
+
+
+def test_stream_reader_dictionary_from_first_batch(coded_dbf):
+    with open(coded_dbf, "rb") as fh:
+        batches = list(
+            DBFStreamReader(fh).iter_batches(batch_size=50, dictionary=True)
+        )
+    assert pa.types.is_dictionary(batches[0].schema.field("UF").type)
+    assert all(b.schema == batches[0].schema for b in batches)
+
+
+# ---------------------------------------------------------------------------
+# DBFReader
+# ---------------------------------------------------------------------------
+
+
+def test_reader_reuses_schema_and_map(simple_dbf):
+    with DBFReader(simple_dbf) as reader:
+        assert reader.schema.field_names == ["NAME", "AGE", "CITY"]
+        assert reader.dtype == reader.schema.build_dtype()
+        assert len(reader.records) == 3
+        pd.testing.assert_frame_equal(reader.read(), read_dbf_fast(simple_dbf))
+        streamed = pd.concat(reader.stream(chunk_size=2), ignore_index=True)
+        pd.testing.assert_frame_equal(streamed, reader.read())
+        assert reader.read_filtered("NAME", ["Bob"])["AGE"].tolist() == ["25"]
+    assert reader._mm is None
+    assert len(reader.read(columns=["name"])) == 3  # re-maps after close
+    reader.close()
+
+
+def test_reader_concurrent_encodings(tmp_dir):
+    from concurrent.futures import ThreadPoolExecutor
+
+    paths = []
+    for i in range(8):
+        dbf_path = tmp_dir / f"enc{i}.dbf"
+        _create_dbf(dbf_path, [("TEXT", "C", 4, 0)], [("ab",)] * 500)
+        raw = bytearray(dbf_path.read_bytes())
+        raw[-4 * 500 - 500 :] = b" \xc3\xa9  " * 500  # "é" in UTF-8
+        dbf_path.write_bytes(bytes(raw))
+        paths.append((dbf_path, "utf-8" if i % 2 else "latin-1"))
+
+    expected = {"utf-8": "\u00e9", "latin-1": "\u00c3\u00a9"}
+
+    def convert(args):
+        path, encoding = args
+        with DBFReader(path, encoding) as reader:
+            return encoding, set(reader.read()["TEXT"])
+
+    with ThreadPoolExecutor(8) as pool:
+        for encoding, values in pool.map(convert, paths * 4):
+            assert values == {expected[encoding]}
+
+
+def test_reader_shared_between_threads(wide_dbf):
+    from concurrent.futures import ThreadPoolExecutor
+
+    with DBFReader(wide_dbf) as reader:
+        expected = reader.read()
+        with ThreadPoolExecutor(4) as pool:
+            frames = list(pool.map(lambda _: reader.read(), range(16)))
+    for frame in frames:
+        pd.testing.assert_frame_equal(frame, expected)
+
+
 # ---------------------------------------------------------------------------
 # Edge cases
 # ---------------------------------------------------------------------------
@@ -0,0 +1,180 @@
+import codecs
+import io
+import json
+from functools import partial
+
+import pyarrow as pa
+import pyarrow.json as pajson
+import pytest
+from pysus.data.json_reader import (
+    count_json_records,
+    count_jsonl_records,
+    iter_json_array_blocks,
+    iter_json_batches,
+    iter_json_records,
+    iter_json_text_batches,
+    iter_jsonl_batches,
+    iter_jsonl_records,
+)
+from pysus.data.sources import peekable
+
+RECORDS = [
+    {"id": i, "name": "São\nPaulo" if i % 3 else None, "tags": [i]}
+    for i in range(200)
+]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("", 0),
+        ('{"a":1}', 1),
+        ('{"a":1}\n{"a":2}\n', 2),
+        ('\n{"a":1}\n\n  \n{"a":2}\r\n\n', 2),
+        ('  {"a":1}\n\t{"a":2}', 2),
+    ],
+)
+@pytest.mark.parametrize("block_size", [1, 5, 1024])
+def test_count_jsonl_records(tmp_path, text, expected, block_size):
+    path = tmp_path / "data.jsonl"
+    path.write_text(text)
+    assert count_jsonl_records(path, block_size=block_size) == expected
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("block_size", [3, 64, 1024**2])
+def test_iter_json_records_array(tmp_path, indent, block_size):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(RECORDS, indent=indent, ensure_ascii=False))
+    assert list(iter_json_records(path, block_size)) == RECORDS
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("[1, 22, 333]", [1, 22, 333]),
+        (" [ ] ", []),
+        ('{"a": 1}', [{"a": 1}]),
+        ("", []),
+    ],
+)
+def test_iter_json_records_documents(tmp_path, text, expected):
+    path = tmp_path / "data.json"
+    path.write_text(text)
+    assert list(iter_json_records(path, block_size=2)) == expected
+
+
+@pytest.mark.parametrize("text", ["[1, 2", "[1 2]", "[{]"])
+def test_iter_json_records_invalid(tmp_path, text):
+    path = tmp_path / "data.json"
+    path.write_text(text)
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_records(path, block_size=2))
+
+
+TRICKY = [
+    {"s": 'quote " and [brackets], {braces}', "n": [[1], {"a": [2]}]},
+    {"s": "backslash \\", "t": '\\\\"', "u": "\\\\\\"},
+    {"s": "line\nbreak\r\n, comma", "e": {}, "l": []},
+    {"s": "\u00e7\u00e3o", "n": None},
+]
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("block_size", [1, 3, 7, 1024])
+def test_iter_json_array_blocks_escapes(tmp_path, indent, block_size):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(TRICKY * 3, indent=indent))
+    blocks = list(iter_json_array_blocks(path, block_size))
+    lines = [line for b in blocks for line in b.split(b"\n") if line.strip()]
+    assert [json.loads(line) for line in lines] == TRICKY * 3
+    assert count_json_records(path, block_size) == 12
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [("", 0), ("[]", 0), (" [\n] \n", 0), ('{"a": [1, 2]}', 1), ("[1,2]", 2)],
+)
+def test_count_json_records(tmp_path, text, expected):
+    path = tmp_path / "data.json"
+    path.write_bytes(codecs.BOM_UTF8 + text.encode())
+    assert count_json_records(path, block_size=2) == expected
+
+
+def test_iter_json_array_blocks_parse_as_jsonl(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(RECORDS, indent=2))
+    blocks = list(iter_json_array_blocks(path, block_size=1024))
+    assert len(blocks) > 1
+    table = pa.Table.from_batches(iter_json_batches(blocks, batch_size=50))
+    assert table.to_pylist() == RECORDS
+    assert table.schema.field("name").type == pa.string()
+
+
+def test_iter_jsonl_batches(tmp_path):
+    path = tmp_path / "data.jsonl"
+    lines = [json.dumps(r, ensure_ascii=False) for r in RECORDS]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    batches = list(iter_jsonl_batches(path, batch_size=30, block_size=2048))
+    assert max(b.num_rows for b in batches) == 30
+    assert pa.Table.from_batches(batches).to_pylist() == RECORDS
+    assert list(iter_jsonl_records(path)) == RECORDS
+
+
+def test_iter_jsonl_batches_without_open_json(tmp_path, monkeypatch):
+    # pyarrow < 19 parses line-aligned blocks one at a time
+    monkeypatch.delattr(pajson, "open_json", raising=False)
+    path = tmp_path / "data.jsonl"
+    path.write_text("\n".join(json.dumps(r) for r in RECORDS))
+    batches = list(iter_jsonl_batches(path, block_size=512))
+    assert len(batches) > 1
+    assert pa.Table.from_batches(batches).to_pylist() == RECORDS
+
+
+def test_iter_jsonl_batches_schema_and_empty(tmp_path):
+    path = tmp_path / "data.jsonl"
+    path.write_text("")
+    assert list(iter_jsonl_batches(path)) == []
+
+    path.write_text('{"a": null}\n{"a": "x"}\n')
+    (batch,) = iter_jsonl_batches(path)
+    assert batch.schema == pa.schema([("a", pa.string())])
+
+    path.write_text('{"a": 1}\n{"a": "x"}\n')
+    schema = pa.schema([("a", pa.int64())])
+    with pytest.raises(pa.ArrowInvalid):
+        list(iter_jsonl_batches(path, schema=schema))
+
+
+def test_iter_json_text_batches(tmp_path):
+    path = tmp_path / "data.jsonl"
+    path.write_text(
+        '{"a": 1, "b": "x"}\n{"a": "y", "c": {"d": true}}\n{"b": null}\n'
+    )
+    records = partial(iter_jsonl_records, path)
+    batches = list(iter_json_text_batches(records, batch_size=2))
+    assert [b.num_rows for b in batches] == [2, 1]
+    assert pa.Table.from_batches(batches).to_pydict() == {
+        "a": ["1", "y", None],
+        "b": ["x", None, None],
+        "c": [None, '{"d": true}', None],
+    }
+
+    path.write_text("1\n2\n")
+    with pytest.raises(ValueError, match="JSON objects"):
+        list(iter_json_text_batches(records))
+
+
+def test_batches_from_streams():
+    lines = "".join(json.dumps(r) + "\n" for r in RECORDS).encode()
+    stream = peekable(io.BytesIO(lines))
+    batches = iter_jsonl_batches(stream, batch_size=64, block_size=1024)
+    assert pa.Table.from_batches(batches).to_pylist() == RECORDS
+
+    array = codecs.BOM_UTF8 + json.dumps(RECORDS, indent=2).encode()
+    stream = peekable(io.BytesIO(array))
+    blocks = iter_json_array_blocks(stream, block_size=1024)
+    assert pa.Table.from_batches(iter_json_batches(blocks)).to_pylist() == (
+        RECORDS
+    )
+    assert not stream.closed
@@ -248,6 +248,59 @@ class TestConvertAndUpload:
                 await engine._convert_and_upload(fake, raw)
 
 
+class TestConversionPool:
+    @pytest.mark.asyncio
+    async def test_to_parquet_uses_engine_pool(self, tmp_path):
+        from pysus.api.conversion import ConversionPool
+
+        pool = ConversionPool(workers=1)
+        pool.convert = AsyncMock(return_value="parquet")
+        engine = SyncEngine(conversion_pool=pool)
+        local_file = MagicMock(path=tmp_path / "X.dbc")
+        local_file.to_parquet = AsyncMock()
+
+        assert await engine._to_parquet(local_file) == "parquet"
+        pool.convert.assert_awaited_once_with(tmp_path / "X.dbc")
+        local_file.to_parquet.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_to_parquet_pool_reports_progress(self, tmp_path):
+        from pysus.api.conversion import ConversionPool
+
+        pool = ConversionPool(workers=1)
+        calls = []
+
+        async def convert(path):
+            calls.append("convert")
+            return "parquet"
+
+        pool.convert = convert
+        engine = SyncEngine(conversion_pool=pool)
+        local_file = MagicMock(path=tmp_path / "X.dbc")
+
+        result = await engine._to_parquet(
+            local_file, callback=lambda done, total: calls.append((done, total))
+        )
+        assert result == "parquet"
+        assert calls == [(0, 1), "convert", (1, 1)]
+
+    @pytest.mark.asyncio
+    async def test_to_parquet_shares_client_pool(self):
+        from pysus.api.conversion import ConversionPool
+
+        pool = ConversionPool(workers=1)
+        engine = SyncEngine(pysus=MagicMock(conversion_pool=pool))
+        assert engine._pool() is pool
+
+    @pytest.mark.asyncio
+    async def test_to_parquet_in_process_without_pool(self, engine):
+        local_file = MagicMock()
+        local_file.to_parquet = AsyncMock(return_value="parquet")
+        assert engine._pool() is None
+        assert await engine._to_parquet(local_file) == "parquet"
+        local_file.to_parquet.assert_awaited_once_with(callback=None)
+
+
 class TestCatalogRows:
     def test_catalog_rows(self, engine):
         writer = MagicMock()
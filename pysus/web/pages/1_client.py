@@ -6,7 +6,7 @@ import pandas as pd
 import streamlit as st
 from humanize import naturalsize
 from pysus import CACHEPATH
-from pysus.api.client import PySUS
+from pysus.api.client import DownloadProgress, PySUS
 from pysus.api.models import BaseRemoteFile
 from pysus.web.translations import t
 
@@ -916,29 +916,39 @@ def _download_selected(
     total = len(files)
     progress = st.progress(0, text=t("download_start", _lang()))
     failed: set[str] = set()
+    current = ""
+
+    def _report(state: DownloadProgress) -> None:
+        done = (
+            state.bytes_done / state.bytes_total
+            if state.bytes_total
+            else state.files_done / total
+        )
+        progress.progress(
+            min(done, 1.0),
+            text=t(
+                "downloading",
+                _lang(),
+                name=current,
+                i=str(state.files_done),
+                total=str(total),
+            ),
+        )
 
     async def _download():
-        for i, f in enumerate(files):
-            progress.progress(
-                (i + 1) / total,
-                text=t(
-                    "downloading",
-                    _lang(),
-                    name=f.basename,
-                    i=str(i + 1),
-                    total=str(total),
-                ),
-            )
-            try:
-                await pysus.download(file=f)
-            except Exception as exc:  # noqa: B902
+        nonlocal current
+        async for f, result in pysus.download_many(
+            files, callback=_report, return_exceptions=True
+        ):
+            current = f.basename
+            if isinstance(result, Exception):
                 failed.add(f.basename)
                 st.error(
                     t(
                         "download_failed",
                         _lang(),
                         name=f.basename,
-                        error=str(exc),
+                        error=str(result),
                     )
                 )
 